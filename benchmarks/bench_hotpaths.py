@@ -0,0 +1,180 @@
+"""
+Hot-path timings at several input sizes.
+
+Each case builds synthetic input of a given size once, then times one
+call over all of it. Transliterations are sampled from the shipped
+Pyramid Text lines and the TLA corpus is replaced by rows from
+write_synthetic_tla, so this runs from a wheel install.
+
+Run: python -m benchmarks.bench_hotpaths
+"""
+
+import tempfile
+from pathlib import Path
+
+from eye_of_horus import corpus as corpus_module
+from eye_of_horus.bitwise import DIRECTION_BOTH, decode_layered, encode_phonemes
+from eye_of_horus.corpus import (
+    Sentence,
+    get_edge_signature,
+    load_semantic_network,
+    load_tla_corpus,
+    search_corpus,
+)
+from eye_of_horus.mapping import leiden_to_wheel, phonemes_to_verbs
+from eye_of_horus.pyramid import build_paragraph, translate
+from eye_of_horus.rhythm import analyze_line_rhythm
+from eye_of_horus.synthetic import write_synthetic_tla
+from eye_of_horus.validation import find_markers
+
+from .bench_layered import string_engine_layered
+from .common import (
+    best_of,
+    installed_corpus,
+    preserved_corpus,
+    synthetic_tla_rows,
+    synthetic_translits,
+    uncached_translations,
+)
+
+SIZES = [100, 1_000, 10_000]
+
+
+def _phonemes(n: int) -> list:
+    """About n phonemes, as whole sentences."""
+    phonemes = []
+    for translit in synthetic_translits(max(1, n // 8)):
+        phonemes.extend(leiden_to_wheel(translit))
+        if len(phonemes) >= n:
+            break
+    return phonemes[:n]
+
+
+# Each setup(n) returns (call, items); call() is what gets timed and
+# items is how many units it processes.
+
+def setup_leiden_to_wheel(n):
+    translits = synthetic_translits(n)
+    return lambda: [leiden_to_wheel(t) for t in translits], n
+
+
+def setup_encode_phonemes(n):
+    phonemes = _phonemes(n)
+    return lambda: encode_phonemes(phonemes), len(phonemes)
+
+
+def setup_decode_layered_string(n):
+    phonemes = _phonemes(n)
+    reverse = phonemes[::-1]
+    return lambda: (string_engine_layered(phonemes), string_engine_layered(reverse)), 2 * len(phonemes)
+
+
+def setup_decode_layered_bitwise(n):
+    ids = encode_phonemes(_phonemes(n))
+    return lambda: decode_layered(ids, DIRECTION_BOTH), 2 * len(ids)
+
+
+def setup_translate(n):
+    translits = synthetic_translits(n)
+    
+    def call():
+        with uncached_translations():
+            return [translate(t) for t in translits]
+    
+    return call, n
+
+
+def setup_build_paragraph(n):
+    verbs = phonemes_to_verbs(_phonemes(n))
+    return lambda: build_paragraph(verbs, "ascend"), len(verbs)
+
+
+def setup_load_tla_corpus(n):
+    path = Path(tempfile.gettempdir()) / f'eye_of_horus_bench_tla_{n}.json'
+    write_synthetic_tla(path, n)
+    
+    def call():
+        with preserved_corpus():
+            corpus_module._corpus = None
+            return load_tla_corpus(str(path))
+    
+    return call, n
+
+
+def setup_search_corpus(n):
+    rows = synthetic_tla_rows(n)
+    sentences = [
+        Sentence(
+            hieroglyphs='', transliteration=row['transliteration'], lemmatization='',
+            upos='', glossing='', translation=row['translation'],
+            date_not_before=int(row['dateNotBefore']), date_not_after=int(row['dateNotAfter']),
+        )
+        for row in rows
+    ]
+    
+    def call():
+        # A query that never matches scans the whole corpus
+        with installed_corpus(sentences):
+            return list(search_corpus(query='no such text', limit=n))
+    
+    return call, n
+
+
+def setup_get_edge_signature(n):
+    edges = [(e['source'], e['target']) for e in load_semantic_network()['edges']]
+    pairs = [edges[i % len(edges)] for i in range(n)]
+    return lambda: [get_edge_signature(a, b) for a, b in pairs], n
+
+
+def setup_find_markers(n):
+    translits = synthetic_translits(n)
+    return lambda: [find_markers(t) for t in translits], n
+
+
+def setup_analyze_line_rhythm(n):
+    lines = [leiden_to_wheel(t) for t in synthetic_translits(n)]
+    return lambda: [analyze_line_rhythm(line) for line in lines], n
+
+
+CASES = {
+    'leiden_to_wheel': (setup_leiden_to_wheel, 'sentences'),
+    'encode_phonemes': (setup_encode_phonemes, 'phonemes'),
+    'decode_layered.string': (setup_decode_layered_string, 'phonemes'),
+    'decode_layered.bitwise': (setup_decode_layered_bitwise, 'phonemes'),
+    'translate': (setup_translate, 'sentences'),
+    'build_paragraph': (setup_build_paragraph, 'verbs'),
+    'load_tla_corpus': (setup_load_tla_corpus, 'sentences'),
+    'search_corpus': (setup_search_corpus, 'sentences'),
+    'get_edge_signature': (setup_get_edge_signature, 'lookups'),
+    'find_markers': (setup_find_markers, 'sentences'),
+    'analyze_line_rhythm': (setup_analyze_line_rhythm, 'lines'),
+}
+
+
+def run(sizes=SIZES, names=None, repeat: int = 5) -> list:
+    results = []
+    for name, (setup, unit) in CASES.items():
+        if names and name not in names:
+            continue
+        for n in sizes:
+            call, items = setup(n)
+            seconds = best_of(call, repeat)
+            results.append({
+                'name': name,
+                'size': n,
+                'items': items,
+                'unit': unit,
+                'seconds': seconds,
+                'per_s': items / seconds if seconds > 0 else None,
+            })
+    return results
+
+
+def main():
+    print(f"{'benchmark':<24} {'size':>8} {'seconds':>10} {'per second':>12}")
+    for r in run():
+        print(f"{r['name']:<24} {r['size']:>8} {r['seconds']:>10.4f} {r['per_s']:>12.4g} {r['unit']}")
+
+
+if __name__ == '__main__':
+    main()
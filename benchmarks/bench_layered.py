@@ -0,0 +1,65 @@
+"""
+Five-layer decode of the full Unas corpus, both directions.
+
+Compares the per-phoneme hourglass path (get_layered_verb, four calls
+per phoneme) with pyramid.decode_layered_sequence on the bitwise engine.
+Uses the phonemes of the shipped Pyramid Text translations, so the TLA
+corpus is not required.
+
+Run: python -m benchmarks.bench_layered
+"""
+
+from eye_of_horus.bitwise import DIRECTION_BOTH, decode_layered, encode_phonemes
+from eye_of_horus.engine import Mode, Pole, get_hourglass
+from eye_of_horus.pyramid import (
+    decode_layered_sequence,
+    get_layered_verb,
+    load_pyramid_translations,
+)
+
+from .common import best_of
+
+
+def string_engine_layered(phonemes):
+    """The original per-phoneme decode loop, kept as the baseline."""
+    core, f1, f2, m1, m2 = [], [], [], [], []
+    for i, p in enumerate(phonemes):
+        core.append(get_hourglass(p).equilibrium_masc)
+        f1.append(get_layered_verb(p, i, Mode.FEMININE, Pole.MINIMA))
+        f2.append(get_layered_verb(p, i, Mode.FEMININE, Pole.MAXIMA))
+        m1.append(get_layered_verb(p, i, Mode.MASCULINE, Pole.MINIMA))
+        m2.append(get_layered_verb(p, i, Mode.MASCULINE, Pole.MAXIMA))
+    return core, f1, f2, m1, m2
+
+
+def unas_phonemes() -> list:
+    return [p for entry in load_pyramid_translations() for p in entry['phonemes']]
+
+
+def run() -> list:
+    phonemes = unas_phonemes()
+    reverse = phonemes[::-1]
+    ids = encode_phonemes(phonemes)
+    n = len(phonemes)
+    
+    timings = {
+        'string_engine': best_of(lambda: (string_engine_layered(phonemes), string_engine_layered(reverse))),
+        'decode_layered_sequence': best_of(lambda: (decode_layered_sequence(phonemes), decode_layered_sequence(reverse))),
+        'bitwise_both_ids': best_of(lambda: decode_layered(ids, DIRECTION_BOTH)),
+    }
+    return [
+        {'name': name, 'n': n, 'seconds': t, 'phonemes_per_s': 2 * n / t}
+        for name, t in timings.items()
+    ]
+
+
+def main():
+    results = run()
+    base = results[0]['seconds']
+    print(f"Unas corpus: {results[0]['n']} phonemes, ascend + penetrate")
+    for r in results:
+        print(f"  {r['name']:<26} {r['seconds'] * 1e3:8.2f} ms  {base / r['seconds']:6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+5-bit packed storage throughput.
+
+Checks that unpacking stays well above layered-decode throughput, so a
+packed CorpusArray never becomes the bottleneck of a decode job.
+
+Run: python -m benchmarks.bench_pack5
+"""
+
+from eye_of_horus.bitwise import (
+    CorpusArray,
+    decode_layered_batch,
+    pack5,
+    unpack5,
+)
+
+from .common import best_of, synthetic_ids
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def run(sizes=SIZES) -> list:
+    results = []
+    for n in sizes:
+        ids, offsets = synthetic_ids(n)
+        packed = pack5(ids)
+        corpus = CorpusArray(ids, offsets, storage='packed')
+        
+        t_pack = best_of(lambda: pack5(ids))
+        t_unpack = best_of(lambda: unpack5(packed, len(ids)))
+        t_blocks = best_of(lambda: [corpus.block(b) for b in range(-(-len(ids) // corpus.block_size))])
+        t_decode = best_of(lambda: decode_layered_batch(ids, offsets))
+        
+        results.append({
+            'n': len(ids),
+            'bytes_plain': ids.nbytes,
+            'bytes_packed': packed.nbytes,
+            'pack_per_s': len(ids) / t_pack,
+            'unpack_per_s': len(ids) / t_unpack,
+            'block_unpack_per_s': len(ids) / t_blocks,
+            'decode_per_s': len(ids) / t_decode,
+        })
+    return results
+
+
+def main():
+    print(f"{'n':>10} {'saved':>7} {'pack/s':>12} {'unpack/s':>12} {'decode/s':>12} {'ratio':>7}")
+    for r in run():
+        saved = 1 - r['bytes_packed'] / r['bytes_plain']
+        ratio = r['unpack_per_s'] / r['decode_per_s']
+        print(
+            f"{r['n']:>10} {saved:>7.1%} {r['pack_per_s']:>12.3g} "
+            f"{r['unpack_per_s']:>12.3g} {r['decode_per_s']:>12.3g} {ratio:>6.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""
+Shared helpers for the benchmark scripts.
+
+All benchmarks run on synthetic data so they work from a wheel install,
+where the TLA corpus is not shipped.
+"""
+
+import os
+import platform
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+
+import eye_of_horus
+from eye_of_horus import corpus as corpus_module
+from eye_of_horus import pyramid as pyramid_module
+from eye_of_horus.bitwise import NUM_PHONEMES, offsets_from_lengths
+from eye_of_horus.pyramid import load_pyramid_translations
+
+
+def best_of(fn: Callable, repeat: int = 5) -> float:
+    """Best wall-clock time of `repeat` calls, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def synthetic_ids(n: int, mean_length: int = 12, seed: int = 0):
+    """
+    Random ragged ID corpus with about n phonemes.
+    
+    Returns:
+        (ids, offsets)
+    """
+    rng = np.random.default_rng(seed)
+    lengths = rng.poisson(mean_length, size=max(1, n // mean_length))
+    ids = rng.integers(0, NUM_PHONEMES, size=int(lengths.sum()), dtype=np.uint8)
+    return ids, offsets_from_lengths(lengths)
+
+
+def synthetic_translits(n: int, seed: int = 0) -> List[str]:
+    """n transliterations sampled from the shipped Pyramid Text lines."""
+    pool = [entry['transliteration'] for entry in load_pyramid_translations()]
+    rng = np.random.default_rng(seed)
+    return [pool[i] for i in rng.integers(0, len(pool), size=n).tolist()]
+
+
+def synthetic_tla_rows(n: int, seed: int = 0) -> List[dict]:
+    """
+    n TLA-format rows (as in tla_earlier_egyptian.json) with random dates.
+    
+    Only transliteration and dates carry content; the other fields are
+    short placeholders.
+    """
+    rng = np.random.default_rng(seed)
+    dates = rng.integers(-2700, -1500, size=n).tolist()
+    return [
+        {
+            'hieroglyphs': '',
+            'transliteration': translit,
+            'lemmatization': '',
+            'UPOS': '',
+            'glossing': '',
+            'translation': 'und der König sagt',
+            'dateNotBefore': str(date),
+            'dateNotAfter': str(date + 30),
+        }
+        for translit, date in zip(synthetic_translits(n, seed), dates)
+    ]
+
+
+@contextmanager
+def preserved_corpus():
+    """Restore the loaded TLA corpus and its index on exit."""
+    saved = corpus_module._corpus, corpus_module._corpus_path, corpus_module._date_index
+    try:
+        yield
+    finally:
+        corpus_module._corpus, corpus_module._corpus_path, corpus_module._date_index = saved
+
+
+@contextmanager
+def installed_corpus(sentences):
+    """Serve `sentences` as the default TLA corpus for the duration."""
+    default_path = Path(corpus_module.__file__).parent / 'data' / 'tla_earlier_egyptian.json'
+    with preserved_corpus():
+        corpus_module._corpus = sentences
+        corpus_module._corpus_path = default_path
+        corpus_module._date_index = None
+        yield sentences
+
+
+@contextmanager
+def uncached_translations():
+    """Run with translation memoization off, restoring the cache on exit."""
+    saved = pyramid_module._translation_cache
+    pyramid_module.disable_translation_cache()
+    try:
+        yield
+    finally:
+        pyramid_module._translation_cache = saved
+
+
+def _git_commit() -> str:
+    try:
+        root = Path(__file__).resolve().parent.parent
+        out = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=root,
+            capture_output=True, text=True, timeout=5,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment() -> dict:
+    """Metadata identifying the machine and build a run was taken on."""
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'eye_of_horus': eye_of_horus.__version__,
+        'git_commit': _git_commit(),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
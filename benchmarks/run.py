@@ -0,0 +1,63 @@
+"""
+Run the benchmark suites and write the results as JSON.
+
+Run: python -m benchmarks.run [--out results.json] [--sizes 100 1000]
+                              [--only find_markers translate] [--repeat 5]
+                              [--suites hotpaths pack5 layered]
+
+The JSON file holds an `environment` block (see common.environment)
+and one list of result rows per suite.
+"""
+
+import argparse
+import json
+import time
+
+from . import bench_hotpaths, bench_layered, bench_pack5
+from .common import environment
+
+SUITES = ('hotpaths', 'pack5', 'layered')
+
+
+def run_suites(suites=SUITES, sizes=None, only=None, repeat: int = 5) -> dict:
+    """
+    Run the chosen suites; returns the JSON-ready report.
+    
+    sizes and only apply to the hot-path suite; pack5 and layered keep
+    their own fixed inputs.
+    """
+    report = {'environment': environment(), 'suites': {}}
+    for suite in suites:
+        t0 = time.perf_counter()
+        if suite == 'hotpaths':
+            rows = bench_hotpaths.run(sizes or bench_hotpaths.SIZES, only, repeat)
+        elif suite == 'pack5':
+            rows = bench_pack5.run()
+        elif suite == 'layered':
+            rows = bench_layered.run()
+        else:
+            raise ValueError(f"Unknown suite: {suite!r}")
+        report['suites'][suite] = {'seconds': time.perf_counter() - t0, 'results': rows}
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--out', default='benchmark_results.json', help="JSON output path")
+    parser.add_argument('--sizes', type=int, nargs='+', help="Hot-path input sizes")
+    parser.add_argument('--only', nargs='+', help="Hot-path benchmark names to run")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed calls per case (best kept)")
+    parser.add_argument('--suites', nargs='+', default=list(SUITES), choices=SUITES)
+    args = parser.parse_args(argv)
+    
+    report = run_suites(args.suites, args.sizes, args.only, args.repeat)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    
+    for suite, data in report['suites'].items():
+        print(f"{suite}: {len(data['results'])} results in {data['seconds']:.1f}s")
+    print(f"Wrote {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -12,6 +12,7 @@ from .mapping import (
     LEIDEN_TO_WHEEL,
     WHEEL_VERBS,
     phonemes_to_verbs,
+    lexicon_version,
 )
 
 # Hourglass engine (full semantic architecture)
@@ -59,6 +60,12 @@ from .corpus import (
     load_semantic_network,
     get_edge_signature,
     find_edges_by_signature,
+    # Date index
+    PERIODS,
+    DateIndex,
+    get_date_index,
+    sentences_between,
+    sentences_by_date,
 )
 
 # Validation tools
@@ -66,24 +73,75 @@ from .validation import (
     oldest_sentences,
     test_oldest_sentences,
     test_causal_coherence,
+    test_causal_coherence_batch,
+    CoherenceBatch,
+    CausalPatternSet,
+    get_causal_patterns,
+    RETROCAUSAL_PATTERNS,
+    FORWARD_PATTERNS,
+    validate_corpus,
+    ValidationReport,
+    ValidationShard,
+    ColumnSink,
+    print_validation_report,
+    compare_directions,
+    DirectionComparison,
+    DirectionScores,
+    BigramModel,
+    get_bigram_model,
     DirectionTest,
     find_markers,
+    find_markers_batch,
+    MarkerHits,
+    MarkerScanner,
+    get_marker_scanner,
     show_sentence_detail,
 )
 
+# Stage instrumentation (instrument.enable(), snapshot(), export())
+from . import instrument
+
+# Synthetic corpus for load tests
+from .synthetic import (
+    SyntheticTLA,
+    write_synthetic_tla,
+)
+
 # Pyramid Texts
 from .pyramid import (
     get_pyramid_texts,
+    get_pyramid_ids,
     load_pyramid_translations,
+    rebuild_pyramid_translations,
+    update_pyramid_translations,
+    TranslationUpdate,
     translate,
     translate_bidirectional,
+    enable_translation_cache,
+    disable_translation_cache,
+    translation_cache_info,
+    TranslationCache,
     decode,
     decode_range,
     decode_bidirectional,
     decode_layered,
+    iter_decoded,
+    iter_bidirectional,
+    iter_layered,
+    iter_breath_windows,
+    BreathWindow,
+    BREATH_BLOCK,
+    drain,
+    CollectSink,
+    JSONLinesSink,
+    QueueSink,
+    DecodedPrinter,
+    BidirectionalPrinter,
+    LayeredPrinter,
     DecodedLine,
     BidirectionalLine,
     LayeredReading,
+    LayeredBlock,
 )
 
 # Fibonacci Rhythm & Breath
@@ -103,6 +161,16 @@ from .rhythm import (
     segment_by_fibonacci,
     analyze_line_rhythm,
     SCRIPT_RATIOS,
+    YUGAS,
+    phi_boundaries_array,
+    phi_boundary_mask,
+    yuga_spans,
+    analyze_corpus_rhythm,
+    CorpusRhythm,
+    BREATH_PHASES,
+    breath_phase_codes,
+    breath_phase_distribution,
+    PhaseDistribution,
 )
 
 # Bitwise engine (fast vectorized decode)
@@ -135,15 +203,42 @@ from .bitwise import (
     decode_all_layers,
     decode_layered as decode_layered_fast,
     LayeredResult,
+    BidirectionalLayeredResult,
     decode_text,
+    # Reading direction
+    DIRECTION_ASCEND,
+    DIRECTION_PENETRATE,
+    DIRECTION_BOTH,
+    reading_view,
+    ragged_reading_view,
+    # Ragged corpus decode
+    encode_corpus,
+    offsets_from_lengths,
+    decode_layered_batch,
+    RaggedLayeredResult,
     # Relations
     relation_index,
     relation_to_pair,
     NUM_WHEEL_RELATIONS,
+    RELATION_INDEX_TABLE,
+    RELATION_PAIR_TABLE,
+    relation_index_array,
+    relation_to_pair_array,
+    relation_stream,
+    relation_stream_batch,
+    relation_histogram,
     # Grammar
     grammar_index,
     grammar_to_components,
     TOTAL_GRAMMAR,
     # Convenience
     phonemes_to_verbs_fast,
+    # Motifs
+    ngram_counts,
+    ngram_to_ids,
+    NgramCounts,
+    # Packed storage
+    pack5,
+    unpack5,
+    CorpusArray,
 )
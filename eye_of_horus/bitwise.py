@@ -11,10 +11,12 @@ Enables vectorized decode of entire texts via array indexing.
 """
 
 import numpy as np
-from typing import List, Tuple, Optional, Union
+from typing import List, Tuple, Optional, Union, Sequence
 from dataclasses import dataclass
 from enum import IntEnum
 
+from .instrument import stage
+
 # =============================================================================
 # PHONEME IDs (5 bits: 0-21)
 # =============================================================================
@@ -182,6 +184,7 @@ CORE_VERB_TABLE = np.array([
 # ENCODING FUNCTIONS
 # =============================================================================
 
+@stage("bitwise.encode", items=lambda ids, phonemes: len(ids))
 def encode_phonemes(phonemes: List[str]) -> np.ndarray:
     """
     Convert phoneme string list to ID array.
@@ -200,6 +203,79 @@ def decode_ids(ids: np.ndarray) -> List[str]:
     return [ID_TO_PHONEME[i] for i in ids]
 
 
+def offsets_from_lengths(lengths) -> np.ndarray:
+    """
+    Build CSR-style sentence offsets from per-sentence lengths.
+    
+    Sentence i occupies ids[offsets[i]:offsets[i + 1]].
+    
+    Returns:
+        int64 array of length len(lengths) + 1, starting at 0
+    """
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+@stage("bitwise.encode_corpus", items=lambda result, sentences: len(result[0]))
+def encode_corpus(sentences: List[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode many phoneme lists into one flat ID buffer plus offsets.
+    
+    Args:
+        sentences: List of phoneme string lists
+    
+    Returns:
+        (ids, offsets) — uint8 IDs and int64 sentence offsets
+    """
+    flat = [PHONEME_TO_ID[p] for phonemes in sentences for p in phonemes]
+    ids = np.array(flat, dtype=np.uint8)
+    offsets = offsets_from_lengths([len(phonemes) for phonemes in sentences])
+    return ids, offsets
+
+
+def local_index(offsets: np.ndarray) -> np.ndarray:
+    """
+    Position of every element within its own sentence.
+    
+    Args:
+        offsets: Sentence offsets (see offsets_from_lengths)
+    
+    Returns:
+        int64 array of length offsets[-1]; restarts at 0 at each sentence
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.diff(offsets)
+    starts = np.repeat(offsets[:-1], lengths)
+    return np.arange(offsets[-1], dtype=np.int64) - starts
+
+
+def sentence_index(offsets: np.ndarray) -> np.ndarray:
+    """
+    Sentence number of every element of a ragged buffer.
+    
+    Returns:
+        int64 array of length offsets[-1]
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    return np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+
+
+def reversed_index(offsets: np.ndarray) -> np.ndarray:
+    """
+    Gather index reversing every sentence of a ragged buffer in place.
+    
+    ids[reversed_index(offsets)] keeps sentence order and offsets, with
+    each sentence read back to front.
+    
+    Returns:
+        int64 array of length offsets[-1]
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    ends = offsets[:-1] + offsets[1:] - 1
+    return ends[sentence_index(offsets)] - np.arange(offsets[-1], dtype=np.int64)
+
+
 def semantic_address(phoneme_id: int, mode: int, pole: int) -> int:
     """
     Compute 8-bit semantic address.
@@ -256,17 +332,122 @@ def is_spine_array(ids: np.ndarray) -> np.ndarray:
 # LAYERED DECODE (VECTORIZED)
 # =============================================================================
 
-def decode_layer(phoneme_ids: np.ndarray, layer: int) -> np.ndarray:
+# Reading directions
+DIRECTION_ASCEND = 'ascend'        # L→R, storage order
+DIRECTION_PENETRATE = 'penetrate'  # R→L, reversed view
+DIRECTION_BOTH = 'both'            # Both readings in one gather
+
+DIRECTIONS = (DIRECTION_ASCEND, DIRECTION_PENETRATE, DIRECTION_BOTH)
+
+# Position bits used at alternating (non-pole) slots: same mode, pole = eq
+LAYER_EQ_POS = LAYER_POS & MODE_MASK
+
+
+def _check_direction(direction: str):
+    if direction not in DIRECTIONS:
+        raise ValueError(f"Unknown direction: {direction!r}")
+
+
+def reading_view(phoneme_ids: np.ndarray, direction: str = DIRECTION_ASCEND) -> np.ndarray:
+    """
+    View of an ID array in reading order.
+    
+    Penetrate (R→L) readings are negative-stride views; nothing is copied.
+    """
+    if direction == DIRECTION_PENETRATE:
+        return phoneme_ids[::-1]
+    return phoneme_ids
+
+
+def ragged_reading_view(
+    phoneme_ids: np.ndarray,
+    offsets: np.ndarray,
+    direction: str = DIRECTION_ASCEND,
+) -> np.ndarray:
+    """
+    A ragged ID buffer in reading order.
+    
+    Sentences stay in corpus order under the offsets; a penetrate (R→L)
+    reading reverses each sentence, which takes a gather (a copy).
+    """
+    if direction == DIRECTION_PENETRATE:
+        return phoneme_ids[reversed_index(offsets)]
+    return phoneme_ids
+
+
+def layer_addresses(
+    phoneme_ids: np.ndarray,
+    index: np.ndarray,
+    layers: Optional[Sequence[int]] = None,
+) -> np.ndarray:
+    """
+    Semantic addresses for all 5 layers in one gather.
+    
+    Args:
+        phoneme_ids: uint8 array of phoneme IDs, in reading order
+        index: Alternation index per element (pole where even, eq where odd)
+        layers: Only these layers (default: all 5, in Layer order)
+    
+    Returns:
+        (len(layers), n) int32 address array, rows ordered as layers
+    """
+    pos, eq_pos = LAYER_POS, LAYER_EQ_POS
+    if layers is not None:
+        pos, eq_pos = pos[list(layers)], eq_pos[list(layers)]
+    use_pole = (index & 1) == 0
+    pos_bits = np.where(use_pole, pos[:, None], eq_pos[:, None])
+    return (phoneme_ids.astype(np.int32) << 3)[None, :] | pos_bits
+
+
+def _gather_layers(
+    phoneme_ids: np.ndarray,
+    index: np.ndarray,
+    direction: str,
+    reverse_ids: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Gather verbs for all 5 layers in reading order.
+    
+    Returns (5, n) verbs for a single direction, or (2, 5, n) for
+    DIRECTION_BOTH (row 0 ascend, row 1 penetrate). `reverse_ids` is
+    the penetrate reading of the IDs when it is not the whole buffer
+    reversed (ragged buffers reverse sentence by sentence).
+    """
+    if direction != DIRECTION_BOTH:
+        return VERB_TABLE[layer_addresses(reading_view(phoneme_ids, direction), index)]
+    
+    if reverse_ids is None:
+        reverse_ids = phoneme_ids[::-1]
+    addresses = np.empty((2, len(Layer), len(phoneme_ids)), dtype=np.int32)
+    addresses[0] = layer_addresses(phoneme_ids, index)
+    addresses[1] = layer_addresses(reverse_ids, index)
+    return VERB_TABLE[addresses]
+
+
+def decode_layer(
+    phoneme_ids: np.ndarray,
+    layer: int,
+    direction: str = DIRECTION_ASCEND,
+) -> np.ndarray:
     """
     Decode phoneme array through a single layer.
     
     Args:
         phoneme_ids: uint8 array of phoneme IDs
         layer: 0=core, 1=f1, 2=f2, 3=m1, 4=m2
+        direction: 'ascend' (L→R), 'penetrate' (R→L) or 'both'
     
     Returns:
-        Array of verb strings
+        Array of verb strings in reading order; shape (2, n) for 'both'
     """
+    _check_direction(direction)
+    if direction == DIRECTION_BOTH:
+        return np.stack([
+            decode_layer(phoneme_ids, layer, DIRECTION_ASCEND),
+            decode_layer(phoneme_ids, layer, DIRECTION_PENETRATE),
+        ])
+    
+    phoneme_ids = reading_view(phoneme_ids, direction)
     layer_pos = LAYER_POS[layer]
     
     if layer == Layer.CORE:
@@ -277,7 +458,7 @@ def decode_layer(phoneme_ids: np.ndarray, layer: int) -> np.ndarray:
         layer_mode = (layer_pos >> 2) & 1
         layer_pole = layer_pos & POLE_MASK
         
-        # Alternation: pole at even indices, eq at odd
+        # Alternation: pole at even indices, eq at odd (counted from reading start)
         n = len(phoneme_ids)
         indices = np.arange(n)
         use_pole = (indices & 1) == 0  # Even positions get pole
@@ -291,14 +472,22 @@ def decode_layer(phoneme_ids: np.ndarray, layer: int) -> np.ndarray:
     return VERB_TABLE[addresses]
 
 
-def decode_all_layers(phoneme_ids: np.ndarray) -> List[np.ndarray]:
+def decode_all_layers(
+    phoneme_ids: np.ndarray,
+    direction: str = DIRECTION_ASCEND,
+) -> List[np.ndarray]:
     """
     Decode phoneme array through all 5 layers.
     
     Returns:
-        List of 5 verb arrays [core, f1, f2, m1, m2]
+        List of 5 verb arrays [core, f1, f2, m1, m2]; for 'both' each
+        array has shape (2, n) with row 0 ascend and row 1 penetrate
     """
-    return [decode_layer(phoneme_ids, layer) for layer in range(5)]
+    _check_direction(direction)
+    verbs = _gather_layers(phoneme_ids, np.arange(len(phoneme_ids)), direction)
+    if direction == DIRECTION_BOTH:
+        verbs = np.moveaxis(verbs, 1, 0)
+    return list(verbs)
 
 
 @dataclass
@@ -331,18 +520,175 @@ class LayeredResult:
         }
 
 
-def decode_layered(phoneme_ids: np.ndarray) -> LayeredResult:
+def _layered_result(verbs: np.ndarray, phoneme_ids: np.ndarray) -> LayeredResult:
+    """Wrap a (5, n) verb array as a LayeredResult of row views."""
+    return LayeredResult(
+        core=verbs[Layer.CORE],
+        f1=verbs[Layer.F1],
+        f2=verbs[Layer.F2],
+        m1=verbs[Layer.M1],
+        m2=verbs[Layer.M2],
+        phoneme_ids=phoneme_ids,
+    )
+
+
+@dataclass
+class BidirectionalLayeredResult:
+    """
+    Both readings of a sequence from a single gather.
+    
+    layers[0] is ascend (L→R), layers[1] is penetrate (R→L); both are
+    in their own reading order. phoneme_ids is in storage order. With
+    offsets, sentences keep corpus order and penetrate reverses each.
+    """
+    layers: np.ndarray  # (2, 5, n)
+    phoneme_ids: np.ndarray
+    offsets: Optional[np.ndarray] = None
+    
+    @property
+    def ascend(self) -> LayeredResult:
+        """L→R reading (ragged when offsets are set)."""
+        return self._direction(0, DIRECTION_ASCEND)
+    
+    @property
+    def penetrate(self) -> LayeredResult:
+        """R→L reading (ragged when offsets are set)."""
+        return self._direction(1, DIRECTION_PENETRATE)
+    
+    def _direction(self, row: int, direction: str) -> LayeredResult:
+        if self.offsets is None:
+            return _layered_result(self.layers[row], reading_view(self.phoneme_ids, direction))
+        return RaggedLayeredResult(
+            **vars(_layered_result(
+                self.layers[row],
+                ragged_reading_view(self.phoneme_ids, self.offsets, direction),
+            )),
+            offsets=self.offsets,
+        )
+
+
+@stage("bitwise.decode_layered", items=lambda result, phoneme_ids, *args, **kwargs: len(phoneme_ids))
+def decode_layered(
+    phoneme_ids: np.ndarray,
+    direction: str = DIRECTION_ASCEND,
+) -> Union[LayeredResult, BidirectionalLayeredResult]:
     """
     Full layered decode returning structured result.
+    
+    Args:
+        phoneme_ids: uint8 array of phoneme IDs
+        direction: 'ascend' (L→R), 'penetrate' (R→L) or 'both'
+    
+    Alternation starts with a pole at the first phoneme *read*, so a
+    penetrate reading begins at the last phoneme in storage order.
     """
-    layers = decode_all_layers(phoneme_ids)
-    return LayeredResult(
-        core=layers[0],
-        f1=layers[1],
-        f2=layers[2],
-        m1=layers[3],
-        m2=layers[4],
-        phoneme_ids=phoneme_ids,
+    _check_direction(direction)
+    verbs = _gather_layers(phoneme_ids, np.arange(len(phoneme_ids)), direction)
+    if direction == DIRECTION_BOTH:
+        return BidirectionalLayeredResult(layers=verbs, phoneme_ids=phoneme_ids)
+    return _layered_result(verbs, reading_view(phoneme_ids, direction))
+
+
+# =============================================================================
+# BATCH LAYERED DECODE (RAGGED CORPUS)
+# =============================================================================
+
+PARITY_PER_SENTENCE = 'per_sentence'
+PARITY_GLOBAL = 'global'
+
+
+@dataclass
+class RaggedLayeredResult(LayeredResult):
+    """
+    Layered decode of many sentences sharing flat buffers.
+    
+    Layer arrays cover the whole corpus; offsets mark sentence bounds.
+    Slicing a sentence returns views, not copies.
+    """
+    offsets: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    @property
+    def lengths(self) -> np.ndarray:
+        """Phoneme count per sentence."""
+        return np.diff(self.offsets)
+    
+    def sentence(self, i: int) -> LayeredResult:
+        """Layered result for sentence i (views into the flat buffers)."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return LayeredResult(
+            core=self.core[lo:hi],
+            f1=self.f1[lo:hi],
+            f2=self.f2[lo:hi],
+            m1=self.m1[lo:hi],
+            m2=self.m2[lo:hi],
+            phoneme_ids=self.phoneme_ids[lo:hi],
+        )
+    
+    def __getitem__(self, i: int) -> LayeredResult:
+        return self.sentence(i)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.sentence(i)
+
+
+def _alternation_index(offsets: np.ndarray, parity: str) -> np.ndarray:
+    if parity == PARITY_PER_SENTENCE:
+        return local_index(offsets)
+    if parity == PARITY_GLOBAL:
+        return np.arange(offsets[-1])
+    raise ValueError(f"Unknown parity: {parity!r}")
+
+
+@stage("bitwise.decode_layered_batch", items=lambda result, phoneme_ids, *args, **kwargs: len(phoneme_ids))
+def decode_layered_batch(
+    phoneme_ids: np.ndarray,
+    offsets: np.ndarray,
+    parity: str = PARITY_PER_SENTENCE,
+    direction: str = DIRECTION_ASCEND,
+) -> Union[RaggedLayeredResult, BidirectionalLayeredResult]:
+    """
+    Decode a ragged corpus through all 5 layers in one vectorized call.
+    
+    Args:
+        phoneme_ids: Flat uint8 ID buffer for all sentences
+        offsets: Sentence offsets, length num_sentences + 1
+        parity: 'per_sentence' restarts pole/eq alternation at each
+                sentence start; 'global' alternates over the flat buffer
+        direction: 'ascend', 'penetrate' or 'both'. Penetrate keeps
+                   corpus order and reads each sentence R→L, so
+                   sentence i decodes as decode_layered(ids[o[i]:o[i+1]],
+                   'penetrate'). Global parity counts over the buffer
+                   in reading order.
+    
+    Returns:
+        RaggedLayeredResult, or BidirectionalLayeredResult for 'both'
+    """
+    _check_direction(direction)
+    phoneme_ids = np.asarray(phoneme_ids, dtype=np.uint8)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if offsets[0] != 0 or offsets[-1] != len(phoneme_ids):
+        raise ValueError(
+            f"Offsets must span the ID buffer: got {offsets[0]}..{offsets[-1]} "
+            f"for {len(phoneme_ids)} IDs"
+        )
+    
+    # Sentences keep their place in both readings, so one alternation
+    # index serves both
+    index = _alternation_index(offsets, parity)
+    if direction == DIRECTION_BOTH:
+        reverse_ids = ragged_reading_view(phoneme_ids, offsets, DIRECTION_PENETRATE)
+        verbs = _gather_layers(phoneme_ids, index, direction, reverse_ids)
+        return BidirectionalLayeredResult(layers=verbs, phoneme_ids=phoneme_ids, offsets=offsets)
+    
+    phoneme_ids = ragged_reading_view(phoneme_ids, offsets, direction)
+    verbs = _gather_layers(phoneme_ids, index, DIRECTION_ASCEND)
+    return RaggedLayeredResult(
+        **vars(_layered_result(verbs, phoneme_ids)),
+        offsets=offsets,
     )
 
 
@@ -362,18 +708,99 @@ def relation_index(a: int, b: int) -> int:
     return (b * (b + 1) >> 1) + a
 
 
+# Total relations
+NUM_WHEEL_RELATIONS = 136  # T(16)
+
+# 16×16 (a, b) → relation index, symmetric
+RELATION_INDEX_TABLE = np.empty((NUM_WHEEL, NUM_WHEEL), dtype=np.uint8)
+# 136 × 2 relation index → canonical (a, b) with a ≤ b
+RELATION_PAIR_TABLE = np.empty((NUM_WHEEL_RELATIONS, 2), dtype=np.uint8)
+
+for _b in range(NUM_WHEEL):
+    for _a in range(_b + 1):
+        _index = relation_index(_a, _b)
+        RELATION_INDEX_TABLE[_a, _b] = RELATION_INDEX_TABLE[_b, _a] = _index
+        RELATION_PAIR_TABLE[_index] = (_a, _b)
+
+
 def relation_to_pair(index: int) -> Tuple[int, int]:
     """
     Reverse triangular index to phoneme pair.
     """
-    # Find b such that T(b) ≤ index < T(b+1)
-    b = int((-1 + (1 + 8 * index) ** 0.5) // 2)
-    a = index - (b * (b + 1) >> 1)
-    return a, b
+    a, b = RELATION_PAIR_TABLE[index]
+    return int(a), int(b)
 
 
-# Total relations
-NUM_WHEEL_RELATIONS = 136  # T(16)
+def relation_index_array(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Vectorized relation_index for arrays of wheel IDs."""
+    return RELATION_INDEX_TABLE[a, b]
+
+
+def relation_to_pair_array(index: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized relation_to_pair: returns (a, b) arrays with a ≤ b."""
+    pairs = RELATION_PAIR_TABLE[index]
+    return pairs[..., 0], pairs[..., 1]
+
+
+# Spine policies for relation streams
+SPINE_SKIP = 'skip'      # Drop pairs that touch a spine phoneme
+SPINE_BRIDGE = 'bridge'  # Join the wheel phonemes on either side of spine runs
+
+
+def relation_stream(phoneme_ids: np.ndarray, spine: str = SPINE_SKIP) -> np.ndarray:
+    """
+    Relation indices of consecutive wheel phonemes in one sentence.
+    
+    Args:
+        phoneme_ids: uint8 array of phoneme IDs
+        spine: 'skip' ignores pairs touching a spine phoneme;
+               'bridge' relates wheel phonemes across spine phonemes
+    
+    Returns:
+        uint8 array of relation indices (0-135)
+    """
+    phoneme_ids = np.asarray(phoneme_ids, dtype=np.uint8)
+    relations, _ = relation_stream_batch(
+        phoneme_ids, np.array([0, len(phoneme_ids)]), spine,
+    )
+    return relations
+
+
+def relation_stream_batch(
+    phoneme_ids: np.ndarray,
+    offsets: np.ndarray,
+    spine: str = SPINE_SKIP,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ragged relation_stream over a whole corpus.
+    
+    Pairs never cross sentence boundaries.
+    
+    Returns:
+        (relations, relation_offsets) — uint8 indices and int64 offsets
+    """
+    phoneme_ids = np.asarray(phoneme_ids, dtype=np.uint8)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    sentences = sentence_index(offsets)
+    wheel = is_wheel_array(phoneme_ids)
+    
+    if spine == SPINE_BRIDGE:
+        phoneme_ids = phoneme_ids[wheel]
+        sentences = sentences[wheel]
+        keep = sentences[:-1] == sentences[1:]
+    elif spine == SPINE_SKIP:
+        keep = (sentences[:-1] == sentences[1:]) & wheel[:-1] & wheel[1:]
+    else:
+        raise ValueError(f"Unknown spine policy: {spine!r}")
+    
+    relations = RELATION_INDEX_TABLE[phoneme_ids[:-1][keep], phoneme_ids[1:][keep]]
+    counts = np.bincount(sentences[:-1][keep], minlength=len(offsets) - 1)
+    return relations, offsets_from_lengths(counts)
+
+
+def relation_histogram(relations: np.ndarray) -> np.ndarray:
+    """Count of each of the 136 relations."""
+    return np.bincount(relations, minlength=NUM_WHEEL_RELATIONS)
 
 # =============================================================================
 # GRAMMAR ENCODING (12 bits: scale + relation)
@@ -412,12 +839,375 @@ def phonemes_to_verbs_fast(phonemes: List[str]) -> List[str]:
     return CORE_VERB_TABLE[ids].tolist()
 
 
-def decode_text(phonemes: List[str]) -> LayeredResult:
+def decode_text(
+    phonemes: List[str],
+    direction: str = DIRECTION_ASCEND,
+) -> Union[LayeredResult, BidirectionalLayeredResult]:
     """
     Full decode: phoneme strings → all 5 layers.
     """
     ids = encode_phonemes(phonemes)
-    return decode_layered(ids)
+    return decode_layered(ids, direction)
+
+
+# =============================================================================
+# N-GRAM MOTIFS (base-22 window codes)
+# =============================================================================
+
+# Longest n-gram whose base-22 code fits in int64
+NGRAM_MAX = 14
+
+
+def _ngram_weights(n: int) -> np.ndarray:
+    """Base-22 place values, first phoneme most significant."""
+    if not 1 <= n <= NGRAM_MAX:
+        raise ValueError(f"n-gram length must be 1-{NGRAM_MAX}, got {n}")
+    return NUM_PHONEMES ** np.arange(n - 1, -1, -1, dtype=np.int64)
+
+
+def ngram_codes(
+    phoneme_ids: np.ndarray,
+    offsets: np.ndarray,
+    n: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Base-22 code of every length-n window that stays inside one sentence.
+    
+    Returns:
+        (codes, starts) — int64 codes and each window's start in the buffer
+    """
+    weights = _ngram_weights(n)
+    phoneme_ids = np.asarray(phoneme_ids, dtype=np.uint8)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if len(phoneme_ids) < n:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    
+    windows = np.lib.stride_tricks.sliding_window_view(phoneme_ids, n)
+    sentences = sentence_index(offsets)
+    starts = np.flatnonzero(sentences[:len(windows)] == sentences[n - 1:])
+    codes = windows[starts].astype(np.int64) @ weights
+    return codes, starts
+
+
+def ngram_to_ids(codes: np.ndarray, n: int) -> np.ndarray:
+    """Decode base-22 n-gram codes to an (m, n) array of phoneme IDs."""
+    weights = _ngram_weights(n)
+    return ((np.asarray(codes, dtype=np.int64)[:, None] // weights) % NUM_PHONEMES).astype(np.uint8)
+
+
+@dataclass
+class NgramCounts:
+    """
+    Motif counts from ngram_counts.
+    
+    counts is (num_codes,) when ungrouped, or (num_groups, num_codes)
+    with rows ordered as `groups` when a per-sentence key was given.
+    """
+    n: int
+    codes: np.ndarray
+    counts: np.ndarray
+    groups: Optional[np.ndarray] = None
+    
+    def ids(self) -> np.ndarray:
+        """(num_codes, n) phoneme IDs of each motif."""
+        return ngram_to_ids(self.codes, self.n)
+    
+    def tuples(self) -> List[Tuple[str, ...]]:
+        """Each motif as a tuple of phoneme strings."""
+        return [tuple(ID_TO_PHONEME[row].tolist()) for row in self.ids()]
+    
+    def most_common(self, k: Optional[int] = None, group=None) -> List[Tuple[Tuple[str, ...], int]]:
+        """
+        Motifs by descending count (ties in code order).
+        
+        Args:
+            k: Number to return (all if None)
+            group: Group key to read when counts are grouped
+        """
+        counts = self.counts
+        if self.groups is not None:
+            row = np.flatnonzero(self.groups == group)
+            if len(row) == 0:
+                return []
+            counts = counts[row[0]]
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0][:k]
+        motifs = ngram_to_ids(self.codes[order], self.n)
+        return [
+            (tuple(ID_TO_PHONEME[row].tolist()), int(c))
+            for row, c in zip(motifs, counts[order])
+        ]
+
+
+def ngram_counts(
+    phoneme_ids: np.ndarray,
+    offsets: np.ndarray,
+    n: int,
+    keys: Optional[np.ndarray] = None,
+) -> NgramCounts:
+    """
+    Count length-n phoneme motifs across a ragged corpus.
+    
+    Windows that would cross a sentence boundary are not counted.
+    
+    Args:
+        phoneme_ids: Flat uint8 ID buffer
+        offsets: Sentence offsets, length num_sentences + 1
+        n: Motif length
+        keys: Optional per-sentence group key (e.g. period code)
+    
+    Returns:
+        NgramCounts
+    """
+    codes, starts = ngram_codes(phoneme_ids, offsets, n)
+    if keys is None:
+        unique, counts = np.unique(codes, return_counts=True)
+        return NgramCounts(n=n, codes=unique, counts=counts)
+    
+    keys = np.asarray(keys)
+    window_keys = keys[sentence_index(offsets)[starts]]
+    unique, code_inv = np.unique(codes, return_inverse=True)
+    groups, group_inv = np.unique(window_keys, return_inverse=True)
+    flat = group_inv.astype(np.int64) * len(unique) + code_inv
+    counts = np.bincount(flat, minlength=len(groups) * len(unique))
+    return NgramCounts(
+        n=n,
+        codes=unique,
+        counts=counts.reshape(len(groups), len(unique)),
+        groups=groups,
+    )
+
+
+# =============================================================================
+# PACKED STORAGE (5 bits per phoneme)
+# =============================================================================
+
+# 8 phonemes × 5 bits = 40 bits = 5 bytes
+PACK_BITS = 5
+PACK_GROUP = 8
+PACK_GROUP_BYTES = 5
+PACK_MASK = (1 << PACK_BITS) - 1
+
+_PACK_SHIFTS = np.arange(PACK_GROUP, dtype=np.uint64) * np.uint64(PACK_BITS)
+
+
+def packed_size(n: int) -> int:
+    """Bytes needed to pack n phoneme IDs."""
+    return -(-n // PACK_GROUP) * PACK_GROUP_BYTES
+
+
+def pack5(phoneme_ids: np.ndarray) -> np.ndarray:
+    """
+    Pack phoneme IDs at 5 bits each (37.5% smaller than uint8).
+    
+    Every group of 8 IDs becomes one little-endian 40-bit word; the
+    final group is zero-padded. The length is not stored — keep it
+    alongside the packed bytes and pass it to unpack5.
+    
+    Returns:
+        uint8 array of packed_size(len(phoneme_ids)) bytes
+    """
+    phoneme_ids = np.asarray(phoneme_ids, dtype=np.uint8)
+    n = len(phoneme_ids)
+    groups = -(-n // PACK_GROUP)
+    
+    padded = np.zeros(groups * PACK_GROUP, dtype=np.uint64)
+    padded[:n] = phoneme_ids
+    words = np.bitwise_or.reduce(
+        padded.reshape(groups, PACK_GROUP) << _PACK_SHIFTS, axis=1,
+    ).astype('<u8')
+    return words.view(np.uint8).reshape(groups, 8)[:, :PACK_GROUP_BYTES].ravel()
+
+
+def unpack5(packed: np.ndarray, n: int) -> np.ndarray:
+    """
+    Inverse of pack5.
+    
+    Args:
+        packed: Bytes from pack5 (any whole number of 5-byte groups)
+        n: Number of IDs to return
+    
+    Returns:
+        uint8 array of phoneme IDs
+    """
+    groups = len(packed) // PACK_GROUP_BYTES
+    words = np.zeros((groups, 8), dtype=np.uint8)
+    words[:, :PACK_GROUP_BYTES] = np.asarray(packed, dtype=np.uint8).reshape(groups, PACK_GROUP_BYTES)
+    words = words.view('<u8')  # (groups, 1)
+    ids = ((words >> _PACK_SHIFTS) & np.uint64(PACK_MASK)).astype(np.uint8)
+    return ids.ravel()[:n]
+
+
+# =============================================================================
+# RAGGED CORPUS ARRAY
+# =============================================================================
+
+STORAGE_PLAIN = 'plain'    # uint8 per phoneme
+STORAGE_PACKED = 'packed'  # 5 bits per phoneme, unpacked per block on access
+
+# Phonemes per packed block (multiple of PACK_GROUP so blocks align to bytes)
+PACK_BLOCK_SIZE = 1 << 16
+
+
+class CorpusArray:
+    """
+    A ragged corpus of phoneme IDs: one flat buffer plus sentence offsets.
+    
+    Sentence i occupies [offsets[i], offsets[i + 1]) of the buffer.
+    In 'packed' storage the buffer is held at 5 bits per phoneme and
+    only the blocks a read touches are unpacked.
+    """
+    
+    def __init__(
+        self,
+        phoneme_ids: np.ndarray,
+        offsets: np.ndarray,
+        storage: str = STORAGE_PLAIN,
+        block_size: int = PACK_BLOCK_SIZE,
+    ):
+        phoneme_ids = np.asarray(phoneme_ids, dtype=np.uint8)
+        buffer = pack5(phoneme_ids) if storage == STORAGE_PACKED else phoneme_ids
+        self._init_buffer(buffer, offsets, storage, block_size, len(phoneme_ids))
+    
+    def _init_buffer(self, buffer: np.ndarray, offsets, storage: str, block_size: int, size: int):
+        """Adopt a buffer already in `storage` form (packed bytes or IDs)."""
+        if storage not in (STORAGE_PLAIN, STORAGE_PACKED):
+            raise ValueError(f"Unknown storage: {storage!r}")
+        if block_size <= 0 or block_size % PACK_GROUP:
+            raise ValueError(f"block_size must be a positive multiple of {PACK_GROUP}")
+        
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        if self.offsets[0] != 0 or self.offsets[-1] != size:
+            raise ValueError("Offsets must span the ID buffer")
+        expected = packed_size(size) if storage == STORAGE_PACKED else size
+        if len(buffer) != expected:
+            raise ValueError(f"Buffer holds {len(buffer)} entries, expected {expected} for {size} IDs")
+        
+        self.storage = storage
+        self.block_size = block_size
+        self.size = size
+        # (block number, unpacked IDs), replaced as one object
+        self._cache = None
+        
+        if storage == STORAGE_PACKED:
+            self._ids = None
+            self._packed = buffer
+        else:
+            self._ids = buffer
+            self._packed = None
+    
+    @classmethod
+    def from_phonemes(cls, sentences: List[List[str]], **kwargs) -> 'CorpusArray':
+        """Build from phoneme string lists."""
+        ids, offsets = encode_corpus(sentences)
+        return cls(ids, offsets, **kwargs)
+    
+    @classmethod
+    def from_sentences(cls, sentences, **kwargs) -> 'CorpusArray':
+        """Build from objects with a `phonemes` list (e.g. corpus.Sentence)."""
+        return cls.from_phonemes([s.phonemes for s in sentences], **kwargs)
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    @property
+    def lengths(self) -> np.ndarray:
+        """Phoneme count per sentence."""
+        return np.diff(self.offsets)
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the phoneme buffer (excluding offsets)."""
+        if self.storage == STORAGE_PACKED:
+            return self._packed.nbytes
+        return self._ids.nbytes
+    
+    @property
+    def ids(self) -> np.ndarray:
+        """The full flat ID buffer (unpacks everything in packed storage)."""
+        if self.storage == STORAGE_PACKED:
+            return unpack5(self._packed, self.size)
+        return self._ids
+    
+    def block(self, b: int) -> np.ndarray:
+        """
+        Unpacked IDs of block b; the last block used is cached.
+        
+        The cache entry is swapped in as one (block, ids) pair, so
+        threads sharing a corpus never see another block's IDs.
+        """
+        cache = self._cache
+        if cache is not None and cache[0] == b:
+            return cache[1]
+        lo = b * self.block_size
+        n = min(self.block_size, self.size - lo)
+        start = lo // PACK_GROUP * PACK_GROUP_BYTES
+        ids = unpack5(self._packed[start:start + packed_size(n)], n)
+        self._cache = (b, ids)
+        return ids
+    
+    def slice(self, lo: int, hi: int) -> np.ndarray:
+        """IDs in buffer range [lo, hi), unpacking only the blocks touched."""
+        if self.storage == STORAGE_PLAIN:
+            return self._ids[lo:hi]
+        if hi <= lo:
+            return np.empty(0, dtype=np.uint8)
+        
+        first, last = lo // self.block_size, (hi - 1) // self.block_size
+        if first == last:
+            base = first * self.block_size
+            return self.block(first)[lo - base:hi - base]
+        parts = [self.block(b) for b in range(first, last + 1)]
+        base = first * self.block_size
+        return np.concatenate(parts)[lo - base:hi - base]
+    
+    def sentence(self, i: int) -> np.ndarray:
+        """Phoneme IDs of sentence i."""
+        return self.slice(self.offsets[i], self.offsets[i + 1])
+    
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self.sentence(i)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.sentence(i)
+    
+    def pack(self) -> 'CorpusArray':
+        """Packed-storage copy (self if already packed)."""
+        if self.storage == STORAGE_PACKED:
+            return self
+        return CorpusArray(self._ids, self.offsets, STORAGE_PACKED, self.block_size)
+    
+    def unpack(self) -> 'CorpusArray':
+        """Plain-storage copy (self if already plain)."""
+        if self.storage == STORAGE_PLAIN:
+            return self
+        return CorpusArray(self.ids, self.offsets, STORAGE_PLAIN, self.block_size)
+    
+    def save(self, path):
+        """Write to an .npz file, keeping the storage mode."""
+        buffer = self._packed if self.storage == STORAGE_PACKED else self._ids
+        np.savez(
+            path,
+            buffer=buffer,
+            offsets=self.offsets,
+            storage=np.array(self.storage),
+            block_size=np.array(self.block_size),
+        )
+    
+    @classmethod
+    def load(cls, path) -> 'CorpusArray':
+        """Read a file written by save(); packed data stays packed."""
+        with np.load(path) as data:
+            storage = str(data['storage'])
+            offsets = data['offsets']
+            block_size = int(data['block_size'])
+            buffer = data['buffer']
+        
+        # Adopt packed bytes as-is rather than unpacking and repacking
+        corpus = cls.__new__(cls)
+        corpus._init_buffer(buffer, offsets, storage, block_size, int(offsets[-1]))
+        return corpus
 
 
 # =============================================================================
@@ -6,13 +6,48 @@ Thesaurus Linguae Aegyptiae database.
 """
 
 import json
+from bisect import bisect_left
 from pathlib import Path
-from typing import List, Dict, Optional, Iterator
+from typing import List, Dict, Optional, Iterator, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+from .instrument import span, stage
 from .mapping import leiden_to_wheel, phonemes_to_verbs
 
 
+# Historical periods, oldest first. A sentence belongs to the first period
+# whose upper bound its date_not_before does not exceed.
+PERIODS = [
+    "Early Dynastic",
+    "Old Kingdom",
+    "First Intermediate",
+    "Middle Kingdom",
+    "Late",
+]
+PERIOD_BOUNDS = [-2686, -2181, -2055, -1650]  # inclusive upper bounds
+PERIOD_CODES = {name: code for code, name in enumerate(PERIODS)}
+
+
+def period_code(date_not_before: int) -> int:
+    """Index into PERIODS for a date."""
+    return bisect_left(PERIOD_BOUNDS, date_not_before)
+
+
+def period_codes(dates_not_before: np.ndarray) -> np.ndarray:
+    """Vectorized period_code: uint8 index into PERIODS per date."""
+    return np.searchsorted(PERIOD_BOUNDS, dates_not_before, side='left').astype(np.uint8)
+
+
+def period_range(period: str) -> Tuple[float, float]:
+    """Inclusive (low, high) date_not_before range of a period."""
+    code = PERIOD_CODES[period]
+    low = PERIOD_BOUNDS[code - 1] + 1 if code > 0 else -np.inf
+    high = PERIOD_BOUNDS[code] if code < len(PERIOD_BOUNDS) else np.inf
+    return low, high
+
+
 @dataclass
 class Sentence:
     """A single Egyptian sentence with all metadata."""
@@ -47,16 +82,7 @@ class Sentence:
     @property
     def period(self) -> str:
         """Historical period classification."""
-        if self.date_not_before <= -2686:
-            return "Early Dynastic"
-        elif self.date_not_before <= -2181:
-            return "Old Kingdom"
-        elif self.date_not_before <= -2055:
-            return "First Intermediate"
-        elif self.date_not_before <= -1650:
-            return "Middle Kingdom"
-        else:
-            return "Late"
+        return PERIODS[period_code(self.date_not_before)]
 
 
 # Module-level corpus cache
@@ -87,7 +113,7 @@ def load_tla_corpus(path: Optional[str] = None) -> List[Sentence]:
         return _corpus
     
     sentences = []
-    with open(path, 'r', encoding='utf-8') as f:
+    with span("corpus.load_tla") as s, open(path, 'r', encoding='utf-8') as f:
         for line in f:
             row = json.loads(line)
             sent = Sentence(
@@ -101,12 +127,177 @@ def load_tla_corpus(path: Optional[str] = None) -> List[Sentence]:
                 date_not_after=int(row['dateNotAfter']) if row['dateNotAfter'] else -1500,
             )
             sentences.append(sent)
+        s.items = len(sentences)
     
     _corpus = sentences
     _corpus_path = path
     return sentences
 
 
+# =============================================================================
+# DATE INDEX
+# =============================================================================
+
+class DateIndex:
+    """
+    Corpus rows ordered by date_not_before, for O(log n) date slicing.
+    
+    Row IDs are positions in the indexed sentence list. Date-window
+    lookups return rows oldest first (ties in corpus order); exact
+    (not_before, not_after) lookups return rows in corpus order.
+    """
+    
+    def __init__(self, sentences: List[Sentence]):
+        self.sentences = sentences
+        self.date_not_before = np.array([s.date_not_before for s in sentences], dtype=np.int64)
+        self.date_not_after = np.array([s.date_not_after for s in sentences], dtype=np.int64)
+        self.period_codes = period_codes(self.date_not_before)
+        
+        # Row IDs sorted by date, and the dates in that order
+        self.order = np.argsort(self.date_not_before, kind='stable')
+        self.sorted_not_before = self.date_not_before[self.order]
+        
+        # Exact date pair → row IDs (corpus order)
+        self.exact: Dict[Tuple[int, int], np.ndarray] = {}
+        pairs: Dict[Tuple[int, int], List[int]] = {}
+        for row, key in enumerate(zip(self.date_not_before.tolist(), self.date_not_after.tolist())):
+            pairs.setdefault(key, []).append(row)
+        for key, rows in pairs.items():
+            self.exact[key] = np.array(rows, dtype=np.int64)
+    
+    def __len__(self) -> int:
+        return len(self.sentences)
+    
+    def exact_rows(self, not_before: int, not_after: int) -> np.ndarray:
+        """Rows dated exactly (not_before, not_after), e.g. one reign."""
+        return self.exact.get((not_before, not_after), np.empty(0, dtype=np.int64))
+    
+    def window(self, start: float = -np.inf, end: float = np.inf, period: str = None) -> np.ndarray:
+        """
+        Rows whose date_not_before lies in [start, end], oldest first.
+        
+        Args:
+            start: Earliest date_not_before (inclusive)
+            end: Latest date_not_before (inclusive)
+            period: Optionally also restrict to one of PERIODS
+        """
+        if period is not None:
+            low, high = period_range(period)
+            start, end = max(start, low), min(end, high)
+        lo = np.searchsorted(self.sorted_not_before, start, side='left')
+        hi = np.searchsorted(self.sorted_not_before, end, side='right')
+        return self.order[lo:max(lo, hi)]
+    
+    def period_rows(self, period: str) -> np.ndarray:
+        """Rows of one period, oldest first."""
+        return self.window(period=period)
+    
+    def select(
+        self,
+        order: str = 'oldest',
+        n: Optional[int] = None,
+        start: float = -np.inf,
+        end: float = np.inf,
+        period: str = None,
+    ) -> np.ndarray:
+        """
+        The n oldest or newest rows of a date window.
+        
+        Reads straight off the cached date ordering, so the cost is
+        O(log N + n) rather than a sort. Ties keep corpus order in both
+        directions, matching sorted(..., key=date, reverse=...).
+        
+        Args:
+            order: 'oldest' or 'newest'
+            n: Rows to return (None = the whole window)
+            start, end, period: Window, as for window()
+        """
+        if order not in ('oldest', 'newest'):
+            raise ValueError(f"order must be 'oldest' or 'newest', not {order!r}")
+        
+        rows = self.window(start, end, period)
+        if n is None or n >= len(rows):
+            n = len(rows)
+        if n <= 0:
+            return rows[:0]
+        if order == 'oldest':
+            return rows[:n]
+        
+        # Newest: the tail of the window, widened to the whole tie group at
+        # its oldest date, re-sorted newest first with ties in corpus order
+        dates = self.date_not_before[rows]
+        lo = np.searchsorted(dates, dates[len(rows) - n], side='left')
+        tail = rows[lo:]
+        return tail[np.argsort(-dates[lo:], kind='stable')][:n]
+    
+    def take(self, rows: np.ndarray) -> List[Sentence]:
+        """Sentences for a row ID array."""
+        return [self.sentences[i] for i in rows.tolist()]
+
+
+# Module-level date index cache (rebuilt when the corpus changes)
+_date_index: DateIndex = None
+
+
+def get_date_index(corpus: Optional[List[Sentence]] = None) -> DateIndex:
+    """
+    Date index over a corpus (default: the loaded TLA corpus).
+    
+    Built once per corpus list and cached.
+    """
+    global _date_index
+    
+    if corpus is None:
+        corpus = load_tla_corpus()
+    if _date_index is None or _date_index.sentences is not corpus:
+        _date_index = DateIndex(corpus)
+    return _date_index
+
+
+def sentences_between(
+    start: float = -np.inf,
+    end: float = np.inf,
+    period: str = None,
+) -> List[Sentence]:
+    """
+    Sentences with date_not_before in [start, end], oldest first.
+    
+    Example:
+        >>> sentences_between(-2400, -2300, period="Old Kingdom")
+    """
+    index = get_date_index()
+    return index.take(index.window(start, end, period))
+
+
+def sentences_by_date(
+    order: str = 'oldest',
+    n: Optional[int] = None,
+    window=None,
+) -> List[Sentence]:
+    """
+    The n oldest or newest sentences, optionally within a date window.
+    
+    Args:
+        order: 'oldest' or 'newest'
+        n: Number of sentences (None = all in the window)
+        window: None, a period name, or an inclusive (start, end) range
+                of date_not_before
+    
+    Example:
+        >>> sentences_by_date('newest', 10, window="Old Kingdom")
+        >>> sentences_by_date('oldest', 50, window=(-2400, -2300))
+    """
+    index = get_date_index()
+    if window is None:
+        rows = index.select(order, n)
+    elif isinstance(window, str):
+        rows = index.select(order, n, period=window)
+    else:
+        start, end = window
+        rows = index.select(order, n, start, end)
+    return index.take(rows)
+
+
 def search_corpus(
     query: str = None,
     phoneme_pattern: List[str] = None,
@@ -128,13 +319,23 @@ def search_corpus(
     corpus = load_tla_corpus()
     count = 0
     
-    for sent in corpus:
+    # Period filter: slice the date index, then restore corpus order
+    if period:
+        if period not in PERIOD_CODES:
+            return
+        rows = np.sort(get_date_index(corpus).period_rows(period)).tolist()
+        candidates = (corpus[i] for i in rows)
+    else:
+        candidates = corpus
+    
+    q = query.lower() if query else None
+    
+    for sent in candidates:
         if count >= limit:
             break
             
         # Text query
-        if query:
-            q = query.lower()
+        if q:
             if q not in sent.transliteration.lower() and q not in sent.translation.lower():
                 continue
         
@@ -143,11 +344,6 @@ def search_corpus(
             if sent.phonemes[:len(phoneme_pattern)] != phoneme_pattern:
                 continue
         
-        # Period filter
-        if period:
-            if sent.period != period:
-                continue
-        
         yield sent
         count += 1
 
@@ -201,12 +397,13 @@ def load_semantic_network() -> dict:
         return _semantic_network
     
     path = Path(__file__).parent / 'data' / 'semantic_network.json'
-    with open(path, 'r', encoding='utf-8') as f:
+    with span("corpus.load_semantic_network"), open(path, 'r', encoding='utf-8') as f:
         _semantic_network = json.load(f)
     
     return _semantic_network
 
 
+@stage("corpus.edge_signature")
 def get_edge_signature(source: str, target: str) -> dict:
     """
     Get semantic signature for a directed edge.
@@ -0,0 +1,181 @@
+"""
+Stage-level instrumentation.
+
+Named stages across mapping, bitwise, corpus and pyramid record call
+counts, cumulative nanoseconds and items processed into an in-process
+registry, so the time inside a decode request can be split into
+tokenizing, mapping, ID encoding, layer gather, prose rendering and
+JSON loading.
+
+Off by default. Switch on with the EYE_OF_HORUS_INSTRUMENT environment
+variable (any value but '', '0', 'false', 'no', 'off') or at run time:
+
+    >>> from eye_of_horus import instrument
+    >>> instrument.enable()
+    >>> translate("ꜥnḫ wḏꜣ snb")
+    >>> instrument.snapshot()['mapping.tokenize']
+    {'calls': 1, 'ns': 5120, 'items': 11}
+
+Instrumented functions are always the recording wrapper, so references
+taken anywhere (e.g. `from eye_of_horus import translate` in user code)
+follow the switch; while disabled a wrapper only checks a flag before
+calling through.
+
+Stages are nested freely: 'pyramid.translate' includes the time of the
+'mapping.*' stages it calls.
+"""
+
+import os
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict, Optional
+
+ENV_VAR = "EYE_OF_HORUS_INSTRUMENT"
+
+
+def _env_enabled() -> bool:
+    return os.environ.get(ENV_VAR, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+
+class StageStats:
+    """Running totals for one named stage."""
+    
+    __slots__ = ("calls", "ns", "items")
+    
+    def __init__(self):
+        self.calls = 0
+        self.ns = 0
+        self.items = 0
+    
+    def as_dict(self) -> Dict[str, int]:
+        return {"calls": self.calls, "ns": self.ns, "items": self.items}
+
+
+# Registry state
+_enabled = _env_enabled()
+_stages: Dict[str, StageStats] = {}
+_lock = threading.Lock()
+
+
+def enable():
+    """Start recording stages."""
+    global _enabled
+    with _lock:
+        _enabled = True
+
+
+def disable():
+    """Stop recording stages (totals so far are kept)."""
+    global _enabled
+    with _lock:
+        _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def record(name: str, ns: int, items: int = 0):
+    """Add one call of `ns` nanoseconds over `items` items to a stage."""
+    with _lock:
+        stats = _stages.get(name)
+        if stats is None:
+            stats = _stages[name] = StageStats()
+        stats.calls += 1
+        stats.ns += ns
+        stats.items += items
+
+
+def reset():
+    """Clear every stage's totals."""
+    with _lock:
+        _stages.clear()
+
+
+def snapshot() -> Dict[str, Dict[str, int]]:
+    """
+    Copy of the registry: {stage: {'calls', 'ns', 'items'}}.
+    
+    Stages are listed in name order.
+    """
+    with _lock:
+        return {name: _stages[name].as_dict() for name in sorted(_stages)}
+
+
+def export(reset_after: bool = False) -> Dict:
+    """
+    Registry as a plain dict for external metrics.
+    
+    Args:
+        reset_after: Clear the totals once read (for interval reporting)
+    
+    Returns:
+        {'enabled': bool, 'stages': snapshot()}
+    """
+    with _lock:
+        stages = {name: _stages[name].as_dict() for name in sorted(_stages)}
+        if reset_after:
+            _stages.clear()
+    return {"enabled": _enabled, "stages": stages}
+
+
+def stage(name: str, items: Optional[Callable] = None):
+    """
+    Decorator recording each call of a function as stage `name`.
+    
+    Args:
+        name: Stage name, '<module>.<stage>' by convention
+        items: Optional items(result, *args, **kwargs) -> int, the
+               amount of work a call processed (e.g. phonemes)
+    
+    Example:
+        >>> @stage("mapping.tokenize", items=lambda result, translit: len(translit))
+        ... def _clean_transliteration(translit): ...
+    """
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            
+            t0 = time.perf_counter_ns()
+            result = fn(*args, **kwargs)
+            elapsed = time.perf_counter_ns() - t0
+            record(name, elapsed, items(result, *args, **kwargs) if items else 0)
+            return result
+        
+        return wrapper
+    
+    return decorate
+
+
+class span:
+    """
+    Context manager recording a block as stage `name`.
+    
+    For stages that are part of a function rather than a whole one.
+    Set `items` on the span inside the block to count work done.
+    
+    Example:
+        >>> with span("corpus.load_tla") as s:
+        ...     sentences = [parse(line) for line in f]
+        ...     s.items = len(sentences)
+    """
+    
+    __slots__ = ("name", "items", "_t0")
+    
+    def __init__(self, name: str, items: int = 0):
+        self.name = name
+        self.items = items
+        self._t0 = 0
+    
+    def __enter__(self):
+        if _enabled:
+            self._t0 = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc):
+        if _enabled and self._t0:
+            record(self.name, time.perf_counter_ns() - self._t0, self.items)
+        return False
@@ -29,8 +29,11 @@ Spine phonemes (NOT on wheel): x, d, k, q, g, f, h
 """
 
 import re
+import hashlib
 from typing import List
 
+from .instrument import span, stage
+
 # The 16 wheel phonemes in order
 WHEEL_16 = ['n', 'w', 's', 'sh', 'A', 't', 'H', 'r', 'm', 'a', 'y', 'b', 'p', 'i', 'kh', 'dj']
 
@@ -180,6 +183,27 @@ def leiden_to_wheel(translit: str, keep_words: bool = False) -> List[str]:
     Returns:
         List of phonemes (wheel + spine)
     """
+    clean = _clean_transliteration(translit)
+    
+    with span("mapping.convert") as s:
+        if keep_words:
+            words = clean.split()
+            result = []
+            for word in words:
+                phonemes = _convert_word(word)
+                if phonemes:
+                    result.append((word, phonemes))
+                    s.items += len(phonemes)
+            return result
+        else:
+            result = _convert_word(clean.replace(' ', ''))
+            s.items = len(result)
+            return result
+
+
+@stage("mapping.tokenize", items=lambda clean, translit: len(translit))
+def _clean_transliteration(translit: str) -> str:
+    """Lowercased transliteration with editorial marks removed."""
     # Clean: remove parentheses content, =suffixes, punctuation, numbers
     # Also remove grammatical markers like .PL (plural) and .DU (dual)
     clean = re.sub(r'\([^)]*\)', '', translit)  # remove (...)
@@ -187,18 +211,7 @@ def leiden_to_wheel(translit: str, keep_words: bool = False) -> List[str]:
     clean = re.sub(r'\.(PL|DU|SG)', '', clean)  # remove .PL, .DU, .SG markers
     clean = re.sub(r'[.:\-+~0-9/!]', '', clean)  # remove punctuation
     clean = re.sub(r'[𓍹𓍺]', '', clean)          # remove cartouche markers
-    clean = clean.lower().strip()
-    
-    if keep_words:
-        words = clean.split()
-        result = []
-        for word in words:
-            phonemes = _convert_word(word)
-            if phonemes:
-                result.append((word, phonemes))
-        return result
-    else:
-        return _convert_word(clean.replace(' ', ''))
+    return clean.lower().strip()
 
 
 def _convert_word(word: str) -> List[str]:
@@ -223,11 +236,34 @@ def is_spine_phoneme(p: str) -> bool:
     return p in SPINE_VERBS
 
 
+@stage("mapping.verbs", items=lambda verbs, phonemes: len(verbs))
 def phonemes_to_verbs(phonemes: List[str]) -> List[str]:
     """Convert phoneme sequence to verb sequence."""
     return [ALL_VERBS.get(p, f'?{p}') for p in phonemes]
 
 
+# (fast in-process hash, stable fingerprint) of the last lexicon seen
+_lexicon_version = None
+
+
+def lexicon_version() -> str:
+    """
+    Fingerprint of the current lexicon (Leiden map and verb tables).
+    
+    Changes whenever a mapping or verb entry is edited, so caches keyed
+    on it never serve translations from an older lexicon. The fingerprint
+    is stable across processes; it is only re-hashed when the tables change.
+    """
+    global _lexicon_version
+    
+    key = hash((tuple(LEIDEN_TO_WHEEL.items()), tuple(ALL_VERBS.items())))
+    if _lexicon_version is None or _lexicon_version[0] != key:
+        payload = repr((sorted(LEIDEN_TO_WHEEL.items()), sorted(ALL_VERBS.items())))
+        _lexicon_version = (key, hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12])
+    
+    return _lexicon_version[1]
+
+
 def wheel_trajectory(translit: str) -> str:
     """
     Generate a semantic trajectory from transliteration.
@@ -10,12 +10,42 @@ Bidirectional reading:
 - Reverse (R→L): Descending, decohering, dissolving — undoing
 """
 
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from multiprocessing import Pool
+from pathlib import Path
+from string import Formatter
+from typing import List, Dict, Tuple, Optional, Iterator, Iterable, Sequence
+from dataclasses import dataclass, asdict
 
-from .corpus import Sentence, load_tla_corpus
-from .mapping import WHEEL_VERBS, leiden_to_wheel, phonemes_to_verbs
+import numpy as np
+
+from .corpus import Sentence, load_tla_corpus, get_date_index
+from .mapping import (
+    WHEEL_VERBS, ALL_VERBS, leiden_to_wheel, phonemes_to_verbs, lexicon_version,
+)
 from .engine import get_hourglass, Mode, Pole
+from .instrument import span, stage
+from .bitwise import (
+    PHONEME_TO_ID,
+    ID_TO_PHONEME,
+    NUM_PHONEMES,
+    NUM_WHEEL,
+    Layer,
+    VERB_TABLE,
+    DIRECTION_BOTH,
+    DIRECTION_PENETRATE,
+    CorpusArray,
+    LayeredResult,
+    encode_phonemes,
+    offsets_from_lengths,
+    sentence_index,
+    layer_addresses,
+    decode_layered as decode_layered_ids,
+)
 
 
 # =============================================================================
@@ -116,140 +146,259 @@ def _imperative(verb: str) -> str:
     return v
 
 
-def translate_to_readable(verbs: List[str], direction: str = "ascend") -> str:
+# =============================================================================
+# COMPILED PROSE RENDERER
+# =============================================================================
+#
+# Templates use {<form><slot>} fields: n=noun, g=gerund, t=third person,
+# i=imperative; upper-case N/G/I are the capitalized forms. They are
+# compiled once into positional format strings, and every verb's forms
+# are precomputed into tables indexed by verb ID.
+
+# Ascending patterns: building, rising, becoming
+# Descending patterns: returning, dissolving, surrendering
+READABLE_TEMPLATES = {
+    'ascend': {
+        5: [
+            "From {n0}, {n1} rises into {n2}—{g3}, {g4}.",
+            "{N0} opens to {n1}. {N2} meets {n3}, and {n4} dawns.",
+            "As {n0} {t1}, {n2} {t3} toward {n4}.",
+            "Here: {n0}, {n1}, {n2}. Then {n3} becoming {n4}.",
+            "{I0}, {i1}, {i2}—until {n3} {t4}.",
+        ],
+        4: [
+            "{N0} and {n1} entwine; {n2} {t3}.",
+            "Through {g0}, {n1} finds {n2}. {N3} follows.",
+            "{G0} into {g1}—{n2} reveals {n3}.",
+        ],
+        3: [
+            "{N0}, {n1}, {n2}.",
+            "In {n0}: {n1} and {n2}.",
+            "{G0}, {g1}, {g2}.",
+        ],
+        2: [
+            "{N0} becomes {n1}.",
+            "From {n0}, {n1}.",
+        ],
+        1: [
+            "{N0}.",
+            "And {n0}.",
+        ],
+    },
+    'descend': {
+        5: [
+            "{N0} returns through {n1} into {n2}—{g3}, {g4}.",
+            "Down from {n0}: {n1} folds into {n2}, {n3} dissolves to {n4}.",
+            "As {n0} releases, {n1} {t2} back toward {n3}, finding {n4}.",
+            "{N0} surrenders to {n1}. {N2} meets {n3}, returning to {n4}.",
+            "Release {n0}, release {n1}—{n2} {t3} home to {n4}.",
+        ],
+        4: [
+            "{N0} unwinds to {n1}; {n2} returns to {n3}.",
+            "Releasing {n0}, {n1} softens to {n2}, then {n3}.",
+            "From {n0} back through {n1}—{n2} finds {n3}.",
+        ],
+        3: [
+            "{N0} to {n1} to {n2}.",
+            "Back through {n0}, {n1}, {n2}.",
+            "{N0} dissolves: {n1}, then {n2}.",
+        ],
+        2: [
+            "{N0} returns to {n1}.",
+            "{N0} and {n1}, at rest.",
+        ],
+        1: [
+            "{N0}.",
+            "And {n0}.",
+        ],
+    },
+}
+
+# Form letter → column in the verb form table
+_FORM_COLUMNS = {'n': 0, 'N': 1, 'g': 2, 'G': 3, 't': 4, 'i': 5, 'I': 6}
+
+
+def _compile_template(template: str) -> Tuple[str, List[Tuple[int, int]]]:
     """
-    Translate verb sequence into flowing readable English.
+    Turn '{n0} meets {t1}' into ('{} meets {}', [(noun, 0), (third, 1)]).
+    """
+    fmt = []
+    fields = []
+    for literal, field, _, _ in Formatter().parse(template):
+        fmt.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field is not None:
+            fmt.append('{}')
+            fields.append((_FORM_COLUMNS[field[0]], int(field[1:])))
+    return ''.join(fmt), fields
+
+
+_COMPILED_TEMPLATES = {
+    direction: {
+        size: [_compile_template(t) for t in templates]
+        for size, templates in by_size.items()
+    }
+    for direction, by_size in READABLE_TEMPLATES.items()
+}
+
+
+def _verb_forms(verb: str) -> Tuple[str, ...]:
+    """All template forms of a verb, in _FORM_COLUMNS order."""
+    noun, gerund = _noun(verb), _gerund(verb)
+    imperative = _imperative(verb)
+    return (
+        noun, noun.capitalize(),
+        gerund, gerund.capitalize(),
+        _third(verb),
+        imperative, imperative.capitalize(),
+    )
+
+
+class _VerbForms:
+    """
+    Verb ID registry with precomputed forms.
     
-    Uses varied sentence structures for natural, poetic prose.
+    IDs are keyed by lower-cased verb, so 'SHINE' and 'shine' share one.
+    Each verb also has the ID of its intensified 'x upon x' phrase, used
+    for an immediate repeat within a chunk. The registry holds the
+    lexicon only; verbs outside it are given IDs past its end for one
+    call (see encode) and never stored, so arbitrary input cannot grow it.
     """
-    if not verbs:
-        return ""
     
-    sentences = []
-    i = 0
-    pattern_idx = 0
-    
-    # Ascending patterns: building, rising, becoming
-    ascend_patterns = [
-        # 5-verb patterns
-        lambda v: f"From {_noun(v[0])}, {_noun(v[1])} rises into {_noun(v[2])}—{_gerund(v[3])}, {_gerund(v[4])}.",
-        lambda v: f"{_noun(v[0]).capitalize()} opens to {_noun(v[1])}. {_noun(v[2]).capitalize()} meets {_noun(v[3])}, and {_noun(v[4])} dawns.",
-        lambda v: f"As {_noun(v[0])} {_third(v[1])}, {_noun(v[2])} {_third(v[3])} toward {_noun(v[4])}.",
-        lambda v: f"Here: {_noun(v[0])}, {_noun(v[1])}, {_noun(v[2])}. Then {_noun(v[3])} becoming {_noun(v[4])}.",
-        lambda v: f"{_imperative(v[0]).capitalize()}, {_imperative(v[1])}, {_imperative(v[2])}—until {_noun(v[3])} {_third(v[4])}.",
-    ]
-    
-    # Descending patterns: returning, dissolving, surrendering  
-    descend_patterns = [
-        lambda v: f"{_noun(v[0]).capitalize()} returns through {_noun(v[1])} into {_noun(v[2])}—{_gerund(v[3])}, {_gerund(v[4])}.",
-        lambda v: f"Down from {_noun(v[0])}: {_noun(v[1])} folds into {_noun(v[2])}, {_noun(v[3])} dissolves to {_noun(v[4])}.",
-        lambda v: f"As {_noun(v[0])} releases, {_noun(v[1])} {_third(v[2])} back toward {_noun(v[3])}, finding {_noun(v[4])}.",
-        lambda v: f"{_noun(v[0]).capitalize()} surrenders to {_noun(v[1])}. {_noun(v[2]).capitalize()} meets {_noun(v[3])}, returning to {_noun(v[4])}.",
-        lambda v: f"Release {_noun(v[0])}, release {_noun(v[1])}—{_noun(v[2])} {_third(v[3])} home to {_noun(v[4])}.",
-    ]
-    
-    # 4-verb patterns
-    four_patterns_asc = [
-        lambda v: f"{_noun(v[0]).capitalize()} and {_noun(v[1])} entwine; {_noun(v[2])} {_third(v[3])}.",
-        lambda v: f"Through {_gerund(v[0])}, {_noun(v[1])} finds {_noun(v[2])}. {_noun(v[3]).capitalize()} follows.",
-        lambda v: f"{_gerund(v[0]).capitalize()} into {_gerund(v[1])}—{_noun(v[2])} reveals {_noun(v[3])}.",
-    ]
-    
-    four_patterns_desc = [
-        lambda v: f"{_noun(v[0]).capitalize()} unwinds to {_noun(v[1])}; {_noun(v[2])} returns to {_noun(v[3])}.",
-        lambda v: f"Releasing {_noun(v[0])}, {_noun(v[1])} softens to {_noun(v[2])}, then {_noun(v[3])}.",
-        lambda v: f"From {_noun(v[0])} back through {_noun(v[1])}—{_noun(v[2])} finds {_noun(v[3])}.",
-    ]
-    
-    # 3-verb patterns
-    three_patterns_asc = [
-        lambda v: f"{_noun(v[0]).capitalize()}, {_noun(v[1])}, {_noun(v[2])}.",
-        lambda v: f"In {_noun(v[0])}: {_noun(v[1])} and {_noun(v[2])}.",
-        lambda v: f"{_gerund(v[0]).capitalize()}, {_gerund(v[1])}, {_gerund(v[2])}.",
-    ]
-    
-    three_patterns_desc = [
-        lambda v: f"{_noun(v[0]).capitalize()} to {_noun(v[1])} to {_noun(v[2])}.",
-        lambda v: f"Back through {_noun(v[0])}, {_noun(v[1])}, {_noun(v[2])}.",
-        lambda v: f"{_noun(v[0]).capitalize()} dissolves: {_noun(v[1])}, then {_noun(v[2])}.",
-    ]
-    
-    # 2-verb patterns
-    two_patterns_asc = [
-        lambda v: f"{_noun(v[0]).capitalize()} becomes {_noun(v[1])}.",
-        lambda v: f"From {_noun(v[0])}, {_noun(v[1])}.",
-    ]
-    
-    two_patterns_desc = [
-        lambda v: f"{_noun(v[0]).capitalize()} returns to {_noun(v[1])}.",
-        lambda v: f"{_noun(v[0]).capitalize()} and {_noun(v[1])}, at rest.",
-    ]
-    
-    # 1-verb patterns
-    one_patterns = [
-        lambda v: f"{_noun(v[0]).capitalize()}.",
-        lambda v: f"And {_noun(v[0])}.",
-    ]
+    def __init__(self, lexicon):
+        self.ids: Dict[str, int] = {}
+        self.forms: List[List[str]] = [[] for _ in _FORM_COLUMNS]
+        self.upon: List[int] = []
+        self._upon_ids: Optional[np.ndarray] = None
+        for verb in lexicon:
+            key = verb.lower()
+            if key not in self.ids:
+                self.ids[key] = self._add(key)
+            self.ids[verb] = self.ids[key]
+    
+    def _append(self, verb: str) -> int:
+        index = len(self.upon)
+        for column, form in zip(self.forms, _verb_forms(verb)):
+            column.append(form)
+        self.upon.append(index)
+        self._upon_ids = None
+        return index
+    
+    def _add(self, verb: str) -> int:
+        """Append a verb and its 'x upon x' phrase; returns the verb's ID."""
+        index = self._append(verb)
+        noun = self.forms[0][index]
+        self.upon[index] = self._append(f"{noun} upon {noun}")
+        return index
+    
+    @property
+    def upon_ids(self) -> np.ndarray:
+        """self.upon as an int64 array, rebuilt only after the table grows."""
+        if self._upon_ids is None:
+            self._upon_ids = np.asarray(self.upon, dtype=np.int64)
+        return self._upon_ids
+    
+    def id(self, verb: str) -> Optional[int]:
+        """ID of a lexicon verb (any case), or None."""
+        index = self.ids.get(verb)
+        if index is None:
+            index = self.ids.get(verb.lower())
+        return index
+    
+    def encode(self, verbs: List[str], extra: Optional[List[str]] = None) -> np.ndarray:
+        """
+        Verb strings → ID array.
+        
+        Verbs outside the lexicon are appended (lower-cased, once each)
+        to `extra` and numbered past the registry: extra[k] gets ID
+        len(self.upon) + 2k. Pass the same list to render_verb_ids.
+        Without `extra`, an unknown verb raises KeyError.
+        """
+        get = self.ids.get
+        ids = [get(v) for v in verbs]
+        if None in ids:
+            if extra is None:
+                raise KeyError(verbs[ids.index(None)])
+            base = len(self.upon)
+            for i, index in enumerate(ids):
+                if index is None:
+                    index = self.id(verbs[i])
+                if index is None:
+                    key = verbs[i].lower()
+                    if key not in extra:
+                        extra.append(key)
+                    index = base + 2 * extra.index(key)
+                ids[i] = index
+        return np.array(ids, dtype=np.int64)
+    
+    def tables(self, extra: List[str]) -> Tuple[List[List[str]], np.ndarray]:
+        """Forms and upon IDs covering the registry plus `extra` verbs."""
+        if not extra:
+            return self.forms, self.upon_ids
+        overlay = _VerbForms(())
+        base = len(self.upon)
+        for verb in extra:
+            overlay._add(verb)
+        forms = [column + more for column, more in zip(self.forms, overlay.forms)]
+        return forms, np.concatenate([self.upon_ids, overlay.upon_ids + base])
+
+
+def _lexicon_verbs() -> List[str]:
+    verbs = [v for v in dict.fromkeys(VERB_TABLE.tolist()) if v]
+    return verbs + [v.upper() for v in VERB_FORMS]
+
+
+READABLE_VERBS = _VerbForms(_lexicon_verbs())
+
+
+@stage("pyramid.render", items=lambda prose, verb_ids, *args, **kwargs: len(verb_ids))
+def render_verb_ids(
+    verb_ids: np.ndarray,
+    direction: str = "ascend",
+    extra: Sequence[str] = (),
+) -> str:
+    """
+    Render prose from an array of READABLE_VERBS IDs.
+    
+    Same output as translate_to_readable on the corresponding verbs.
+    `extra` is the list READABLE_VERBS.encode filled with verbs outside
+    the lexicon.
+    """
+    n = len(verb_ids)
+    if n == 0:
+        return ""
     
     is_ascending = direction.lower() in ('ascend', 'ascending', 'forward')
+    templates = _COMPILED_TEMPLATES['ascend' if is_ascending else 'descend']
     
-    def get_chunk(size):
-        """Get chunk, handling immediate repeats gracefully."""
-        chunk = verbs[i:i+size]
-        result = []
-        prev = None
-        for v in chunk:
-            if v.lower() == prev:
-                # Immediate repeat - intensify
-                n = _noun(v)
-                result.append(f"{n} upon {n}")
-            else:
-                result.append(v)
-            prev = v.lower()
-        return result
+    # Immediate repeats inside a 5-verb chunk read as 'x upon x'
+    forms, upon = READABLE_VERBS.tables(list(extra))
+    verb_ids = np.asarray(verb_ids, dtype=np.int64)
+    repeat = np.zeros(n, dtype=bool)
+    repeat[1:] = verb_ids[1:] == verb_ids[:-1]
+    repeat[::5] = False
+    slots = np.where(repeat, upon[verb_ids], verb_ids).tolist()
     
-    while i < len(verbs):
-        remaining = len(verbs) - i
-        
-        if remaining >= 5:
-            chunk = get_chunk(5)
-            patterns = ascend_patterns if is_ascending else descend_patterns
-            sentence = patterns[pattern_idx % len(patterns)](chunk)
-            i += 5
-            pattern_idx += 1
-            
-        elif remaining == 4:
-            chunk = get_chunk(4)
-            patterns = four_patterns_asc if is_ascending else four_patterns_desc
-            sentence = patterns[pattern_idx % len(patterns)](chunk)
-            i += 4
-            pattern_idx += 1
-            
-        elif remaining == 3:
-            chunk = get_chunk(3)
-            patterns = three_patterns_asc if is_ascending else three_patterns_desc
-            sentence = patterns[pattern_idx % len(patterns)](chunk)
-            i += 3
-            pattern_idx += 1
-            
-        elif remaining == 2:
-            chunk = get_chunk(2)
-            patterns = two_patterns_asc if is_ascending else two_patterns_desc
-            sentence = patterns[pattern_idx % len(patterns)](chunk)
-            i += 2
-            pattern_idx += 1
-            
-        else:
-            chunk = get_chunk(1)
-            sentence = one_patterns[pattern_idx % len(one_patterns)](chunk)
-            i += 1
-            pattern_idx += 1
-        
-        sentences.append(sentence)
+    sentences = []
+    for chunk, base in enumerate(range(0, n, 5)):
+        patterns = templates[min(5, n - base)]
+        fmt, fields = patterns[chunk % len(patterns)]
+        sentences.append(fmt.format(*[forms[col][slots[base + slot]] for col, slot in fields]))
     
     return '\n'.join(sentences)
 
 
+def translate_to_readable(verbs: List[str], direction: str = "ascend") -> str:
+    """
+    Translate verb sequence into flowing readable English.
+    
+    Uses varied sentence structures for natural, poetic prose.
+    """
+    if not verbs:
+        return ""
+    extra = []
+    return render_verb_ids(READABLE_VERBS.encode(verbs, extra), direction, extra)
+
+
 # Cache for pyramid texts
 _pyramid_texts: List[Sentence] = None
 
@@ -269,17 +418,33 @@ def get_pyramid_texts() -> List[Sentence]:
     if _pyramid_texts is not None:
         return _pyramid_texts
     
-    corpus = load_tla_corpus()
-    
-    # Filter for Unas reign specifically
-    _pyramid_texts = [
-        s for s in corpus
-        if s.date_not_before == -2375 and s.date_not_after == -2345
-    ]
+    # Exact Unas reign dates, looked up in the corpus date index
+    index = get_date_index(load_tla_corpus())
+    _pyramid_texts = index.take(index.exact_rows(-2375, -2345))
     
     return _pyramid_texts
 
 
+# Cache for pyramid text phoneme IDs
+_pyramid_ids: CorpusArray = None
+
+
+def get_pyramid_ids() -> CorpusArray:
+    """
+    Phoneme IDs of all Unas Pyramid Text sentences.
+    
+    Encoded once from each Sentence's cached phonemes; sentence i of
+    the CorpusArray is get_pyramid_texts()[i].
+    """
+    global _pyramid_ids
+    
+    if _pyramid_ids is not None:
+        return _pyramid_ids
+    
+    _pyramid_ids = CorpusArray.from_sentences(get_pyramid_texts())
+    return _pyramid_ids
+
+
 @dataclass
 class DecodedLine:
     """A decoded line from the Pyramid Texts."""
@@ -309,6 +474,66 @@ class BidirectionalLine:
     reverse_trajectory: str
 
 
+def _bidirectional_line(index: int, s: Sentence) -> BidirectionalLine:
+    """Decode one sentence forward (L→R) and reverse (R→L)."""
+    forward_verbs = s.verbs
+    reverse_verbs = list(reversed(s.verbs))
+    
+    return BidirectionalLine(
+        index=index,
+        hieroglyphs=s.hieroglyphs,
+        transliteration=s.transliteration,
+        phonemes=s.phonemes,
+        forward_verbs=forward_verbs,
+        forward_trajectory=' → '.join(forward_verbs),
+        reverse_verbs=reverse_verbs,
+        reverse_trajectory=' → '.join(reverse_verbs),
+    )
+
+
+def iter_bidirectional(start: int = 1, end: Optional[int] = None) -> Iterator[BidirectionalLine]:
+    """
+    Lazily decode lines bidirectionally, one line at a time.
+    
+    Args:
+        start: First line (1-based)
+        end: Last line (1-based, inclusive; default: end of corpus)
+    
+    Yields:
+        BidirectionalLine for each line
+    """
+    texts = get_pyramid_texts()
+    
+    start_idx = start - 1
+    if start_idx >= len(texts):
+        raise ValueError(f"Start line {start} exceeds corpus size {len(texts)}")
+    
+    end_idx = len(texts) if end is None else min(end, len(texts))
+    
+    for i in range(start_idx, end_idx):
+        yield _bidirectional_line(i, texts[i])
+
+
+def bidirectional_paragraphs(
+    forward_verbs: List[str],
+    reverse_verbs: List[str],
+    readable: bool = False,
+) -> Tuple[str, str]:
+    """
+    Forward (ascending) and reverse (descending) paragraphs for a verb stream.
+    
+    Args:
+        forward_verbs: Concatenated forward verbs of all lines
+        reverse_verbs: Concatenated reverse verbs of all lines
+        readable: Flowing English prose instead of woven verb clauses
+    """
+    if readable:
+        return (translate_to_readable(forward_verbs, "ascend"),
+                translate_to_readable(reverse_verbs, "descend"))
+    return (build_paragraph(forward_verbs, "ascending"),
+            build_paragraph(reverse_verbs, "descending"))
+
+
 def decode_bidirectional(
     start: int = 1,
     end: int = 9,
@@ -318,6 +543,8 @@ def decode_bidirectional(
     """
     Decode lines bidirectionally: forward (ascending) and reverse (descending).
     
+    See iter_bidirectional / BidirectionalPrinter for the streaming form.
+    
     Args:
         start: First line (1-based)
         end: Last line (1-based, inclusive)
@@ -330,60 +557,25 @@ def decode_bidirectional(
         - Forward paragraph (ascending/cohering)
         - Reverse paragraph (descending/decohering)
     """
-    texts = get_pyramid_texts()
-    
-    # Convert to 0-based
-    start_idx = start - 1
-    end_idx = end  # end is inclusive, so end_idx = end for range()
-    
-    if start_idx >= len(texts):
-        raise ValueError(f"Start line {start} exceeds corpus size {len(texts)}")
-    
-    end_idx = min(end_idx, len(texts))
-    
-    results = []
-    all_forward_verbs = []
-    all_reverse_verbs = []
-    
-    for i in range(start_idx, end_idx):
-        s = texts[i]
-        
-        # Forward (L→R)
-        forward_verbs = s.verbs
-        forward_trajectory = ' → '.join(forward_verbs)
-        
-        # Reverse (R→L)
-        reverse_verbs = list(reversed(s.verbs))
-        reverse_trajectory = ' → '.join(reverse_verbs)
-        
-        decoded = BidirectionalLine(
-            index=i,
-            hieroglyphs=s.hieroglyphs,
-            transliteration=s.transliteration,
-            phonemes=s.phonemes,
-            forward_verbs=forward_verbs,
-            forward_trajectory=forward_trajectory,
-            reverse_verbs=reverse_verbs,
-            reverse_trajectory=reverse_trajectory,
-        )
-        results.append(decoded)
-        all_forward_verbs.extend(forward_verbs)
-        all_reverse_verbs.extend(reverse_verbs)
+    collected = CollectSink()
+    sinks = [collected]
+    if verbose:
+        end_idx = min(end, len(get_pyramid_texts()))
+        sinks.append(BidirectionalPrinter(start, end_idx, readable))
     
-    # Build paragraphs
-    if readable:
-        forward_paragraph = translate_to_readable(all_forward_verbs, "ascend")
-        reverse_paragraph = translate_to_readable(all_reverse_verbs, "descend")
-    else:
-        forward_paragraph = build_paragraph(all_forward_verbs, "ascending")
-        reverse_paragraph = build_paragraph(all_reverse_verbs, "descending")
+    drain(iter_bidirectional(start, end), *sinks)
+    results = collected.records
     
-    if verbose:
-        print_bidirectional(results, forward_paragraph, reverse_paragraph, start, end_idx)
+    forward_paragraph, reverse_paragraph = bidirectional_paragraphs(
+        [v for line in results for v in line.forward_verbs],
+        [v for line in results for v in line.reverse_verbs],
+        readable,
+    )
     
     return results, forward_paragraph, reverse_paragraph
 
 
+@stage("pyramid.build_paragraph", items=lambda prose, verbs, mode: len(verbs))
 def build_paragraph(verbs: List[str], mode: str) -> str:
     """
     Build flowing prose from verb sequence.
@@ -455,27 +647,21 @@ def weave_clause(verbs: List[str]) -> str:
     return text + "."
 
 
-def print_bidirectional(
-    results: List[BidirectionalLine],
-    forward_para: str,
-    reverse_para: str,
-    start: int,
-    end: int
-):
-    """Pretty-print bidirectional decode results."""
-    
+def _print_bidirectional_header(start: int, end: int):
     print(f"\n{'='*70}")
     print(f"BIDIRECTIONAL DECODE: Lines {start}-{end}")
     print(f"{'='*70}")
-    
-    # Line-by-line
-    for line in results:
-        print(f"\n--- Line {line.index + 1} ({len(line.phonemes)} phonemes) ---")
-        print(f"𓀀 {line.hieroglyphs[:60]}{'...' if len(line.hieroglyphs) > 60 else ''}")
-        print(f"◯ {line.transliteration[:60]}{'...' if len(line.transliteration) > 60 else ''}")
-        print(f"\n↗ ASCEND:  {line.forward_trajectory}")
-        print(f"↙ DESCEND: {line.reverse_trajectory}")
-    
+
+
+def _print_bidirectional_line(line: BidirectionalLine):
+    print(f"\n--- Line {line.index + 1} ({len(line.phonemes)} phonemes) ---")
+    print(f"𓀀 {line.hieroglyphs[:60]}{'...' if len(line.hieroglyphs) > 60 else ''}")
+    print(f"◯ {line.transliteration[:60]}{'...' if len(line.transliteration) > 60 else ''}")
+    print(f"\n↗ ASCEND:  {line.forward_trajectory}")
+    print(f"↙ DESCEND: {line.reverse_trajectory}")
+
+
+def _print_bidirectional_summary(forward_para: str, reverse_para: str, counts: List[int]):
     # Aggregate paragraphs
     print(f"\n{'='*70}")
     print("ASCENDING (Forward L→R)")
@@ -490,47 +676,59 @@ def print_bidirectional(
     print(f"\n{reverse_para}")
     
     # Summary statistics
-    total_phonemes = sum(len(line.phonemes) for line in results)
     print(f"\n{'='*70}")
     print(f"STATISTICS")
     print(f"{'='*70}")
-    print(f"Lines: {len(results)}")
-    print(f"Total phonemes: {total_phonemes}")
-    print(f"Phonemes per line: {[len(line.phonemes) for line in results]}")
+    print(f"Lines: {len(counts)}")
+    print(f"Total phonemes: {sum(counts)}")
+    print(f"Phonemes per line: {counts}")
     
     # Check for Fibonacci 1+2+3+2+1=9 structure
-    if len(results) == 9:
+    if len(counts) == 9:
         fib_struct = [1, 2, 3, 2, 1]
         print(f"\n9-line Fibonacci breath: {' + '.join(map(str, fib_struct))} = 9")
 
 
-def decode(n: int, start: int = 0, verbose: bool = True) -> List[DecodedLine]:
+def print_bidirectional(
+    results: List[BidirectionalLine],
+    forward_para: str,
+    reverse_para: str,
+    start: int,
+    end: int
+):
+    """Pretty-print bidirectional decode results."""
+    _print_bidirectional_header(start, end)
+    
+    # Line-by-line
+    for line in results:
+        _print_bidirectional_line(line)
+    
+    _print_bidirectional_summary(
+        forward_para, reverse_para, [len(line.phonemes) for line in results]
+    )
+
+
+def iter_decoded(start: int = 0, n: Optional[int] = None) -> Iterator[DecodedLine]:
     """
-    Decode N lines from the Pyramid Texts starting at index `start`.
+    Lazily decode lines from the Pyramid Texts, one line at a time.
     
     Args:
-        n: Number of lines to decode
-        start: Starting index (0-based). Default 0 = first lines.
-        verbose: If True, print results as we go
-        
-    Returns:
-        List of DecodedLine objects
+        start: Starting index (0-based)
+        n: Number of lines (default: to the end of the corpus)
+    
+    Yields:
+        DecodedLine for each line
     """
     texts = get_pyramid_texts()
     
     if start >= len(texts):
         raise ValueError(f"Start index {start} exceeds corpus size {len(texts)}")
     
-    end = min(start + n, len(texts))
-    
-    results = []
-    all_phonemes = []
-    all_verbs = []
+    end = len(texts) if n is None else min(start + n, len(texts))
     
     for i in range(start, end):
         s = texts[i]
-        
-        decoded = DecodedLine(
+        yield DecodedLine(
             index=i,
             hieroglyphs=s.hieroglyphs,
             transliteration=s.transliteration,
@@ -539,41 +737,29 @@ def decode(n: int, start: int = 0, verbose: bool = True) -> List[DecodedLine]:
             verbs=s.verbs,
             trajectory=s.trajectory,
         )
-        results.append(decoded)
-        all_phonemes.extend(s.phonemes)
-        all_verbs.extend(s.verbs)
-        
-        if verbose:
-            print(f"\n{'='*60}")
-            print(f"LINE {i+1}")
-            print(f"{'='*60}")
-            print(f"𓀀 {s.hieroglyphs}")
-            print(f"◯ {s.transliteration}")
-            print(f"→ {s.translation}")
-            print(f"\nPHONEMES: {' '.join(s.phonemes)}")
-            print(f"VERBS: {s.trajectory}")
+
+
+def decode(n: int, start: int = 0, verbose: bool = True) -> List[DecodedLine]:
+    """
+    Decode N lines from the Pyramid Texts starting at index `start`.
     
-    if verbose:
-        print(f"\n{'='*60}")
-        print(f"AGGREGATE: Lines {start+1}-{end}")
-        print(f"{'='*60}")
-        print(f"Total phonemes: {len(all_phonemes)}")
-        print(f"\nCOMBINED STREAM:")
-        # Show in chunks of 20
-        for i in range(0, len(all_verbs), 10):
-            chunk = all_verbs[i:i+10]
-            print(f"  {i+1:3}-{i+len(chunk):3}: {' → '.join(chunk)}")
+    See iter_decoded / DecodedPrinter for the streaming form.
+    
+    Args:
+        n: Number of lines to decode
+        start: Starting index (0-based). Default 0 = first lines.
+        verbose: If True, print results as we go
         
-        # Frequency analysis
-        from collections import Counter
-        freq = Counter(all_phonemes)
-        print(f"\nFREQUENCY (n={len(all_phonemes)}):")
-        for p, count in freq.most_common():
-            pct = 100 * count / len(all_phonemes)
-            verb = WHEEL_VERBS.get(p, '?')
-            print(f"  {p:3} ({verb:10}): {count:3} ({pct:5.1f}%)")
+    Returns:
+        List of DecodedLine objects
+    """
+    collected = CollectSink()
+    sinks = [collected]
+    if verbose:
+        sinks.append(DecodedPrinter(start, min(start + n, len(get_pyramid_texts()))))
     
-    return results
+    drain(iter_decoded(start, n), *sinks)
+    return collected.records
 
 
 def decode_range(start: int, end: int, verbose: bool = True) -> List[DecodedLine]:
@@ -638,6 +824,39 @@ def get_layered_verb(phoneme: str, position: int, mode: Mode, pole: Pole) -> str
         return hg.min_fem if pole == Pole.MINIMA else hg.max_fem
 
 
+# Stand-in ID for phonemes outside the 22-phoneme set; its VERB_TABLE rows are
+# empty and get replaced by '?p' markers when the reading is built.
+_UNKNOWN_ID = NUM_PHONEMES
+
+
+def _phoneme_ids(phonemes: List[str]) -> np.ndarray:
+    """Phoneme strings → uint8 IDs, with _UNKNOWN_ID for unknown phonemes."""
+    return np.fromiter(
+        (PHONEME_TO_ID.get(p, _UNKNOWN_ID) for p in phonemes),
+        dtype=np.uint8,
+        count=len(phonemes),
+    )
+
+
+def _layered_reading(phonemes: List[str], layers: LayeredResult) -> LayeredReading:
+    """Build a LayeredReading of string lists from a bitwise decode."""
+    reading = LayeredReading(
+        phonemes=phonemes,
+        core=layers.core.tolist(),
+        f1=layers.f1.tolist(), f2=layers.f2.tolist(),
+        m1=layers.m1.tolist(), m2=layers.m2.tolist(),
+    )
+    
+    unknown = np.flatnonzero(layers.phoneme_ids == _UNKNOWN_ID)
+    for i in unknown.tolist():
+        verb = f'?{phonemes[i]}'
+        for layer in (reading.core, reading.f1, reading.f2, reading.m1, reading.m2):
+            layer[i] = verb
+    
+    return reading
+
+
+@stage("pyramid.decode_layered", items=lambda reading, phonemes: len(phonemes))
 def decode_layered_sequence(phonemes: List[str]) -> LayeredReading:
     """
     Decode a phoneme sequence into five parallel layers.
@@ -648,37 +867,11 @@ def decode_layered_sequence(phonemes: List[str]) -> LayeredReading:
     - f2: max_fem at odd positions, eq at even
     - m1: min_masc at odd positions, eq at even
     - m2: max_masc at odd positions, eq at even
-    """
-    core = []
-    f1, f2 = [], []
-    m1, m2 = [], []
-    
-    for i, p in enumerate(phonemes):
-        hg = get_hourglass(p)
-        if not hg:
-            verb = f'?{p}'
-            core.append(verb)
-            f1.append(verb)
-            f2.append(verb)
-            m1.append(verb)
-            m2.append(verb)
-            continue
-        
-        # Core is always equilibrium
-        core.append(hg.equilibrium_masc)
-        
-        # Layered: alternating pole/eq
-        f1.append(get_layered_verb(p, i, Mode.FEMININE, Pole.MINIMA))
-        f2.append(get_layered_verb(p, i, Mode.FEMININE, Pole.MAXIMA))
-        m1.append(get_layered_verb(p, i, Mode.MASCULINE, Pole.MINIMA))
-        m2.append(get_layered_verb(p, i, Mode.MASCULINE, Pole.MAXIMA))
     
-    return LayeredReading(
-        phonemes=phonemes,
-        core=core,
-        f1=f1, f2=f2,
-        m1=m1, m2=m2,
-    )
+    Decoded through the bitwise engine in one gather; unknown phonemes
+    read as '?p' in every layer.
+    """
+    return _layered_reading(phonemes, decode_layered_ids(_phoneme_ids(phonemes)))
 
 
 def decode_layered(
@@ -700,28 +893,70 @@ def decode_layered(
     Returns:
         Tuple of (ascend_reading, penetrate_reading)
     """
-    texts = get_pyramid_texts()
+    block = _layered_block(start, min(end, len(get_pyramid_texts())))
     
+    if verbose:
+        print_layered(block.ascend, block.penetrate, block.start, block.end)
+    
+    return block.ascend, block.penetrate
+
+
+@dataclass
+class LayeredBlock:
+    """Layered readings of a block of lines (1-based, inclusive)."""
+    start: int
+    end: int
+    ascend: LayeredReading
+    penetrate: LayeredReading
+
+
+def _layered_block(start: int, end_idx: int) -> LayeredBlock:
+    """Decode lines start..end_idx (1-based, inclusive) in both directions."""
+    texts = get_pyramid_texts()
     start_idx = start - 1
-    end_idx = min(end, len(texts))
     
-    # Collect all phonemes
+    # Collect all phonemes (already computed on each Sentence)
     all_phonemes = []
     for i in range(start_idx, end_idx):
-        s = texts[i]
-        phonemes = leiden_to_wheel(s.transliteration)
-        all_phonemes.extend(phonemes)
+        all_phonemes.extend(texts[i].phonemes)
     
-    # Decode forward (ASCEND)
-    ascend = decode_layered_sequence(all_phonemes)
+    # Contiguous lines are a slice of the cached ID buffer
+    if 0 <= start_idx <= end_idx:
+        corpus = get_pyramid_ids()
+        ids = corpus.slice(corpus.offsets[start_idx], corpus.offsets[end_idx])
+    else:
+        ids = encode_phonemes(all_phonemes)
     
-    # Decode reverse (PENETRATE)
-    penetrate = decode_layered_sequence(list(reversed(all_phonemes)))
+    # ASCEND (L→R) and PENETRATE (R→L) from a single gather
+    both = decode_layered_ids(ids, DIRECTION_BOTH)
+    ascend = _layered_reading(all_phonemes, both.ascend)
+    penetrate = _layered_reading(all_phonemes[::-1], both.penetrate)
     
-    if verbose:
-        print_layered(ascend, penetrate, start, end_idx)
+    return LayeredBlock(start, end_idx, ascend, penetrate)
+
+
+def iter_layered(start: int = 1, end: Optional[int] = None, block: int = 9) -> Iterator[LayeredBlock]:
+    """
+    Lazily decode consecutive blocks of lines with five parallel layers.
+    
+    Each block is decoded exactly as decode_layered(block_start, block_end).
+    
+    Args:
+        start: First line (1-based)
+        end: Last line (1-based, inclusive; default: end of corpus)
+        block: Lines per block (default 9, the Fibonacci breath block)
+    
+    Yields:
+        LayeredBlock for each block
+    """
+    if block < 1:
+        raise ValueError(f"block must be positive, got {block}")
+    
+    n = len(get_pyramid_texts())
+    end_idx = n if end is None else min(end, n)
     
-    return ascend, penetrate
+    for first in range(start, end_idx + 1, block):
+        yield _layered_block(first, min(first + block - 1, end_idx))
 
 
 def print_layered(ascend: LayeredReading, penetrate: LayeredReading, start: int, end: int):
@@ -775,6 +1010,384 @@ def print_layered(ascend: LayeredReading, penetrate: LayeredReading, start: int,
     print(build_paragraph(penetrate.f2, "penetrate"))
 
 
+# =============================================================================
+# ROLLING BREATH WINDOWS
+# =============================================================================
+#
+# A window of N consecutive lines slides one line at a time. Phoneme and
+# per-layer verb counts are kept as running totals: the line that leaves
+# is subtracted and the line that enters is added. Layer alternation is
+# counted from the window start, so when the window moves the parity of
+# every remaining phoneme may flip; running totals are therefore kept
+# for both global parities and the window picks the one matching its
+# start (ascend) or its end (penetrate).
+
+# Lines per Fibonacci breath block (1 + 2 + 3 + 2 + 1)
+BREATH_BLOCK = 9
+
+# Bins for per-layer verb counts: one per semantic address
+NUM_ADDRESSES = 256
+
+
+@dataclass
+class BreathWindow:
+    """
+    One position of the rolling breath window.
+    
+    Lines are 1-based and inclusive. phoneme_ids and line_lengths are
+    views into the corpus buffers; counts are this window's own copies.
+    Verb counts are (5, 256) arrays, one row per Layer, indexed by
+    semantic address (see layer_verbs for verb totals).
+    """
+    start: int
+    end: int
+    phoneme_ids: np.ndarray
+    line_lengths: np.ndarray
+    phoneme_counts: np.ndarray       # per phoneme ID (last bin: unknown)
+    ascend_verb_counts: np.ndarray
+    penetrate_verb_counts: np.ndarray
+    
+    @property
+    def num_lines(self) -> int:
+        return len(self.line_lengths)
+    
+    @property
+    def num_phonemes(self) -> int:
+        return len(self.phoneme_ids)
+    
+    @property
+    def spine_count(self) -> int:
+        return int(self.phoneme_counts[NUM_WHEEL:NUM_PHONEMES].sum())
+    
+    @property
+    def distinct_phonemes(self) -> int:
+        return int(np.count_nonzero(self.phoneme_counts))
+    
+    @property
+    def ascend(self) -> LayeredResult:
+        """L→R layered decode of the window (as decode_layered(start, end))."""
+        return decode_layered_ids(self.phoneme_ids)
+    
+    @property
+    def penetrate(self) -> LayeredResult:
+        """R→L layered decode of the window."""
+        return decode_layered_ids(self.phoneme_ids, DIRECTION_PENETRATE)
+    
+    def layer_verbs(self, layer: int, direction: str = "ascend") -> Dict[str, int]:
+        """
+        Verb totals for one layer of the window.
+        
+        Args:
+            layer: Layer (CORE, F1, F2, M1, M2)
+            direction: 'ascend' or 'penetrate'
+        
+        Returns:
+            Dict verb → count (unknown phonemes are not included)
+        """
+        counts = self.ascend_verb_counts if direction == "ascend" else self.penetrate_verb_counts
+        totals = {}
+        for address in np.flatnonzero(counts[layer]).tolist():
+            verb = str(VERB_TABLE[address])
+            if verb:
+                totals[verb] = totals.get(verb, 0) + int(counts[layer, address])
+        return totals
+    
+    def stats(self) -> dict:
+        """Per-window summary statistics."""
+        n = self.num_phonemes
+        return {
+            'start': self.start,
+            'end': self.end,
+            'lines': self.num_lines,
+            'phonemes': n,
+            'mean_line_length': n / self.num_lines if self.num_lines else 0.0,
+            'spine_ratio': self.spine_count / n if n else 0.0,
+            'distinct_phonemes': self.distinct_phonemes,
+        }
+
+
+def iter_breath_windows(
+    size: int = BREATH_BLOCK,
+    corpus: Optional[CorpusArray] = None,
+) -> Iterator[BreathWindow]:
+    """
+    Slide an N-line window across the corpus, one record per position.
+    
+    Each step costs only the lines entering and leaving the window.
+    A corpus shorter than the window yields a single window over all of it.
+    
+    Args:
+        size: Lines per window (default 9, the breath block)
+        corpus: Phoneme ID corpus (default: get_pyramid_ids())
+    
+    Yields:
+        BreathWindow for windows starting at lines 1, 2, ...
+    
+    Example:
+        >>> for window in iter_breath_windows():
+        ...     print(window.start, window.stats()['spine_ratio'])
+    """
+    if size < 1:
+        raise ValueError(f"size must be positive, got {size}")
+    if corpus is None:
+        corpus = get_pyramid_ids()
+    
+    ids, offsets = corpus.ids, corpus.offsets
+    num_lines = len(offsets) - 1
+    if num_lines == 0:
+        return
+    size = min(size, num_lines)
+    
+    phoneme_bins = NUM_PHONEMES + 1
+    verb_bins = len(Layer) * NUM_ADDRESSES
+    layer_base = (np.arange(len(Layer)) * NUM_ADDRESSES)[:, None]
+    
+    phoneme_counts = np.zeros(phoneme_bins, dtype=np.int64)
+    verb_counts = np.zeros((2, verb_bins), dtype=np.int64)  # by global parity
+    
+    def update(line: int, sign: int):
+        lo, hi = offsets[line], offsets[line + 1]
+        line_ids = ids[lo:hi]
+        phoneme_counts[:] += sign * np.bincount(line_ids, minlength=phoneme_bins)
+        index = np.arange(lo, hi)
+        for parity in (0, 1):
+            addresses = layer_addresses(line_ids, index + parity) + layer_base
+            verb_counts[parity] += sign * np.bincount(addresses.ravel(), minlength=verb_bins)
+    
+    for line in range(size - 1):
+        update(line, 1)
+    
+    for first in range(num_lines - size + 1):
+        if first:
+            update(first - 1, -1)
+        update(first + size - 1, 1)
+        
+        lo, hi = offsets[first], offsets[first + size]
+        yield BreathWindow(
+            start=first + 1,
+            end=first + size,
+            phoneme_ids=ids[lo:hi],
+            line_lengths=np.diff(offsets[first:first + size + 1]),
+            phoneme_counts=phoneme_counts.copy(),
+            ascend_verb_counts=verb_counts[lo % 2].reshape(len(Layer), NUM_ADDRESSES).copy(),
+            penetrate_verb_counts=verb_counts[(hi - 1) % 2].reshape(len(Layer), NUM_ADDRESSES).copy(),
+        )
+
+
+# =============================================================================
+# SINKS: Rendering and printing for streamed decodes
+# =============================================================================
+#
+# A sink is any object with write(record) and close(). drain() feeds a
+# record stream (iter_decoded, iter_bidirectional, iter_layered) to one
+# or more sinks, so computation never waits on formatting.
+
+class CollectSink:
+    """Sink that keeps every record in a list."""
+    
+    def __init__(self):
+        self.records = []
+    
+    def write(self, record):
+        self.records.append(record)
+    
+    def close(self):
+        pass
+
+
+def _json_default(value):
+    """Serialize numpy arrays and scalars inside records."""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONLinesSink:
+    """
+    Sink that writes each record as one JSON line.
+    
+    Args:
+        target: Path (opened and closed by the sink) or writable text stream
+    """
+    
+    def __init__(self, target):
+        self._owned = isinstance(target, (str, Path))
+        self.stream = open(target, 'w', encoding='utf-8') if self._owned else target
+    
+    def write(self, record):
+        self.stream.write(json.dumps(asdict(record), ensure_ascii=False, default=_json_default))
+        self.stream.write('\n')
+    
+    def close(self):
+        if self._owned:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+
+class QueueSink:
+    """
+    Sink that puts each record on a queue.
+    
+    Args:
+        queue: Anything with put() (queue.Queue, multiprocessing.Queue, ...)
+        sentinel: Put once on close to mark the end of the stream
+    """
+    
+    def __init__(self, queue, sentinel=None):
+        self.queue = queue
+        self.sentinel = sentinel
+    
+    def write(self, record):
+        self.queue.put(record)
+    
+    def close(self):
+        self.queue.put(self.sentinel)
+
+
+class DecodedPrinter:
+    """
+    Sink that pretty-prints DecodedLines as they arrive, aggregate on close.
+    
+    Args:
+        start: First index (0-based; default: first record's)
+        end: End index, exclusive (default: one past the last record's)
+    """
+    
+    def __init__(self, start: Optional[int] = None, end: Optional[int] = None):
+        self.start = start
+        self.end = end
+        self._last = None
+        self._phonemes = []
+        self._verbs = []
+    
+    def write(self, line: DecodedLine):
+        if self.start is None:
+            self.start = line.index
+        self._last = line.index
+        self._phonemes.extend(line.phonemes)
+        self._verbs.extend(line.verbs)
+        
+        print(f"\n{'='*60}")
+        print(f"LINE {line.index+1}")
+        print(f"{'='*60}")
+        print(f"𓀀 {line.hieroglyphs}")
+        print(f"◯ {line.transliteration}")
+        print(f"→ {line.translation}")
+        print(f"\nPHONEMES: {' '.join(line.phonemes)}")
+        print(f"VERBS: {line.trajectory}")
+    
+    def close(self):
+        from collections import Counter
+        
+        start = self.start or 0
+        if self.end is not None:
+            end = self.end
+        else:
+            end = start if self._last is None else self._last + 1
+        all_phonemes, all_verbs = self._phonemes, self._verbs
+        
+        print(f"\n{'='*60}")
+        print(f"AGGREGATE: Lines {start+1}-{end}")
+        print(f"{'='*60}")
+        print(f"Total phonemes: {len(all_phonemes)}")
+        print(f"\nCOMBINED STREAM:")
+        # Show in chunks of 20
+        for i in range(0, len(all_verbs), 10):
+            chunk = all_verbs[i:i+10]
+            print(f"  {i+1:3}-{i+len(chunk):3}: {' → '.join(chunk)}")
+        
+        # Frequency analysis
+        freq = Counter(all_phonemes)
+        print(f"\nFREQUENCY (n={len(all_phonemes)}):")
+        for p, count in freq.most_common():
+            pct = 100 * count / len(all_phonemes)
+            verb = WHEEL_VERBS.get(p, '?')
+            print(f"  {p:3} ({verb:10}): {count:3} ({pct:5.1f}%)")
+
+
+class BidirectionalPrinter:
+    """
+    Sink that pretty-prints BidirectionalLines as they arrive.
+    
+    Paragraphs and statistics are printed on close.
+    
+    Args:
+        start: First line (1-based), for the header
+        end: Last line (1-based, inclusive), for the header
+        readable: Render paragraphs as flowing English prose
+    """
+    
+    def __init__(self, start: int, end: int, readable: bool = False):
+        self.start = start
+        self.end = end
+        self.readable = readable
+        self._started = False
+        self._forward = []
+        self._reverse = []
+        self._counts = []
+    
+    def _header(self):
+        if not self._started:
+            _print_bidirectional_header(self.start, self.end)
+            self._started = True
+    
+    def write(self, line: BidirectionalLine):
+        self._header()
+        _print_bidirectional_line(line)
+        self._forward.extend(line.forward_verbs)
+        self._reverse.extend(line.reverse_verbs)
+        self._counts.append(len(line.phonemes))
+    
+    def close(self):
+        self._header()
+        forward, reverse = bidirectional_paragraphs(self._forward, self._reverse, self.readable)
+        _print_bidirectional_summary(forward, reverse, self._counts)
+
+
+class LayeredPrinter:
+    """Sink that pretty-prints each LayeredBlock as it arrives."""
+    
+    def write(self, block: LayeredBlock):
+        print_layered(block.ascend, block.penetrate, block.start, block.end)
+    
+    def close(self):
+        pass
+
+
+def drain(records: Iterable, *sinks) -> int:
+    """
+    Feed a record stream to sinks, then close them.
+    
+    Sinks are only closed if the stream completes.
+    
+    Args:
+        records: Iterable of records (e.g. iter_bidirectional(1, 9))
+        *sinks: Objects with write(record) and close()
+    
+    Returns:
+        Number of records
+    
+    Example:
+        >>> drain(iter_bidirectional(1, 9), BidirectionalPrinter(1, 9))
+        9
+        >>> drain(iter_layered(block=9), JSONLinesSink('layered.jsonl'))
+    """
+    count = 0
+    for record in records:
+        for sink in sinks:
+            sink.write(record)
+        count += 1
+    
+    for sink in sinks:
+        sink.close()
+    
+    return count
+
+
+# Shipped Pyramid Text translations
+TRANSLATIONS_PATH = Path(__file__).parent / 'data' / 'pyramid_texts_translated.json'
+
 # Pyramid translations cache
 _pyramid_translations: list = None
 
@@ -804,20 +1417,150 @@ def load_pyramid_translations() -> list:
     if _pyramid_translations is not None:
         return _pyramid_translations
     
-    import json
-    from pathlib import Path
-    
-    path = Path(__file__).parent / 'data' / 'pyramid_texts_translated.json'
-    with open(path, 'r', encoding='utf-8') as f:
+    with span("pyramid.load_translations") as s, open(TRANSLATIONS_PATH, 'r', encoding='utf-8') as f:
         _pyramid_translations = json.load(f)
+        s.items = len(_pyramid_translations)
     
     return _pyramid_translations
 
 
+# =============================================================================
+# TRANSLATION CACHE
+# =============================================================================
+
+class TranslationCache:
+    """
+    Thread-safe bounded LRU cache for translate / translate_bidirectional.
+    
+    Keys are (normalized transliteration, direction, lexicon version), so
+    editing the lexicon never serves stale prose.
+    
+    Attributes:
+        maxsize: Maximum number of cached translations
+        hits, misses, evictions: Running counters
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def get(self, key):
+        """Cached value for key (marked most recent), or None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+            return value
+    
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+    
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+
+# Active translation cache (None = caching disabled)
+_translation_cache: Optional[TranslationCache] = None
+
+
+def enable_translation_cache(maxsize: int = 1024) -> TranslationCache:
+    """
+    Turn on memoization of translate / translate_bidirectional.
+    
+    Replaces any existing cache (and its counters).
+    
+    Args:
+        maxsize: Maximum number of cached translations (LRU eviction)
+    
+    Returns:
+        The active TranslationCache
+    """
+    global _translation_cache
+    _translation_cache = TranslationCache(maxsize)
+    return _translation_cache
+
+
+def disable_translation_cache():
+    """Turn off translation memoization and drop the cache."""
+    global _translation_cache
+    _translation_cache = None
+
+
+def translation_cache_info() -> Optional[dict]:
+    """Hit/miss/eviction counters of the active cache, or None if disabled."""
+    cache = _translation_cache
+    return cache.info() if cache is not None else None
+
+
+def _normalize_transliteration(transliteration: str) -> str:
+    """Collapse whitespace; everything else is significant to leiden_to_wheel."""
+    return ' '.join(transliteration.split())
+
+
+def _cache_key(transliteration: str, direction: str) -> tuple:
+    return (_normalize_transliteration(transliteration), direction, lexicon_version())
+
+
+def _translate(transliteration: str, direction: str) -> str:
+    phonemes = leiden_to_wheel(transliteration)
+    
+    if direction == "penetrate":
+        phonemes = list(reversed(phonemes))
+    
+    verbs = phonemes_to_verbs(phonemes)
+    return build_paragraph(verbs, direction)
+
+
+def _translate_bidirectional(transliteration: str) -> dict:
+    phonemes = leiden_to_wheel(transliteration)
+    verbs = phonemes_to_verbs(phonemes)
+    
+    return {
+        'phonemes': phonemes,
+        'verbs': verbs,
+        'trajectory': ' → '.join(verbs),
+        'ascend': build_paragraph(verbs, "ascend"),
+        'penetrate': build_paragraph(list(reversed(verbs)), "penetrate"),
+    }
+
+
+@stage("pyramid.translate", items=lambda prose, transliteration, *args, **kwargs: 1)
 def translate(transliteration: str, direction: str = "ascend") -> str:
     """
     Translate Egyptian transliteration to readable English prose.
     
+    Memoized when enable_translation_cache() is on.
+    
     Args:
         transliteration: Leiden transliteration (e.g., "ꜥnḫ wḏꜣ snb")
         direction: "ascend" (L→R, rising) or "penetrate" (R→L, entering)
@@ -833,21 +1576,26 @@ def translate(transliteration: str, direction: str = "ascend") -> str:
         >>> translate("ꜥnḫ wḏꜣ snb", direction="penetrate")
         'Receive integrate emerge; radiate discern and lead.\nHonour and integrate.'
     """
-    from .mapping import leiden_to_wheel, phonemes_to_verbs
-    
-    phonemes = leiden_to_wheel(transliteration)
-    
-    if direction == "penetrate":
-        phonemes = list(reversed(phonemes))
-    
-    verbs = phonemes_to_verbs(phonemes)
-    return build_paragraph(verbs, direction)
+    cache = _translation_cache
+    if cache is None:
+        return _translate(transliteration, direction)
+    
+    key = _cache_key(transliteration, direction)
+    prose = cache.get(key)
+    if prose is None:
+        prose = _translate(transliteration, direction)
+        cache.put(key, prose)
+    return prose
 
 
+@stage("pyramid.translate_bidirectional", items=lambda result, transliteration: 1)
 def translate_bidirectional(transliteration: str) -> dict:
     """
     Translate in both directions simultaneously.
     
+    Memoized when enable_translation_cache() is on; each call still
+    returns its own dict and lists.
+    
     Args:
         transliteration: Leiden transliteration
     
@@ -859,15 +1607,312 @@ def translate_bidirectional(transliteration: str) -> dict:
         >>> print(result['ascend'])
         >>> print(result['penetrate'])
     """
-    from .mapping import leiden_to_wheel, phonemes_to_verbs
+    cache = _translation_cache
+    if cache is None:
+        return _translate_bidirectional(transliteration)
     
-    phonemes = leiden_to_wheel(transliteration)
-    verbs = phonemes_to_verbs(phonemes)
+    key = _cache_key(transliteration, DIRECTION_BOTH)
+    result = cache.get(key)
+    if result is None:
+        result = _translate_bidirectional(transliteration)
+        cache.put(key, result)
     
-    return {
-        'phonemes': phonemes,
-        'verbs': verbs,
-        'trajectory': ' → '.join(verbs),
-        'ascend': build_paragraph(verbs, "ascend"),
-        'penetrate': build_paragraph(list(reversed(verbs)), "penetrate"),
+    return {**result, 'phonemes': list(result['phonemes']), 'verbs': list(result['verbs'])}
+
+
+# =============================================================================
+# CONTENT HASHES
+# =============================================================================
+#
+# A record's prose depends only on its phoneme IDs and the core lexicon
+# entries those phonemes touch. Each record stores a hash of exactly
+# that, and the set of core semantic addresses it reads tells which
+# records a lexicon edit can reach.
+
+def lexicon_entries() -> np.ndarray:
+    """
+    Current core verb for every phoneme ID, as used by phonemes_to_verbs.
+    
+    Returns:
+        Object array of NUM_PHONEMES + 1 verbs (the last, for unknown
+        phonemes, is '')
+    """
+    entries = [ALL_VERBS.get(p, f'?{p}') for p in ID_TO_PHONEME.tolist()]
+    return np.array(entries + [''], dtype=object)
+
+
+def core_addresses(phoneme_ids: np.ndarray) -> np.ndarray:
+    """Core-layer (masculine equilibrium) semantic address of each phoneme ID."""
+    return np.asarray(phoneme_ids, dtype=np.int32) << 3
+
+
+def translation_hash(phoneme_ids: np.ndarray, entries: np.ndarray = None) -> str:
+    """
+    Content hash of a translation's inputs.
+    
+    Covers the phoneme ID sequence plus the lexicon entry of every
+    distinct phoneme it touches, so it changes exactly when the record's
+    prose can change.
+    
+    Args:
+        phoneme_ids: uint8 phoneme IDs of one record
+        entries: Lexicon table from lexicon_entries() (default: current)
+    
+    Returns:
+        16-hex-digit hash
+    """
+    if entries is None:
+        entries = lexicon_entries()
+    ids = np.asarray(phoneme_ids, dtype=np.uint8)
+    touched = '\0'.join(entries[np.unique(ids)].tolist())
+    digest = hashlib.sha1(ids.tobytes() + b'\0' + touched.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def affected_records(
+    phoneme_ids: np.ndarray,
+    offsets: np.ndarray,
+    old_entries: np.ndarray,
+    new_entries: np.ndarray,
+) -> np.ndarray:
+    """
+    Which records read a lexicon entry that changed.
+    
+    Args:
+        phoneme_ids: Flat phoneme IDs of all records
+        offsets: Record offsets into phoneme_ids
+        old_entries, new_entries: Lexicon tables (see lexicon_entries)
+    
+    Returns:
+        Boolean mask, one per record
+    """
+    changed = core_addresses(np.flatnonzero(old_entries != new_entries))
+    hit = np.isin(core_addresses(phoneme_ids), changed)
+    counts = np.bincount(sentence_index(offsets)[hit], minlength=len(offsets) - 1)
+    return counts > 0
+
+
+# =============================================================================
+# REBUILD SHIPPED TRANSLATIONS
+# =============================================================================
+
+def translation_record(index: int, sentence: Sentence) -> dict:
+    """
+    One pyramid_texts_translated.json record for a Pyramid Text sentence.
+    
+    Args:
+        index: Position in the Unas corpus (becomes the id 'PT_0000', ...)
+        sentence: Source sentence
+    
+    Returns:
+        Dict with id, transliteration, phonemes, verbs, trajectory,
+        ascend, penetrate, period and date_range
+    """
+    record = {
+        'id': f"PT_{index:04d}",
+        'transliteration': sentence.transliteration,
+        **_translate_bidirectional(sentence.transliteration),
+        'period': sentence.period,
+        'date_range': f"{sentence.date_not_before} to {sentence.date_not_after} BCE",
     }
+    record['hash'] = translation_hash(_phoneme_ids(record['phonemes']))
+    return record
+
+
+def _format_record(record: dict) -> str:
+    """One record as an indented element of the JSON array."""
+    text = json.dumps(record, indent=2, ensure_ascii=True)
+    return '  ' + text.replace('\n', '\n  ')
+
+
+def _record_json(args) -> str:
+    """Worker: build and format one record."""
+    return _format_record(translation_record(*args))
+
+
+def _write_records(out: Path, records) -> int:
+    """
+    Stream formatted records to out as a JSON array.
+    
+    Matches json.dump(records, indent=2) byte for byte. Written to a
+    .tmp sibling and moved into place when complete; if rendering fails
+    the .tmp file is removed and out is left untouched.
+    """
+    tmp = out.with_name(out.name + '.tmp')
+    count = 0
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(',\n' if count else '[\n')
+                f.write(record)
+                count += 1
+            f.write('\n]' if count else '[]')
+        os.replace(tmp, out)
+    finally:
+        if tmp.exists():
+            os.unlink(tmp)
+    return count
+
+
+def _map_records(tasks, workers: int, chunksize: int):
+    """Yield _record_json over tasks in order, across a pool if workers > 1."""
+    if workers <= 1:
+        yield from map(_record_json, tasks)
+        return
+    with Pool(workers) as pool:
+        yield from pool.imap(_record_json, tasks, chunksize)
+
+
+def rebuild_pyramid_translations(
+    workers: Optional[int] = None,
+    out=None,
+    sentences: Optional[List[Sentence]] = None,
+    chunksize: int = 32,
+) -> int:
+    """
+    Regenerate pyramid_texts_translated.json from the Unas corpus.
+    
+    Records are rendered across a process pool and streamed to disk in
+    corpus order, so the file is byte-identical to json.dump(records,
+    indent=2) whatever the worker count. The file is written to a
+    temporary sibling and moved into place when complete.
+    
+    Each record carries a content hash (see translation_hash) so later
+    lexicon edits can be applied with update_pyramid_translations.
+    
+    Args:
+        workers: Worker processes (None = all CPUs, 1 = in-process)
+        out: Output path (default: the shipped data file)
+        sentences: Source sentences (default: get_pyramid_texts())
+        chunksize: Sentences handed to a worker at a time
+    
+    Returns:
+        Number of records written
+    
+    Example:
+        >>> rebuild_pyramid_translations(workers=8)
+        1316
+    """
+    global _pyramid_translations
+    
+    if sentences is None:
+        sentences = get_pyramid_texts()
+    out = Path(out) if out is not None else TRANSLATIONS_PATH
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    count = _write_records(out, _map_records(enumerate(sentences), workers, chunksize))
+    if out.resolve() == TRANSLATIONS_PATH.resolve():
+        _pyramid_translations = None
+    
+    return count
+
+
+def _stored_lexicon(phoneme_ids: np.ndarray, records: List[dict]) -> np.ndarray:
+    """Lexicon table as recorded in existing records (None where unseen)."""
+    entries = np.full(NUM_PHONEMES + 1, None, dtype=object)
+    verbs = [v for record in records for v in record['verbs']]
+    entries[phoneme_ids] = np.array(verbs, dtype=object)
+    entries[_UNKNOWN_ID] = ''
+    return entries
+
+
+@dataclass
+class TranslationUpdate:
+    """Outcome of update_pyramid_translations."""
+    changed: List[int]   # indices of re-rendered records
+    dropped: List[str]   # ids of records past the end of the source
+
+
+def update_pyramid_translations(
+    workers: int = 1,
+    out=None,
+    sentences: Optional[List[Sentence]] = None,
+    chunksize: int = 32,
+) -> TranslationUpdate:
+    """
+    Re-render only the translation records whose inputs changed.
+    
+    The lexicon the existing file was built with is read back from its
+    own phoneme/verb pairs; records touching a changed entry are found by
+    membership of the changed semantic addresses in each record's address
+    set. Records whose stored transliteration, period or date range no
+    longer match the source are re-rendered as well. The rest are
+    re-tokenized (once per distinct transliteration) and their stored
+    hash compared, which catches edits to the Leiden map itself.
+    Everything else is copied through unchanged.
+    
+    Records beyond the end of a shrunken source are removed from the
+    file and their ids returned as `dropped`.
+    
+    Falls back to a full rebuild if out does not exist yet.
+    
+    Args:
+        workers: Worker processes for re-rendering (1 = in-process)
+        out: Translation file to update (default: the shipped data file)
+        sentences: Source sentences (default: get_pyramid_texts())
+        chunksize: Sentences handed to a worker at a time
+    
+    Returns:
+        TranslationUpdate with the re-rendered indices and dropped ids
+    
+    Example:
+        >>> update_pyramid_translations()   # after editing the lexicon
+        TranslationUpdate(changed=[12, 57, 301], dropped=[])
+    """
+    global _pyramid_translations
+    
+    if sentences is None:
+        sentences = get_pyramid_texts()
+    out = Path(out) if out is not None else TRANSLATIONS_PATH
+    
+    if not out.exists():
+        rebuild_pyramid_translations(workers, out, sentences, chunksize)
+        return TranslationUpdate(changed=list(range(len(sentences))), dropped=[])
+    
+    with open(out, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    dropped = [record['id'] for record in records[len(sentences):]]
+    records = records[:len(sentences)]
+    
+    stored = [record['phonemes'] for record in records]
+    ids = _phoneme_ids([p for phonemes in stored for p in phonemes])
+    offsets = offsets_from_lengths([len(phonemes) for phonemes in stored])
+    entries = lexicon_entries()
+    
+    stale = affected_records(ids, offsets, _stored_lexicon(ids, records), entries)
+    stale = np.concatenate([stale, np.ones(len(sentences) - len(records), dtype=bool)])
+    hashes = {}
+    for i, record in enumerate(records):
+        if stale[i]:
+            continue
+        sentence = sentences[i]
+        if (
+            record['transliteration'] != sentence.transliteration
+            or record['period'] != sentence.period
+            or record['date_range'] != f"{sentence.date_not_before} to {sentence.date_not_after} BCE"
+        ):
+            stale[i] = True
+            continue
+        translit = record['transliteration']
+        if translit not in hashes:
+            hashes[translit] = translation_hash(_phoneme_ids(leiden_to_wheel(translit)), entries)
+        stale[i] = record.get('hash') != hashes[translit]
+    
+    changed = np.flatnonzero(stale).tolist()
+    rendered = _map_records(((i, sentences[i]) for i in changed), workers, chunksize)
+    
+    def merged():
+        for i, record in enumerate(records):
+            if not stale[i]:
+                yield _format_record(record)
+            else:
+                yield next(rendered)
+        yield from rendered
+    
+    if changed or dropped:
+        _write_records(out, merged())
+        if out.resolve() == TRANSLATIONS_PATH.resolve():
+            _pyramid_translations = None
+    
+    return TranslationUpdate(changed=changed, dropped=dropped)
@@ -5,12 +5,29 @@ Implements:
 - Fibonacci boundary detection (clause/sentence breaks)
 - Script health scoring (semantic integrity)
 - Breath phase tracking (inhale/exhale/pivot)
+- Array versions of the boundary functions for whole corpora
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional
 import math
 
+import numpy as np
+
+from .bitwise import (
+    CorpusArray,
+    Layer,
+    NUM_PHONEMES,
+    ID_TO_PHONEME,
+    VERB_TABLE,
+    offsets_from_lengths,
+    local_index,
+    layer_addresses,
+)
+
 
 # Golden ratio
 PHI = (1 + math.sqrt(5)) / 2  # 1.618033988749895
@@ -101,6 +118,175 @@ def detect_yuga_boundaries(phoneme_count: int) -> Dict[str, Tuple[int, int]]:
     }
 
 
+# =============================================================================
+# VECTORIZED BOUNDARIES (many lengths at once)
+# =============================================================================
+#
+# Sentence lengths repeat heavily across a corpus, so boundaries are
+# computed once per distinct length and gathered for the rest.
+
+# Yuga names in span-matrix column order
+YUGAS = ('satya', 'treta', 'dvapara', 'kali')
+
+# Memoized phi boundaries per length
+_phi_table: Dict[int, np.ndarray] = {}
+
+
+def phi_boundary_table(length: int) -> np.ndarray:
+    """
+    Cached detect_phi_boundaries(length) as a read-only int64 array.
+    """
+    table = _phi_table.get(length)
+    if table is None:
+        table = np.array(detect_phi_boundaries(length), dtype=np.int64)
+        table.setflags(write=False)
+        _phi_table[length] = table
+    return table
+
+
+def _unique_lengths(lengths) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    np.unique(lengths, return_inverse=True) for small non-negative ints, in O(n).
+    """
+    lengths = np.asarray(lengths, dtype=np.int64).reshape(-1)
+    if len(lengths) == 0:
+        return lengths, lengths
+    unique = np.flatnonzero(np.bincount(lengths))
+    lookup = np.zeros(unique[-1] + 1, dtype=np.int64)
+    lookup[unique] = np.arange(len(unique))
+    return unique, lookup[lengths]
+
+
+def _ragged_gather(tables: List[np.ndarray], inverse: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenate tables[inverse[i]] for every i, without a Python loop over i.
+    
+    Returns:
+        (values, offsets) — flat values and CSR offsets, one row per i
+    """
+    sizes = np.array([len(t) for t in tables], dtype=np.int64)
+    flat = np.concatenate(tables) if tables else np.empty(0, dtype=np.int64)
+    starts = offsets_from_lengths(sizes)[:-1]
+    
+    counts = sizes[inverse]
+    offsets = offsets_from_lengths(counts)
+    index = np.arange(offsets[-1]) + np.repeat(starts[inverse] - offsets[:-1], counts)
+    return flat[index], offsets
+
+
+def phi_boundaries_array(lengths) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Phi boundaries for many sequence lengths at once.
+    
+    Args:
+        lengths: Sequence lengths (e.g. every sentence length in a corpus)
+    
+    Returns:
+        (boundaries, offsets) — boundaries of sequence i are
+        boundaries[offsets[i]:offsets[i + 1]], as detect_phi_boundaries
+    
+    Example:
+        >>> bounds, offsets = phi_boundaries_array([23, 5, 23])
+        >>> bounds[offsets[0]:offsets[1]].tolist() == detect_phi_boundaries(23)
+        True
+    """
+    unique, inverse = _unique_lengths(lengths)
+    tables = [phi_boundary_table(int(n)) for n in unique]
+    return _ragged_gather(tables, inverse)
+
+
+# Masks are memoized per (length, tolerance radius) for sentence-sized
+# lengths only, and at most this many of them
+PHI_MASK_CACHE_LENGTH = 1024
+PHI_MASK_CACHE_SIZE = 4096
+
+
+def _phi_mask(length: int, radius: int) -> np.ndarray:
+    bounds = phi_boundary_table(length)
+    if radius < 0 or len(bounds) == 0:
+        mask = np.zeros(length, dtype=bool)
+    else:
+        # Dilate each boundary to [b - r, b + r] with a difference array
+        edges = np.zeros(length + 1, dtype=np.int64)
+        np.add.at(edges, np.clip(bounds - radius, 0, length), 1)
+        np.add.at(edges, np.clip(bounds + radius + 1, 0, length), -1)
+        mask = np.cumsum(edges[:-1]) > 0
+    mask.setflags(write=False)
+    return mask
+
+
+_cached_phi_mask = lru_cache(maxsize=PHI_MASK_CACHE_SIZE)(_phi_mask)
+
+
+def phi_mask_table(length: int, tolerance: float = 0.5) -> np.ndarray:
+    """
+    Boolean mask of the positions at a phi boundary.
+    
+    Position p is set when |p - b| <= tolerance for some boundary b, the
+    same test as is_at_phi_boundary. Positions are integers, so the
+    tolerance acts as a dilation of radius floor(tolerance); a NaN
+    tolerance matches nothing. Masks for lengths up to
+    PHI_MASK_CACHE_LENGTH are cached (LRU, PHI_MASK_CACHE_SIZE entries).
+    
+    Args:
+        length: Sequence length
+        tolerance: How close to a boundary counts (in positions)
+    
+    Returns:
+        Read-only bool array of the given length
+    """
+    # Radii past either end of [-1, length] all give the same mask
+    radius = -1 if math.isnan(tolerance) else math.floor(max(-1, min(length, tolerance)))
+    if length > PHI_MASK_CACHE_LENGTH:
+        return _phi_mask(length, radius)
+    return _cached_phi_mask(length, radius)
+
+
+def phi_boundary_mask(lengths, tolerance: float = 0.5) -> np.ndarray:
+    """
+    Phi-boundary mask for a whole ragged corpus.
+    
+    Args:
+        lengths: Sentence lengths (np.diff of the corpus offsets)
+        tolerance: How close to a boundary counts (in positions)
+    
+    Returns:
+        Flat bool array aligned with the corpus ID buffer
+    
+    Example:
+        >>> corpus = get_pyramid_ids()
+        >>> on_phi = phi_boundary_mask(corpus.lengths)
+        >>> layers = decode_layered_batch(corpus.ids, corpus.offsets)
+        >>> boundary_verbs = layers.core[on_phi]
+    """
+    unique, inverse = _unique_lengths(lengths)
+    tables = [phi_mask_table(int(n), tolerance) for n in unique]
+    mask, _ = _ragged_gather(tables, inverse)
+    return mask.astype(bool, copy=False)
+
+
+def yuga_spans(lengths) -> np.ndarray:
+    """
+    Yuga boundaries (4:3:2:1) for many sequence lengths at once.
+    
+    Args:
+        lengths: Sequence lengths
+    
+    Returns:
+        (n, 4) int64 matrix of yuga end positions, columns as YUGAS. Yuga
+        k spans [spans[i, k - 1], spans[i, k]), the first starting at 0;
+        identical to detect_yuga_boundaries
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    unit = lengths / 10
+    spans = np.empty((len(lengths), len(YUGAS)), dtype=np.int64)
+    spans[:, 0] = 4 * unit
+    spans[:, 1] = 7 * unit
+    spans[:, 2] = 9 * unit
+    spans[:, 3] = lengths
+    return spans
+
+
 def detect_breath_phase(line_number: int, total_lines: int = 9) -> BreathPhase:
     """
     Determine breath phase based on position in genesis block.
@@ -141,6 +327,151 @@ def detect_breath_phase(line_number: int, total_lines: int = 9) -> BreathPhase:
         return BreathPhase.RETURN
 
 
+# =============================================================================
+# BATCH BREATH PHASES
+# =============================================================================
+
+# Phase code (uint8) → BreathPhase
+BREATH_PHASES = tuple(BreathPhase)
+BREATH_PHASE_CODES = {phase: code for code, phase in enumerate(BREATH_PHASES)}
+
+# Memoized phase code per block position, keyed by block size
+_breath_phase_table: Dict[int, np.ndarray] = {}
+
+
+def breath_phase_table(block_size: int = 9) -> np.ndarray:
+    """
+    Cached phase code of every line position in a block.
+    
+    Returns:
+        Read-only uint8 array; entry k is the code of
+        detect_breath_phase(k + 1, block_size)
+    """
+    table = _breath_phase_table.get(block_size)
+    if table is None:
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+        table = np.array([
+            BREATH_PHASE_CODES[detect_breath_phase(k + 1, block_size)]
+            for k in range(block_size)
+        ], dtype=np.uint8)
+        table.setflags(write=False)
+        _breath_phase_table[block_size] = table
+    return table
+
+
+def breath_phase_codes(num_lines: int, block_size: int = 9, offset: int = 0) -> np.ndarray:
+    """
+    Breath phase code of every line in a run of lines.
+    
+    Blocks start at line `offset` and every block_size lines after it;
+    lines before `offset` end the previous (partial) block.
+    
+    Args:
+        num_lines: Lines to label
+        block_size: Lines per breath block
+        offset: Index of the first line that starts a block
+    
+    Returns:
+        uint8 array of codes (see BREATH_PHASES)
+    """
+    table = breath_phase_table(block_size)
+    return table[(np.arange(num_lines) - offset) % block_size]
+
+
+@dataclass
+class PhaseDistribution:
+    """
+    Phoneme and verb counts per breath phase over a run of lines.
+    
+    Attributes:
+        phase_codes: uint8 code per line
+        phoneme_counts: (5, NUM_PHONEMES + 1) counts per phase and phoneme
+                        ID (last column: unknown)
+        verb_counts: (5, 256) counts per phase and semantic address
+        layer: Layer the verbs were read through
+    """
+    phase_codes: np.ndarray
+    phoneme_counts: np.ndarray
+    verb_counts: np.ndarray
+    layer: int
+    
+    def phonemes(self, phase: BreathPhase) -> Dict[str, int]:
+        """Phoneme → count for one phase."""
+        row = self.phoneme_counts[BREATH_PHASE_CODES[phase]]
+        return {
+            str(ID_TO_PHONEME[i]): int(row[i])
+            for i in np.flatnonzero(row[:NUM_PHONEMES]).tolist()
+        }
+    
+    def verbs(self, phase: BreathPhase) -> Dict[str, int]:
+        """Verb → count for one phase."""
+        row = self.verb_counts[BREATH_PHASE_CODES[phase]]
+        totals = {}
+        for address in np.flatnonzero(row).tolist():
+            verb = str(VERB_TABLE[address])
+            if verb:
+                totals[verb] = totals.get(verb, 0) + int(row[address])
+        return totals
+
+
+def breath_phase_distribution(
+    corpus: CorpusArray,
+    block_size: int = 9,
+    offset: int = 0,
+    start: int = 0,
+    stop: Optional[int] = None,
+    layer: int = Layer.CORE,
+) -> PhaseDistribution:
+    """
+    Label lines [start, stop) of a corpus with breath phases and count
+    phonemes and verbs per phase.
+    
+    Verbs are read through one layer, alternation restarting at each line.
+    
+    Args:
+        corpus: Ragged phoneme ID corpus (one sentence per line)
+        block_size: Lines per breath block
+        offset: First line (relative to start) that starts a block
+        start, stop: Line range; clipped to the corpus like a slice,
+                     so an empty or reversed range gives empty counts
+        layer: Layer for verb counts (default CORE)
+    
+    Returns:
+        PhaseDistribution
+    
+    Example:
+        >>> for size in (5, 7, 9, 13):
+        ...     dist = breath_phase_distribution(get_pyramid_ids(), block_size=size)
+        ...     print(size, dist.verbs(BreathPhase.PIVOT))
+    """
+    if start < 0 or (stop is not None and stop < 0):
+        raise ValueError(f"Line range must be non-negative, got {start}:{stop}")
+    # Out-of-range or reversed ranges select no lines, as a slice would
+    start = min(start, len(corpus))
+    stop = len(corpus) if stop is None else min(stop, len(corpus))
+    stop = max(start, stop)
+    offsets = corpus.offsets[start:stop + 1]
+    ids = corpus.slice(offsets[0], offsets[-1])
+    offsets = offsets - offsets[0]
+    
+    codes = breath_phase_codes(len(offsets) - 1, block_size, offset)
+    phase = np.repeat(codes.astype(np.int64), np.diff(offsets))
+    num_phases = len(BREATH_PHASES)
+    
+    phoneme_bins = NUM_PHONEMES + 1
+    phoneme_counts = np.bincount(
+        phase * phoneme_bins + ids, minlength=num_phases * phoneme_bins
+    ).reshape(num_phases, phoneme_bins)
+    
+    addresses = layer_addresses(ids, local_index(offsets), [layer])[0]
+    verb_counts = np.bincount(
+        phase * 256 + addresses, minlength=num_phases * 256
+    ).reshape(num_phases, 256)
+    
+    return PhaseDistribution(codes, phoneme_counts, verb_counts, int(layer))
+
+
 def score_script_health(
     hieroglyph_attested: bool = False,
     hieratic_attested: bool = False,
@@ -196,11 +527,8 @@ def is_at_phi_boundary(position: int, total: int, tolerance: float = 0.5) -> boo
     Returns:
         True if at a phi boundary
     """
-    boundaries = detect_phi_boundaries(total)
-    for b in boundaries:
-        if abs(position - b) <= tolerance:
-            return True
-    return False
+    boundaries = phi_boundary_table(total)
+    return bool(np.any(np.abs(position - boundaries) <= tolerance))
 
 
 def segment_by_fibonacci(sequence: List, max_segments: int = 5) -> List[List]:
@@ -254,6 +582,148 @@ def analyze_line_rhythm(phonemes: List[str]) -> Dict:
     }
 
 
+# =============================================================================
+# CORPUS RHYTHM (columnar)
+# =============================================================================
+
+# Default segment limit, as segment_by_fibonacci
+MAX_SEGMENTS = 5
+
+# Sentences per chunk for parallel analysis
+RHYTHM_CHUNK = 1 << 16
+
+# Memoized segment sizes per (length, max_segments)
+_segment_table: Dict[Tuple[int, int], np.ndarray] = {}
+
+
+def segment_size_table(length: int, max_segments: int = MAX_SEGMENTS) -> np.ndarray:
+    """
+    Cached segment sizes of segment_by_fibonacci for a sequence length.
+    
+    Returns:
+        Read-only int64 array of max_segments sizes, zero-padded
+    """
+    key = (length, max_segments)
+    sizes = _segment_table.get(key)
+    if sizes is None:
+        cuts = [0] + phi_boundary_table(length)[:max_segments - 1].tolist() + [length]
+        sizes = np.zeros(max_segments, dtype=np.int64)
+        nonempty = [b - a for a, b in zip(cuts, cuts[1:]) if b > a]
+        sizes[:len(nonempty)] = nonempty
+        sizes.setflags(write=False)
+        _segment_table[key] = sizes
+    return sizes
+
+
+@dataclass
+class CorpusRhythm:
+    """
+    Rhythm structure of every sentence in a corpus, as columns.
+    
+    Segments are not copied: segment(i, j) is a view into the corpus
+    ID buffer (in plain storage).
+    
+    Attributes:
+        corpus: The analysed CorpusArray
+        phi_boundaries: Flat phi boundaries (positions within each sentence)
+        boundary_offsets: Sentence i's boundaries are
+                          phi_boundaries[boundary_offsets[i]:boundary_offsets[i + 1]]
+        segment_sizes: (n, max_segments) phi segment sizes, zero-padded
+        segment_starts: (n, max_segments) buffer offset of each segment
+        yuga_spans: (n, 4) yuga end positions (see yuga_spans)
+    """
+    corpus: CorpusArray
+    phi_boundaries: np.ndarray
+    boundary_offsets: np.ndarray
+    segment_sizes: np.ndarray
+    segment_starts: np.ndarray
+    yuga_spans: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.segment_sizes)
+    
+    @property
+    def num_segments(self) -> np.ndarray:
+        return np.count_nonzero(self.segment_sizes, axis=1)
+    
+    def boundaries(self, i: int) -> np.ndarray:
+        """Phi boundaries of sentence i."""
+        return self.phi_boundaries[self.boundary_offsets[i]:self.boundary_offsets[i + 1]]
+    
+    def segment(self, i: int, j: int) -> np.ndarray:
+        """Phoneme IDs of phi segment j of sentence i."""
+        lo = self.segment_starts[i, j]
+        return self.corpus.slice(lo, lo + self.segment_sizes[i, j])
+    
+    def segments(self, i: int) -> List[np.ndarray]:
+        """All phi segments of sentence i, as analyze_line_rhythm's phi_segments."""
+        return [self.segment(i, j) for j in range(int(np.count_nonzero(self.segment_sizes[i])))]
+
+
+def _rhythm_chunk(lengths: np.ndarray, max_segments: int):
+    unique, inverse = _unique_lengths(lengths)
+    bounds, bound_offsets = _ragged_gather([phi_boundary_table(int(n)) for n in unique], inverse)
+    table = np.array([segment_size_table(int(n), max_segments) for n in unique], dtype=np.int64)
+    sizes = table.reshape(len(unique), max_segments)[inverse]
+    return bounds, bound_offsets, sizes, yuga_spans(lengths)
+
+
+def analyze_corpus_rhythm(
+    corpus: CorpusArray,
+    max_segments: int = MAX_SEGMENTS,
+    workers: Optional[int] = None,
+    chunk_size: int = RHYTHM_CHUNK,
+) -> CorpusRhythm:
+    """
+    analyze_line_rhythm for a whole corpus, as columnar arrays.
+    
+    Only sentence lengths are needed, and each distinct length is
+    analysed once. With workers > 1, chunks of chunk_size sentences
+    are analysed on a thread pool and stitched together.
+    
+    Args:
+        corpus: Ragged phoneme ID corpus
+        max_segments: Segment limit (as segment_by_fibonacci)
+        workers: Threads for chunked execution (None or 1 = serial)
+        chunk_size: Sentences per chunk
+    
+    Returns:
+        CorpusRhythm
+    
+    Example:
+        >>> rhythm = analyze_corpus_rhythm(get_pyramid_ids())
+        >>> rhythm.segment_sizes[0]
+        array([14,  6,  2,  1,  0])
+    """
+    lengths = corpus.lengths
+    
+    if workers is None or workers <= 1 or len(lengths) <= chunk_size:
+        bounds, bound_offsets, sizes, spans = _rhythm_chunk(lengths, max_segments)
+    else:
+        chunks = [lengths[i:i + chunk_size] for i in range(0, len(lengths), chunk_size)]
+        with ThreadPoolExecutor(workers) as pool:
+            parts = list(pool.map(lambda c: _rhythm_chunk(c, max_segments), chunks))
+        
+        bounds = np.concatenate([p[0] for p in parts])
+        bases = np.cumsum([0] + [p[1][-1] for p in parts[:-1]])
+        bound_offsets = np.concatenate(
+            [[0]] + [p[1][1:] + base for p, base in zip(parts, bases)]
+        ).astype(np.int64)
+        sizes = np.concatenate([p[2] for p in parts])
+        spans = np.concatenate([p[3] for p in parts])
+    
+    starts = np.cumsum(sizes, axis=1) - sizes + corpus.offsets[:-1, None]
+    
+    return CorpusRhythm(
+        corpus=corpus,
+        phi_boundaries=bounds,
+        boundary_offsets=bound_offsets,
+        segment_sizes=sizes,
+        segment_starts=starts,
+        yuga_spans=spans,
+    )
+
+
 # Script breath ratios (for documentation)
 SCRIPT_RATIOS = {
     'hieroglyph_to_hieratic': (1, 1),  # Unity maintained
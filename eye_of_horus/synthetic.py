@@ -0,0 +1,299 @@
+"""
+Synthetic TLA corpus generator.
+
+The TLA Earlier Egyptian file is not shipped with the package, so load
+tests of load_tla_corpus, search_corpus and validation need stand-in
+data at production scale. This module writes rows in the same JSONL
+schema:
+
+    hieroglyphs, transliteration, lemmatization, UPOS, glossing,
+    translation, dateNotBefore, dateNotAfter
+
+Phoneme sequences are a Markov chain over the corpus bigram counts in
+semantic_network.json, with spine phonemes inserted at their Pyramid
+Text frequencies. Sentence lengths follow the Pyramid Text length
+distribution and dates are drawn per period. Output depends only on
+(n, seed).
+
+Generation is vectorized over chunks of CHUNK_ROWS sentences: every
+chain step advances a whole chunk at once, and rows are rendered by
+gathering code points into one buffer per field.
+
+Example:
+    >>> write_synthetic_tla("tla_synthetic.json", 1_000_000, seed=7)
+    >>> corpus = load_tla_corpus("tla_synthetic.json")
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from .bitwise import ID_TO_PHONEME, NUM_PHONEMES, NUM_WHEEL, PHONEME_TO_ID
+from .corpus import load_semantic_network
+from .mapping import LEIDEN_TO_WHEEL
+
+
+# Sentences generated per vectorized step (fixed, so output is chunk-independent)
+CHUNK_ROWS = 1 << 16
+
+# Uniliteral signs written for each phoneme in the hieroglyphs field
+HIEROGLYPHS = {
+    'n': '𓈖', 'w': '𓅱', 's': '𓋴', 'sh': '𓈙', 'A': '𓄿', 't': '𓏏', 'H': '𓎛', 'r': '𓂋',
+    'm': '𓅓', 'a': '𓂝', 'y': '𓇌', 'b': '𓃀', 'p': '𓊪', 'i': '𓇋', 'kh': '𓐍', 'dj': '𓆓',
+    'd': '𓂧', 'k': '𓎡', 'x': '𓄡', 'g': '𓎼', 'f': '𓆑', 'h': '𓉔',
+}
+
+# Spine phoneme counts in the Pyramid Texts of Unas
+SPINE_COUNTS = {'d': 339, 'k': 389, 'x': 0, 'g': 61, 'f': 112, 'h': 180}
+SPINE_RATE = 0.051   # share of spine phonemes in the Pyramid Texts
+
+# Phonemes per sentence: (length, weight), binned from the Pyramid Texts
+LENGTH_WEIGHTS = [
+    (2, 3), (4, 7), (6, 10), (8, 11), (10, 11), (12, 10), (14, 9), (16, 8),
+    (18, 7), (20, 6), (24, 8), (28, 5), (34, 3), (44, 1.5), (60, 0.5),
+]
+MEAN_WORD_LENGTH = 2.26   # phonemes per word in the Pyramid Texts
+
+# date_not_before ranges per period, with their share of sentences
+DATE_WEIGHTS = [
+    (-3000, -2687, 0.02),   # Early Dynastic
+    (-2686, -2181, 0.45),   # Old Kingdom
+    (-2180, -2056, 0.08),   # First Intermediate
+    (-2055, -1651, 0.40),   # Middle Kingdom
+    (-1650, -1500, 0.05),   # Late
+]
+DATE_SPANS = [25, 30, 50, 100, 150, 200]
+MISSING_DATE_RATE = 0.01
+
+UPOS_TAGS = ['NOUN', 'VERB', 'ADP', 'PRON', 'ADJ', 'PROPN', 'PART', 'ADV']
+GLOSSES = ['N.m:sg', 'N.f:sg', 'V\\tam.act', 'PREP', '-3sg.m', 'PTCL', 'ADJ.m:sg', 'N.m:pl']
+TRANSLATION_WORDS = [
+    'der', 'die', 'das', 'und', 'zu', 'in', 'König', 'Gott', 'Himmel', 'Erde',
+    'Osiris', 'Unas', 'Brot', 'Bier', 'Horus', 'Auge', 'sagen', 'tun', 'gehen',
+    'ankommen', 'nehmen', 'legen', 'öffnen', 'eintreten', 'alt', 'begraben',
+    'krank', 'gestorben', 'geboren', 'Frage', 'Antwort', 'Opfer', 'Wasser',
+    'sein', 'Haus', 'dieser', 'ist', 'dein', 'Leib', 'Sohn',
+]
+
+
+def _leiden_spelling() -> List[str]:
+    """First Leiden character listed for each phoneme ID ('' if none)."""
+    spelling = [''] * NUM_PHONEMES
+    for char, phoneme in LEIDEN_TO_WHEEL.items():
+        pid = PHONEME_TO_ID[phoneme]
+        if not spelling[pid]:
+            spelling[pid] = char
+    return spelling
+
+
+# =============================================================================
+# ROW RENDERING
+# =============================================================================
+
+class _TokenTable:
+    """Strings as a zero-padded code-point matrix, for vectorized joining."""
+    
+    def __init__(self, tokens: List[str]):
+        width = max((len(t) for t in tokens), default=0)
+        self.codes = np.zeros((len(tokens), width + 1), dtype=np.uint32)
+        for i, token in enumerate(tokens):
+            self.codes[i, :len(token)] = [ord(ch) for ch in token]
+    
+    def render(self, ids: np.ndarray, separators: np.ndarray) -> List[str]:
+        """
+        Concatenate token[ids[k]] + chr(separators[k]) and split into rows.
+    
+        A separator of 0 writes nothing; '\n' ends a row.
+        """
+        # Each token's padding column carries its separator; code 0 is dropped
+        out = self.codes[ids]
+        out[:, -1] = separators
+        out = out.ravel()
+        out = out[out != 0]
+    
+        rows = out.tobytes().decode('utf-32-le').split('\n')
+        rows.pop()
+        return rows
+
+
+def _row_separators(lengths: np.ndarray, inner: int) -> np.ndarray:
+    """`inner` between tokens of a row, '\\n' after its last token."""
+    separators = np.full(int(lengths.sum()), inner, dtype=np.uint32)
+    separators[np.cumsum(lengths) - 1] = ord('\n')
+    return separators
+
+
+# =============================================================================
+# GENERATOR
+# =============================================================================
+
+class SyntheticTLA:
+    """
+    Seeded generator of TLA-schema rows.
+    
+    Args:
+        seed: Seed; the same (n, seed) always gives the same rows
+        network: Semantic network dict (default: the shipped one)
+    """
+    
+    _TEMPLATE = (
+        '{"hieroglyphs": "%s", "transliteration": "%s", "lemmatization": "%s", '
+        '"UPOS": "%s", "glossing": "%s", "translation": "%s", '
+        '"dateNotBefore": %s, "dateNotAfter": %s}\n'
+    )
+    
+    def __init__(self, seed: int = 0, network: Optional[dict] = None):
+        self.seed = seed
+        network = network if network is not None else load_semantic_network()
+    
+        # Wheel chain from the corpus bigram counts
+        counts = np.zeros((NUM_PHONEMES, NUM_PHONEMES), dtype=np.float64)
+        for edge in network['edges']:
+            counts[PHONEME_TO_ID[edge['source']], PHONEME_TO_ID[edge['target']]] += edge['count']
+        wheel = counts[:NUM_WHEEL, :NUM_WHEEL]
+        rows = wheel.sum(axis=1, keepdims=True)
+        uniform = np.full_like(wheel, 1.0 / NUM_WHEEL)
+        probs = np.where(rows > 0, wheel / np.where(rows > 0, rows, 1), uniform)
+        self.transition_cdf = np.cumsum(probs, axis=1)
+        self.transition_cdf[:, -1] = 1.0
+        self.initial_cdf = np.cumsum(rows[:, 0] / rows.sum()) if rows.sum() else np.linspace(1 / NUM_WHEEL, 1, NUM_WHEEL)
+        self.initial_cdf[-1] = 1.0
+    
+        spine = np.array([SPINE_COUNTS[p] for p in ID_TO_PHONEME[NUM_WHEEL:]], dtype=np.float64)
+        self.spine_cdf = np.cumsum(spine / spine.sum())
+        self.spine_cdf[-1] = 1.0
+    
+        weights = np.array([w for _, w in LENGTH_WEIGHTS], dtype=np.float64)
+        self.length_values = np.array([n for n, _ in LENGTH_WEIGHTS], dtype=np.int64)
+        self.length_cdf = np.cumsum(weights / weights.sum())
+        self.length_cdf[-1] = 1.0
+    
+        date_weights = np.array([w for _, _, w in DATE_WEIGHTS])
+        self.date_cdf = np.cumsum(date_weights / date_weights.sum())
+        self.date_cdf[-1] = 1.0
+        self.date_low = np.array([lo for lo, _, _ in DATE_WEIGHTS], dtype=np.int64)
+        self.date_high = np.array([hi for _, hi, _ in DATE_WEIGHTS], dtype=np.int64)
+    
+        self.leiden = _TokenTable(_leiden_spelling())
+        self.hieroglyphs = _TokenTable([HIEROGLYPHS[p] for p in ID_TO_PHONEME.tolist()])
+        self.upos = _TokenTable(UPOS_TAGS)
+        self.glosses = _TokenTable([g.replace('\\', '\\\\') for g in GLOSSES])
+        self.words = _TokenTable(TRANSLATION_WORDS)
+    
+    def _rng(self, chunk: int) -> np.random.Generator:
+        return np.random.default_rng(np.random.SeedSequence([self.seed, chunk]))
+    
+    def phonemes(self, rng: np.random.Generator, lengths: np.ndarray) -> np.ndarray:
+        """
+        Flat phoneme IDs for sentences of the given lengths.
+    
+        Returns:
+            uint8 IDs, sentence i at [cumsum(lengths)[i-1], cumsum(lengths)[i])
+        """
+        m = len(lengths)
+        width = int(lengths.max()) if m else 0
+        steps = np.empty((m, width), dtype=np.uint8)
+    
+        # Every sentence runs the wheel chain to the longest length; the
+        # tail past each sentence's own length is discarded
+        state = np.searchsorted(self.initial_cdf, rng.random(m), side='right')
+        for t in range(width):
+            if t:
+                state = (rng.random(m)[:, None] > self.transition_cdf[state]).sum(axis=1)
+            steps[:, t] = state
+    
+        keep = np.arange(width) < lengths[:, None]
+        ids = steps[keep]
+    
+        spine = rng.random(len(ids)) < SPINE_RATE
+        ids[spine] = NUM_WHEEL + np.searchsorted(self.spine_cdf, rng.random(int(spine.sum())), side='right')
+        return ids
+    
+    def chunk(self, index: int, m: int) -> str:
+        """JSONL text for the m rows of chunk `index`."""
+        rng = self._rng(index)
+    
+        lengths = self.length_values[np.searchsorted(self.length_cdf, rng.random(m), side='right')]
+        lengths = np.maximum(lengths - rng.integers(0, 2, m), 1)
+        ids = self.phonemes(rng, lengths)
+    
+        # Word breaks: about one per MEAN_WORD_LENGTH phonemes, always at row ends
+        row_end = np.zeros(len(ids), dtype=bool)
+        row_end[np.cumsum(lengths) - 1] = True
+        word_end = (rng.random(len(ids)) < 1 / MEAN_WORD_LENGTH) | row_end
+        separators = np.where(word_end, ord(' '), 0).astype(np.uint32)
+        separators[row_end] = ord('\n')
+    
+        translits = self.leiden.render(ids, separators)
+        hieroglyphs = self.hieroglyphs.render(ids, np.where(row_end, ord('\n'), 0).astype(np.uint32))
+    
+        ends = np.flatnonzero(word_end)
+        words_per_row = np.diff(np.concatenate([[0], np.searchsorted(ends, np.cumsum(lengths) - 1, side='right')]))
+        n_words = int(words_per_row.sum())
+        word_separators = _row_separators(words_per_row, ord(' '))
+        upos = self.upos.render(rng.integers(0, len(UPOS_TAGS), n_words), word_separators)
+        glossing = self.glosses.render(rng.integers(0, len(GLOSSES), n_words), word_separators)
+    
+        translation_lengths = rng.integers(3, 11, m)
+        translations = self.words.render(
+            rng.integers(0, len(TRANSLATION_WORDS), int(translation_lengths.sum())),
+            _row_separators(translation_lengths, ord(' ')),
+        )
+    
+        period = np.searchsorted(self.date_cdf, rng.random(m), side='right')
+        not_before = rng.integers(self.date_low[period], self.date_high[period] + 1)
+        not_after = not_before + np.array(DATE_SPANS)[rng.integers(0, len(DATE_SPANS), m)]
+        missing = rng.random(m) < MISSING_DATE_RATE
+        not_before = np.where(missing, 'null', not_before.astype(str))
+        not_after = np.where(missing, 'null', not_after.astype(str))
+    
+        template = self._TEMPLATE
+        return ''.join([
+            template % row for row in zip(
+                hieroglyphs, translits, translits, upos, glossing, translations,
+                not_before.tolist(), not_after.tolist(),
+            )
+        ])
+    
+    def iter_chunks(self, n: int) -> Iterator[str]:
+        """JSONL text for n rows, one chunk of up to CHUNK_ROWS rows at a time."""
+        for index, lo in enumerate(range(0, n, CHUNK_ROWS)):
+            yield self.chunk(index, min(CHUNK_ROWS, n - lo))
+
+
+def write_synthetic_tla(path, n: int, seed: int = 0) -> Path:
+    """
+    Write n synthetic TLA rows as JSONL.
+    
+    The file is written to a temporary sibling and moved into place
+    when complete.
+    
+    Args:
+        path: Output path
+        n: Number of rows
+        seed: Generator seed
+    
+    Returns:
+        The output path
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + '.tmp')
+    generator = SyntheticTLA(seed)
+    with open(tmp, 'w', encoding='utf-8') as f:
+        for text in generator.iter_chunks(n):
+            f.write(text)
+    os.replace(tmp, path)
+    return path
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Write a synthetic TLA JSONL corpus")
+    parser.add_argument('out', help="Output path")
+    parser.add_argument('n', type=int, help="Number of rows")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    write_synthetic_tla(args.out, args.n, args.seed)
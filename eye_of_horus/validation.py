@@ -54,10 +54,22 @@ If any show systematic retrocausal patterns, direction would be questioned.
 """
 
 import re
-from typing import List, Tuple, Dict, Optional
-from dataclasses import dataclass
+import time
+from typing import List, Tuple, Dict, Optional, Callable
+from dataclasses import dataclass, field
+from multiprocessing import Pool
 
-from .corpus import Sentence, load_tla_corpus
+import numpy as np
+
+from .bitwise import NUM_PHONEMES, PHONEME_TO_ID, encode_corpus, sentence_index
+from .corpus import (
+    PERIODS,
+    Sentence,
+    load_tla_corpus,
+    load_semantic_network,
+    period_codes,
+    sentences_by_date,
+)
 
 
 # Temporal/causal markers in Leiden transliteration
@@ -105,14 +117,184 @@ def oldest_sentences(n: int = 100) -> List[Sentence]:
         n: Number of sentences to return
         
     Returns:
-        List of Sentence objects, oldest first
+        List of Sentence objects, oldest first (ties in corpus order)
+    """
+    # Read off the cached date ordering rather than re-sorting the corpus
+    return sentences_by_date('oldest', n)
+
+
+# =============================================================================
+# MARKER SCANNER
+# =============================================================================
+
+# Joins texts in batch scans; no marker contains it, so no hit can straddle two
+_BATCH_SEPARATOR = "\n"
+
+
+def _trie_pattern(node: dict, root: bool = False) -> str:
+    """Regex source for a marker trie; terminals are empty named groups."""
+    branches = []
+    for ch, child in node.items():
+        if ch is None:
+            continue
+        marks = "".join(f"(?P<m{index}>)" for index in child.get(None, []))
+        branches.append(re.escape(ch) + marks + _trie_pattern(child))
+    if not branches:
+        return ""
+    
+    source = "(?:" + "|".join(branches) + ")"
+    if not root and None in node:
+        # A marker ends here; longer markers through this node are optional
+        source += "?"
+    return source
+
+
+@dataclass
+class MarkerHits:
+    """
+    Columnar marker hits for a batch of transliterations.
+    
+    Hits for sentence i are rows offsets[i]:offsets[i+1], in the same
+    order find_markers returns them.
+    """
+    pattern_ids: np.ndarray   # (n_hits,) index into scanner.patterns
+    positions: np.ndarray     # (n_hits,) character offset in the sentence
+    offsets: np.ndarray       # (n_sentences + 1,)
+    scanner: "MarkerScanner"
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of hits per sentence."""
+        return np.diff(self.offsets)
+    
+    def sentence(self, i: int) -> List[Tuple[str, str, int]]:
+        """Hits for sentence i as (marker, meaning, position) tuples."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        patterns, meanings = self.scanner.patterns, self.scanner.meanings
+        return [
+            (patterns[k], meanings[k], int(pos))
+            for k, pos in zip(self.pattern_ids[lo:hi].tolist(), self.positions[lo:hi])
+        ]
+
+
+class MarkerScanner:
+    """
+    Multi-pattern marker automaton over a fixed marker table.
+    
+    The markers are folded into a trie and compiled to a single
+    lookahead regex, so one pass finds every occurrence of every
+    marker, overlaps included. Markers starting at the same position
+    lie on one trie path; the deepest one matched names the whole
+    chain. Hits are ordered by position, then by table order — the
+    order of the original per-marker str.find scans after a stable sort.
+    
+    Args:
+        table: (pattern, meaning) pairs, in priority order
+    """
+    
+    def __init__(self, table: List[Tuple[str, str]]):
+        self.patterns = [pattern for pattern, _ in table]
+        self.meanings = [meaning for _, meaning in table]
+        
+        trie = {}
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            node = trie
+            for ch in pattern:
+                node = node.setdefault(ch, {})
+            node.setdefault(None, []).append(index)
+        
+        self.regex = re.compile("(?=" + _trie_pattern(trie, root=True) + ")")
+        
+        # Group index -> every marker ending on the path to that group
+        self.chains = {}
+        
+        def walk(node, above):
+            here = above + node.get(None, [])
+            for index in node.get(None, []):
+                self.chains[self.regex.groupindex[f"m{index}"]] = tuple(sorted(here))
+            for ch, child in node.items():
+                if ch is not None:
+                    walk(child, here)
+        
+        walk(trie, [])
+    
+    def scan(self, text: str) -> List[Tuple[str, str, int]]:
+        """
+        All (pattern, meaning, position) hits in text, ordered.
+        
+        Text is matched as given (callers lowercase first).
+        """
+        if not self.chains:
+            return []
+        
+        patterns, meanings, chains = self.patterns, self.meanings, self.chains
+        return [
+            (patterns[k], meanings[k], match.start())
+            for match in self.regex.finditer(text)
+            for k in chains[match.lastindex]
+        ]
+    
+    def scan_batch(self, texts: List[str]) -> MarkerHits:
+        """
+        Scan many texts in one pass over their joined form.
+        
+        Returns:
+            MarkerHits with one row per hit, grouped by text
+        """
+        n = len(texts)
+        lengths = np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=n)
+        starts = np.zeros(n, dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+        
+        pattern_ids = []
+        positions = []
+        if self.chains:
+            chains = self.chains
+            for match in self.regex.finditer(_BATCH_SEPARATOR.join(texts)):
+                pos = match.start()
+                for k in chains[match.lastindex]:
+                    pattern_ids.append(k)
+                    positions.append(pos)
+        
+        pattern_ids = np.array(pattern_ids, dtype=np.int64)
+        positions = np.array(positions, dtype=np.int64)
+        
+        # Hits arrive in text order, so each text's rows are contiguous
+        owner = np.searchsorted(starts, positions, side="right") - 1
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(owner, minlength=n), out=offsets[1:])
+        
+        return MarkerHits(
+            pattern_ids=pattern_ids,
+            positions=positions - starts[owner],
+            offsets=offsets,
+            scanner=self,
+        )
+
+
+# Compiled scanner for the current marker tables
+_marker_scanner: Optional[MarkerScanner] = None
+_marker_key = None
+
+
+def get_marker_scanner() -> MarkerScanner:
     """
-    corpus = load_tla_corpus()
+    Scanner over TEMPORAL_MARKERS then PROCESS_VERBS.
     
-    # Sort by date_not_before (most negative = oldest)
-    sorted_corpus = sorted(corpus, key=lambda s: s.date_not_before)
+    Built once, and rebuilt only if either table is edited.
+    """
+    global _marker_scanner, _marker_key
     
-    return sorted_corpus[:n]
+    key = (tuple(TEMPORAL_MARKERS.items()), tuple(PROCESS_VERBS.items()))
+    if _marker_scanner is None or key != _marker_key:
+        _marker_scanner = MarkerScanner(list(key[0]) + list(key[1]))
+        _marker_key = key
+    return _marker_scanner
 
 
 def find_markers(translit: str) -> List[Tuple[str, str, int]]:
@@ -122,31 +304,102 @@ def find_markers(translit: str) -> List[Tuple[str, str, int]]:
     Returns:
         List of (marker, meaning, position) tuples
     """
-    found = []
-    translit_lower = translit.lower()
-    
-    for marker, meaning in TEMPORAL_MARKERS.items():
-        # Find all occurrences
-        start = 0
-        while True:
-            pos = translit_lower.find(marker, start)
-            if pos == -1:
-                break
-            found.append((marker, meaning, pos))
-            start = pos + 1
-    
-    for verb, meaning in PROCESS_VERBS.items():
-        start = 0
-        while True:
-            pos = translit_lower.find(verb, start)
-            if pos == -1:
-                break
-            found.append((verb, meaning, pos))
-            start = pos + 1
-    
-    # Sort by position
-    found.sort(key=lambda x: x[2])
-    return found
+    return get_marker_scanner().scan(translit.lower())
+
+
+def find_markers_batch(translits: List[str]) -> MarkerHits:
+    """
+    Find markers in many transliterations at once.
+    
+    Equivalent to calling find_markers on each, but scans the whole
+    batch in a single pass and returns columnar hits.
+    
+    Returns:
+        MarkerHits; hits.sentence(i) == find_markers(translits[i])
+    """
+    return get_marker_scanner().scan_batch([t.lower() for t in translits])
+
+
+# =============================================================================
+# CAUSAL PATTERNS
+# =============================================================================
+
+# Patterns that would indicate WRONG direction (retrocausal)
+RETROCAUSAL_PATTERNS = [
+    (r'begraben.*alt', 'buried then aged'),         # should be old...buried
+    (r'gestorben.*krank', 'died then sick'),        # should be sick...died
+    (r'ankommen.*gehen', 'arrived then went'),      # should be go...arrive
+    (r'antwort.*frage', 'answered then asked'),     # answer...question
+    (r'geboren.*schwanger', 'born then pregnant'),  # born...pregnant
+]
+
+# Patterns that CONFIRM correct direction (forward causal)
+FORWARD_PATTERNS = [
+    (r'alt.*begraben', 'aged then buried'),
+    (r'krank.*gestorben', 'sick then died'),
+    (r'gehen.*ankommen', 'went then arrived'),
+    (r'nehmen.*legen', 'took then placed'),
+    (r'öffnen.*eintreten', 'opened then entered'),
+    (r'sagen.*tun', 'said then did'),
+    (r'befehlen.*ausführen', 'commanded then executed'),
+]
+
+
+class CausalPatternSet:
+    """
+    Retrocausal and forward patterns compiled once.
+    
+    Pattern IDs number the retrocausal patterns first, then the forward
+    ones; a sentence's matches are a bitmask over those IDs. The whole
+    set is also compiled into one alternation of named groups, so a
+    sentence matching none of them (the common case) costs one search.
+    """
+    
+    def __init__(self, retrocausal: List[Tuple[str, str]], forward: List[Tuple[str, str]]):
+        self.patterns = [p for p, _ in retrocausal] + [p for p, _ in forward]
+        self.meanings = [m for _, m in retrocausal] + [m for _, m in forward]
+        self.num_retrocausal = len(retrocausal)
+        self.retrocausal_mask = (1 << len(retrocausal)) - 1
+        
+        self.compiled = [re.compile(p) for p in self.patterns]
+        self.combined = re.compile(
+            "|".join(f"(?P<p{i}>{p})" for i, p in enumerate(self.patterns))
+        ) if self.patterns else None
+    
+    def match_mask(self, text: str) -> int:
+        """Bitmask of pattern IDs found in text (matched as given)."""
+        if self.combined is None or self.combined.search(text) is None:
+            return 0
+        
+        mask = 0
+        for i, regex in enumerate(self.compiled):
+            if regex.search(text):
+                mask |= 1 << i
+        return mask
+    
+    def ids(self, mask: int) -> List[int]:
+        """Pattern IDs set in mask, ascending."""
+        return [i for i in range(len(self.patterns)) if mask >> i & 1]
+
+
+# Compiled pattern set for the current pattern tables
+_causal_patterns: Optional[CausalPatternSet] = None
+_causal_key = None
+
+
+def get_causal_patterns() -> CausalPatternSet:
+    """
+    Pattern set over RETROCAUSAL_PATTERNS then FORWARD_PATTERNS.
+    
+    Built once, and rebuilt only if either table is edited.
+    """
+    global _causal_patterns, _causal_key
+    
+    key = (tuple(RETROCAUSAL_PATTERNS), tuple(FORWARD_PATTERNS))
+    if _causal_patterns is None or key != _causal_key:
+        _causal_patterns = CausalPatternSet(list(key[0]), list(key[1]))
+        _causal_key = key
+    return _causal_patterns
 
 
 def test_causal_coherence(sent: Sentence) -> DirectionTest:
@@ -157,42 +410,20 @@ def test_causal_coherence(sent: Sentence) -> DirectionTest:
     narrative flow consistent with the transliteration order.
     """
     markers = find_markers(sent.transliteration)
+    patterns = get_causal_patterns()
+    mask = patterns.match_mask(sent.translation.lower())
     
-    # Patterns that would indicate WRONG direction (retrocausal)
-    retrocausal_patterns = [
-        r'begraben.*alt',           # buried...old (should be old...buried)
-        r'gestorben.*krank',        # died...sick (should be sick...died)  
-        r'ankommen.*gehen',         # arrive...go (should be go...arrive)
-        r'antwort.*frage',          # answer...question
-        r'geboren.*schwanger',      # born...pregnant
-    ]
+    # The first retrocausal pattern found decides the verdict
+    if mask & patterns.retrocausal_mask:
+        first = patterns.ids(mask & patterns.retrocausal_mask)[0]
+        return DirectionTest(
+            sentence=sent,
+            markers_found=markers,
+            coherent=False,
+            note=f"Retrocausal pattern: {patterns.patterns[first]}"
+        )
     
-    # Check German translation for retrocausal patterns
-    translation_lower = sent.translation.lower()
-    for pattern in retrocausal_patterns:
-        if re.search(pattern, translation_lower):
-            return DirectionTest(
-                sentence=sent,
-                markers_found=markers,
-                coherent=False,
-                note=f"Retrocausal pattern: {pattern}"
-            )
-    
-    # Patterns that CONFIRM correct direction (forward causal)
-    forward_patterns = [
-        (r'alt.*begraben', 'aged then buried'),
-        (r'krank.*gestorben', 'sick then died'),
-        (r'gehen.*ankommen', 'went then arrived'),
-        (r'nehmen.*legen', 'took then placed'),
-        (r'öffnen.*eintreten', 'opened then entered'),
-        (r'sagen.*tun', 'said then did'),
-        (r'befehlen.*ausführen', 'commanded then executed'),
-    ]
-    
-    note_parts = []
-    for pattern, meaning in forward_patterns:
-        if re.search(pattern, translation_lower):
-            note_parts.append(f"✓ {meaning}")
+    note_parts = [f"✓ {patterns.meanings[i]}" for i in patterns.ids(mask)]
     
     if markers:
         note_parts.append(f"Markers: {', '.join(m[0] for m in markers)}")
@@ -205,6 +436,104 @@ def test_causal_coherence(sent: Sentence) -> DirectionTest:
     )
 
 
+@dataclass
+class CoherenceBatch:
+    """
+    Columnar causal-coherence results, one row per sentence.
+    
+    Row i carries what test_causal_coherence(sentences[i]) decides,
+    without building a DirectionTest per sentence.
+    """
+    coherent: np.ndarray        # (n,) bool
+    pattern_masks: np.ndarray   # (n,) int64 bitmask over pattern IDs
+    marker_counts: np.ndarray   # (n,) markers found in the transliteration
+    patterns: CausalPatternSet
+    
+    def __len__(self) -> int:
+        return len(self.coherent)
+    
+    @property
+    def num_coherent(self) -> int:
+        return int(self.coherent.sum())
+    
+    @property
+    def num_with_markers(self) -> int:
+        return int(np.count_nonzero(self.marker_counts))
+    
+    def matched(self, i: int) -> List[int]:
+        """Pattern IDs matched by sentence i."""
+        return self.patterns.ids(int(self.pattern_masks[i]))
+    
+    def matched_patterns(self, i: int) -> List[str]:
+        """Pattern sources matched by sentence i."""
+        return [self.patterns.patterns[k] for k in self.matched(i)]
+    
+    def pattern_counts(self) -> np.ndarray:
+        """Number of sentences matching each pattern ID."""
+        ids = np.arange(len(self.patterns.patterns))
+        return ((self.pattern_masks[:, None] >> ids) & 1).sum(axis=0)
+
+
+def _coherence_chunk(chunk: Tuple[List[str], List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pattern masks and marker counts for (transliterations, translations)."""
+    translits, translations = chunk
+    patterns = get_causal_patterns()
+    masks = np.fromiter(
+        (patterns.match_mask(t.lower()) for t in translations),
+        dtype=np.int64, count=len(translations),
+    )
+    return masks, find_markers_batch(translits).counts
+
+
+def test_causal_coherence_batch(
+    sentences: List[Sentence],
+    workers: Optional[int] = None,
+    chunk_size: int = 4096,
+) -> CoherenceBatch:
+    """
+    Test many sentences for causal/temporal coherence at once.
+    
+    Same verdicts as test_causal_coherence, returned as columns. With
+    workers > 1, chunks of chunk_size sentences are scored across a
+    process pool; only the text columns are shipped to the workers.
+    
+    Args:
+        sentences: Sentences to test
+        workers: Worker processes (None or 1 = in-process)
+        chunk_size: Sentences handed to a worker at a time
+        
+    Returns:
+        CoherenceBatch with one row per sentence
+    """
+    translits = [s.transliteration for s in sentences]
+    translations = [s.translation for s in sentences]
+    chunks = [
+        (translits[lo:lo + chunk_size], translations[lo:lo + chunk_size])
+        for lo in range(0, len(sentences), chunk_size)
+    ]
+    
+    if workers is None or workers <= 1 or len(chunks) <= 1:
+        results = [_coherence_chunk(chunk) for chunk in chunks]
+    else:
+        with Pool(workers) as pool:
+            results = pool.map(_coherence_chunk, chunks)
+    
+    if results:
+        masks = np.concatenate([m for m, _ in results])
+        counts = np.concatenate([c for _, c in results])
+    else:
+        masks = np.zeros(0, dtype=np.int64)
+        counts = np.zeros(0, dtype=np.int64)
+    
+    patterns = get_causal_patterns()
+    return CoherenceBatch(
+        coherent=(masks & patterns.retrocausal_mask) == 0,
+        pattern_masks=masks,
+        marker_counts=counts,
+        patterns=patterns,
+    )
+
+
 def test_oldest_sentences(n: int = 100, verbose: bool = True) -> Dict:
     """
     Test the N oldest sentences for direction validation.
@@ -287,6 +616,491 @@ def test_oldest_sentences(n: int = 100, verbose: bool = True) -> Dict:
     return results
 
 
+# =============================================================================
+# FULL-CORPUS VALIDATION
+# =============================================================================
+
+@dataclass
+class ValidationShard:
+    """Coherence columns for one contiguous shard of the corpus."""
+    start: int                  # corpus row of the first sentence
+    coherent: np.ndarray        # (n,) bool
+    pattern_masks: np.ndarray   # (n,) int64 bitmask over causal pattern IDs
+    marker_counts: np.ndarray   # (n,) markers found
+    period_codes: np.ndarray    # (n,) uint8 index into PERIODS
+    timings: Dict[str, float] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.coherent)
+
+
+class ColumnSink:
+    """
+    Sink that concatenates ValidationShards into whole-corpus columns.
+    
+    Shards may arrive in any order; columns are assembled in corpus
+    order on close.
+    """
+    
+    def __init__(self):
+        self.shards: List[ValidationShard] = []
+        self.columns: Dict[str, np.ndarray] = {}
+    
+    def write(self, shard: ValidationShard):
+        self.shards.append(shard)
+    
+    def close(self):
+        shards = sorted(self.shards, key=lambda shard: shard.start)
+        names = ('coherent', 'pattern_masks', 'marker_counts', 'period_codes')
+        dtypes = (bool, np.int64, np.int64, np.uint8)
+        self.columns = {
+            name: np.concatenate([getattr(shard, name) for shard in shards])
+            if shards else np.zeros(0, dtype=dtype)
+            for name, dtype in zip(names, dtypes)
+        }
+        self.shards = []
+
+
+@dataclass
+class ValidationReport:
+    """Merged direction-validation summary for a corpus run."""
+    total: int = 0
+    coherent: int = 0
+    incoherent: int = 0
+    with_markers: int = 0
+    periods: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    pattern_counts: Optional[np.ndarray] = None
+    oldest_date: Optional[int] = None
+    newest_date: Optional[int] = None
+    elapsed: float = 0.0
+    timings: Dict[str, float] = field(default_factory=dict)
+    
+    @property
+    def sentences_per_second(self) -> float:
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+    
+    @property
+    def passed(self) -> bool:
+        """No retrocausal patterns anywhere."""
+        return self.incoherent == 0
+
+
+def _validate_shard(shard: Tuple[int, List[str], List[str], np.ndarray]) -> ValidationShard:
+    """Score one (start, transliterations, translations, dates) shard."""
+    start, translits, translations, dates = shard
+    patterns = get_causal_patterns()
+    
+    t0 = time.perf_counter()
+    counts = find_markers_batch(translits).counts
+    t1 = time.perf_counter()
+    masks = np.fromiter(
+        (patterns.match_mask(t.lower()) for t in translations),
+        dtype=np.int64, count=len(translations),
+    )
+    t2 = time.perf_counter()
+    
+    return ValidationShard(
+        start=start,
+        coherent=(masks & patterns.retrocausal_mask) == 0,
+        pattern_masks=masks,
+        marker_counts=counts,
+        period_codes=period_codes(dates),
+        timings={'markers': t1 - t0, 'patterns': t2 - t1},
+    )
+
+
+def _map_shards(shards, workers: Optional[int]):
+    """Yield _validate_shard over shards in order, across a pool if workers > 1."""
+    if workers is None or workers <= 1 or len(shards) <= 1:
+        yield from map(_validate_shard, shards)
+        return
+    with Pool(workers) as pool:
+        yield from pool.imap(_validate_shard, shards)
+
+
+def validate_corpus(
+    sentences: Optional[List[Sentence]] = None,
+    workers: Optional[int] = None,
+    sink=None,
+    shard_size: int = 4096,
+    reporter: Optional[Callable[[ValidationReport], None]] = None,
+) -> ValidationReport:
+    """
+    Run direction validation over a whole corpus.
+    
+    The corpus is cut into shards of shard_size sentences, scored
+    across a process pool, and streamed shard by shard into the sink
+    while per-period summaries are merged. Nothing is printed unless a
+    reporter is given.
+    
+    Timings: 'prepare' (building shards), 'markers' and 'patterns'
+    (summed over shards, so CPU time when pooled), 'merge' (sink and
+    summaries), 'total' (wall clock).
+    
+    Args:
+        sentences: Corpus to validate (default: the loaded TLA corpus)
+        workers: Worker processes (None or 1 = in-process)
+        sink: Object with write(ValidationShard) and close(), e.g. ColumnSink()
+        shard_size: Sentences per shard
+        reporter: Called with the final report, e.g. print_validation_report
+        
+    Returns:
+        ValidationReport
+    
+    Example:
+        >>> columns = ColumnSink()
+        >>> report = validate_corpus(workers=4, sink=columns,
+        ...                          reporter=print_validation_report)
+        >>> columns.columns['coherent'].all()
+    """
+    t_start = time.perf_counter()
+    if sentences is None:
+        sentences = load_tla_corpus()
+    
+    dates = np.array([s.date_not_before for s in sentences], dtype=np.int64)
+    shards = [
+        (
+            lo,
+            [s.transliteration for s in sentences[lo:lo + shard_size]],
+            [s.translation for s in sentences[lo:lo + shard_size]],
+            dates[lo:lo + shard_size],
+        )
+        for lo in range(0, len(sentences), shard_size)
+    ]
+    
+    n_periods = len(PERIODS)
+    totals = np.zeros(n_periods, dtype=np.int64)
+    coherent = np.zeros(n_periods, dtype=np.int64)
+    marked = np.zeros(n_periods, dtype=np.int64)
+    pattern_counts = np.zeros(len(get_causal_patterns().patterns), dtype=np.int64)
+    pattern_ids = np.arange(len(pattern_counts))
+    
+    timings = {'prepare': time.perf_counter() - t_start, 'markers': 0.0, 'patterns': 0.0, 'merge': 0.0}
+    
+    for shard in _map_shards(shards, workers):
+        t0 = time.perf_counter()
+        for stage, seconds in shard.timings.items():
+            timings[stage] += seconds
+        
+        totals += np.bincount(shard.period_codes, minlength=n_periods)
+        coherent += np.bincount(shard.period_codes, weights=shard.coherent, minlength=n_periods).astype(np.int64)
+        marked += np.bincount(shard.period_codes, weights=shard.marker_counts > 0, minlength=n_periods).astype(np.int64)
+        pattern_counts += ((shard.pattern_masks[:, None] >> pattern_ids) & 1).sum(axis=0)
+        
+        if sink is not None:
+            sink.write(shard)
+        timings['merge'] += time.perf_counter() - t0
+    
+    if sink is not None:
+        t0 = time.perf_counter()
+        sink.close()
+        timings['merge'] += time.perf_counter() - t0
+    
+    elapsed = time.perf_counter() - t_start
+    timings['total'] = elapsed
+    
+    report = ValidationReport(
+        total=len(sentences),
+        coherent=int(coherent.sum()),
+        incoherent=len(sentences) - int(coherent.sum()),
+        with_markers=int(marked.sum()),
+        periods={
+            PERIODS[code]: {
+                'coherent': int(coherent[code]),
+                'total': int(totals[code]),
+                'with_markers': int(marked[code]),
+            }
+            for code in np.flatnonzero(totals).tolist()
+        },
+        pattern_counts=pattern_counts,
+        oldest_date=int(dates.min()) if len(dates) else None,
+        newest_date=int(dates.max()) if len(dates) else None,
+        elapsed=elapsed,
+        timings=timings,
+    )
+    
+    if reporter is not None:
+        reporter(report)
+    return report
+
+
+def print_validation_report(report: ValidationReport):
+    """Print a ValidationReport: summary, periods, throughput and timings."""
+    print("\n" + "="*60)
+    print("DIRECTION VALIDATION SUMMARY")
+    print("="*60)
+    print(f"Sentences tested: {report.total}")
+    print(f"Date range: {report.oldest_date} to {report.newest_date} BCE")
+    pct = 100 * report.coherent / report.total if report.total else 0
+    print(f"Coherent: {report.coherent} ({pct:.1f}%)")
+    print(f"Incoherent (retrocausal): {report.incoherent}")
+    print(f"With temporal markers: {report.with_markers}")
+    print("\nBy period:")
+    for period, stats in report.periods.items():
+        pct = 100 * stats['coherent'] / stats['total'] if stats['total'] else 0
+        print(f"  {period}: {stats['coherent']}/{stats['total']} ({pct:.0f}%)")
+    
+    print(f"\nThroughput: {report.sentences_per_second:,.0f} sentences/s ({report.elapsed:.2f}s)")
+    for stage, seconds in report.timings.items():
+        print(f"  {stage}: {seconds:.3f}s")
+    
+    if report.passed:
+        print("\n✓ VALIDATION PASSED: No retrocausal patterns detected.")
+        print("  Direction R→L confirmed through semantic coherence.")
+    else:
+        print(f"\n⚠ WARNING: {report.incoherent} sentences show possible retrocausal patterns.")
+        print("  Manual review recommended.")
+
+
+# =============================================================================
+# DIRECTION COMPARISON
+# =============================================================================
+
+@dataclass
+class BigramModel:
+    """
+    Phoneme bigram model: log P(next | previous) over phoneme IDs.
+    
+    Rows are the previous phoneme, columns the next; counts are
+    add-alpha smoothed so unseen transitions score finitely.
+    """
+    log_probs: np.ndarray   # (NUM_PHONEMES, NUM_PHONEMES) float64
+    
+    @classmethod
+    def from_counts(cls, counts: np.ndarray, alpha: float = 1.0) -> 'BigramModel':
+        smoothed = np.asarray(counts, dtype=np.float64) + alpha
+        return cls(log_probs=np.log(smoothed / smoothed.sum(axis=1, keepdims=True)))
+    
+    @classmethod
+    def from_corpus(cls, phoneme_ids: np.ndarray, offsets: np.ndarray, alpha: float = 1.0) -> 'BigramModel':
+        """Fit to the in-sentence transitions of a ragged ID buffer."""
+        prev, nxt = _transitions(phoneme_ids, offsets)
+        counts = np.bincount(
+            prev.astype(np.int64) * NUM_PHONEMES + nxt,
+            minlength=NUM_PHONEMES * NUM_PHONEMES,
+        )
+        return cls.from_counts(counts.reshape(NUM_PHONEMES, NUM_PHONEMES), alpha)
+    
+    @classmethod
+    def from_semantic_network(cls, alpha: float = 1.0) -> 'BigramModel':
+        """Fit to the corpus bigram counts shipped in semantic_network.json."""
+        counts = np.zeros((NUM_PHONEMES, NUM_PHONEMES), dtype=np.int64)
+        for edge in load_semantic_network()['edges']:
+            counts[PHONEME_TO_ID[edge['source']], PHONEME_TO_ID[edge['target']]] += edge['count']
+        return cls.from_counts(counts, alpha)
+    
+    def score(self, phoneme_ids: np.ndarray, offsets: np.ndarray, reverse: bool = False) -> np.ndarray:
+        """
+        Log-likelihood of every sentence's transitions.
+        
+        Args:
+            phoneme_ids: Flat uint8 ID buffer
+            offsets: Sentence offsets
+            reverse: Score each sentence read back to front
+            
+        Returns:
+            (num_sentences,) float64
+        """
+        prev, nxt, owner = _transitions(phoneme_ids, offsets, with_owner=True)
+        if reverse:
+            prev, nxt = nxt, prev
+        return np.bincount(owner, weights=self.log_probs[prev, nxt], minlength=len(offsets) - 1)
+
+
+# Default model from the shipped semantic network
+_bigram_model: Optional[BigramModel] = None
+
+
+def get_bigram_model() -> BigramModel:
+    """Bigram model over the shipped corpus bigrams, built once."""
+    global _bigram_model
+    
+    if _bigram_model is None:
+        _bigram_model = BigramModel.from_semantic_network()
+    return _bigram_model
+
+
+def _transitions(phoneme_ids: np.ndarray, offsets: np.ndarray, with_owner: bool = False):
+    """(previous, next[, sentence]) for every adjacent pair inside a sentence."""
+    phoneme_ids = np.asarray(phoneme_ids, dtype=np.uint8)
+    owner = sentence_index(offsets)
+    inside = np.flatnonzero(owner[:-1] == owner[1:])
+    prev, nxt = phoneme_ids[inside], phoneme_ids[inside + 1]
+    if with_owner:
+        return prev, nxt, owner[inside]
+    return prev, nxt
+
+
+@dataclass
+class DirectionScores:
+    """Per-sentence scores for one reading direction."""
+    marker_counts: np.ndarray       # (n,) markers found
+    marker_positions: np.ndarray    # (n,) mean marker start / text length (NaN if none)
+    pattern_masks: np.ndarray       # (n,) bitmask over causal pattern IDs
+    retrocausal_hits: np.ndarray    # (n,) retrocausal patterns matched
+    forward_hits: np.ndarray        # (n,) forward patterns matched
+    coherent: np.ndarray            # (n,) bool, no retrocausal pattern
+    log_likelihood: np.ndarray      # (n,) bigram log-likelihood of the phonemes
+
+
+@dataclass
+class DirectionComparison:
+    """
+    Paired scores for the transliteration order and its reversal.
+    
+    forward is the sentence as transliterated (the R→L reading);
+    reverse reads the sentence back to front: marker positions are
+    mirrored, and the translation's word order and the phonemes are
+    reversed. Deltas are forward − reverse.
+    """
+    forward: DirectionScores
+    reverse: DirectionScores
+    transitions: np.ndarray         # (n,) phoneme transitions per sentence
+    
+    def __len__(self) -> int:
+        return len(self.transitions)
+    
+    @property
+    def log_likelihood_delta(self) -> np.ndarray:
+        return self.forward.log_likelihood - self.reverse.log_likelihood
+    
+    @property
+    def marker_position_delta(self) -> np.ndarray:
+        return self.forward.marker_positions - self.reverse.marker_positions
+    
+    @property
+    def forward_hits_delta(self) -> np.ndarray:
+        return self.forward.forward_hits - self.reverse.forward_hits
+    
+    @property
+    def retrocausal_hits_delta(self) -> np.ndarray:
+        return self.forward.retrocausal_hits - self.reverse.retrocausal_hits
+    
+    def summary(self) -> Dict:
+        """Aggregate statistics over all sentences."""
+        delta = self.log_likelihood_delta
+        scored = self.transitions > 0
+        total_transitions = int(self.transitions.sum())
+        
+        def side(scores: DirectionScores) -> Dict:
+            return {
+                'coherent': int(scores.coherent.sum()),
+                'retrocausal_hits': int(scores.retrocausal_hits.sum()),
+                'forward_hits': int(scores.forward_hits.sum()),
+                'with_markers': int(np.count_nonzero(scores.marker_counts)),
+                'mean_marker_position': _nanmean(scores.marker_positions),
+                'log_likelihood': float(scores.log_likelihood.sum()),
+            }
+        
+        return {
+            'total': len(self),
+            'forward': side(self.forward),
+            'reverse': side(self.reverse),
+            'prefer_forward': int(np.count_nonzero(delta[scored] > 0)),
+            'prefer_reverse': int(np.count_nonzero(delta[scored] < 0)),
+            'mean_log_likelihood_delta': float(delta[scored].mean()) if scored.any() else 0.0,
+            'log_likelihood_delta_per_transition': (
+                float(delta.sum() / total_transitions) if total_transitions else 0.0
+            ),
+        }
+
+
+def _nanmean(values: np.ndarray) -> float:
+    finite = values[~np.isnan(values)]
+    return float(finite.mean()) if len(finite) else float('nan')
+
+
+def _pattern_hits(masks: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    """Number of pattern IDs in [lo, hi) set in each mask."""
+    ids = np.arange(lo, hi)
+    return ((masks[:, None] >> ids) & 1).sum(axis=1)
+
+
+def compare_directions(
+    sentences: List[Sentence],
+    model: Optional[BigramModel] = None,
+) -> DirectionComparison:
+    """
+    Score both reading directions of every sentence in one pass.
+    
+    Markers are scanned once in the lowercased transliteration; the
+    reverse reading meets the same markers, so its counts are the
+    forward counts and its positions are the forward hits mirrored
+    (a marker at p of length m starts at len - p - m read backwards).
+    Causal patterns are screened in the translation and in the
+    translation with its word order reversed, and the phoneme sequence
+    is scored by a bigram model read forwards and backwards.
+    
+    Args:
+        sentences: Sentences to compare
+        model: Bigram model (default: get_bigram_model())
+        
+    Returns:
+        DirectionComparison
+    
+    Example:
+        >>> comparison = compare_directions(oldest_sentences(1000))
+        >>> comparison.summary()['prefer_forward']
+    """
+    if model is None:
+        model = get_bigram_model()
+    patterns = get_causal_patterns()
+    n = len(sentences)
+    
+    # Markers: one forward scan; the reverse reading meets the same
+    # markers, each starting where its forward occurrence ends
+    translits = [s.transliteration.lower() for s in sentences]
+    scanner = get_marker_scanner()
+    hits = scanner.scan_batch(translits)
+    counts = np.tile(hits.counts, 2)
+    owner = np.repeat(np.arange(n), hits.counts)
+    text_lengths = np.array([len(t) for t in translits], dtype=np.int64)
+    marker_lengths = np.array([len(p) for p in scanner.patterns], dtype=np.int64)
+    mirrored = text_lengths[owner] - hits.positions - marker_lengths[hits.pattern_ids]
+    position_sums = np.concatenate([
+        np.bincount(owner, weights=hits.positions, minlength=n),
+        np.bincount(owner, weights=mirrored, minlength=n),
+    ])
+    lengths = np.tile(np.maximum(text_lengths, 1), 2).astype(np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        positions = position_sums / counts / lengths
+    
+    # Causal patterns: translation and reversed word order
+    translations = [s.translation.lower() for s in sentences]
+    translations += [' '.join(t.split()[::-1]) for t in translations]
+    masks = np.fromiter(
+        (patterns.match_mask(t) for t in translations),
+        dtype=np.int64, count=2 * n,
+    )
+    retro = _pattern_hits(masks, 0, patterns.num_retrocausal)
+    forward_hits = _pattern_hits(masks, patterns.num_retrocausal, len(patterns.patterns))
+    
+    # Bigram likelihood, both directions over one buffer
+    ids, offsets = encode_corpus([s.phonemes for s in sentences])
+    likelihood = np.stack([
+        model.score(ids, offsets),
+        model.score(ids, offsets, reverse=True),
+    ])
+    
+    def scores(row: int) -> DirectionScores:
+        rows = slice(row * n, (row + 1) * n)
+        return DirectionScores(
+            marker_counts=counts[rows],
+            marker_positions=positions[rows],
+            pattern_masks=masks[rows],
+            retrocausal_hits=retro[rows],
+            forward_hits=forward_hits[rows],
+            coherent=(masks[rows] & patterns.retrocausal_mask) == 0,
+            log_likelihood=likelihood[row],
+        )
+    
+    return DirectionComparison(
+        forward=scores(0),
+        reverse=scores(1),
+        transitions=np.maximum(np.diff(offsets) - 1, 0),
+    )
+
+
 def show_sentence_detail(sent: Sentence):
     """Print full details of a sentence for manual inspection."""
     print(f"\nHieroglyphs: {sent.hieroglyphs}")
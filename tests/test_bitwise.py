@@ -9,6 +9,8 @@ Validates:
 - Relation and grammar indexing
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import numpy as np
 from eye_of_horus.bitwise import (
@@ -28,9 +30,17 @@ from eye_of_horus.bitwise import (
     is_wheel, is_spine, is_wheel_array, is_spine_array,
     decode_layer, decode_all_layers, decode_layered, LayeredResult,
     decode_text, phonemes_to_verbs_fast,
+    encode_corpus, offsets_from_lengths, local_index, layer_addresses,
+    decode_layered_batch, RaggedLayeredResult,
+    BidirectionalLayeredResult, reading_view,
     relation_index, relation_to_pair, NUM_WHEEL_RELATIONS,
+    RELATION_INDEX_TABLE, RELATION_PAIR_TABLE,
+    relation_index_array, relation_to_pair_array,
+    relation_stream, relation_stream_batch, relation_histogram,
     grammar_index, grammar_to_components, TOTAL_GRAMMAR,
     Scale,
+    pack5, unpack5, packed_size, CorpusArray,
+    ngram_counts, ngram_codes, ngram_to_ids,
 )
 from eye_of_horus.engine import (
     PHONEME_HOURGLASSES, SPINE_HOURGLASSES,
@@ -244,6 +254,139 @@ class TestLayeredDecode:
         assert result.core[2] == 'EMERGE'
 
 
+class TestBatchLayeredDecode:
+    """Test ragged corpus decode."""
+    
+    SENTENCES = [['n', 'w', 's'], ['r', 'a'], [], ['n', 'd', 'k', 'x']]
+    
+    def test_offsets_from_lengths(self):
+        offsets = offsets_from_lengths([3, 2, 0, 4])
+        np.testing.assert_array_equal(offsets, [0, 3, 5, 5, 9])
+    
+    def test_encode_corpus(self):
+        ids, offsets = encode_corpus(self.SENTENCES)
+        assert ids.dtype == np.uint8
+        assert len(ids) == 9
+        np.testing.assert_array_equal(offsets, [0, 3, 5, 5, 9])
+    
+    def test_local_index_restarts(self):
+        _, offsets = encode_corpus(self.SENTENCES)
+        np.testing.assert_array_equal(local_index(offsets), [0, 1, 2, 0, 1, 0, 1, 2, 3])
+    
+    def test_layer_addresses_subset(self):
+        """Selected layers equal the matching rows of the full gather."""
+        ids, offsets = encode_corpus(self.SENTENCES)
+        index = local_index(offsets)
+        full = layer_addresses(ids, index)
+        np.testing.assert_array_equal(layer_addresses(ids, index, [Layer.M1]), full[[Layer.M1]])
+        np.testing.assert_array_equal(layer_addresses(ids, index, [4, 0]), full[[4, 0]])
+    
+    def test_per_sentence_matches_single_decode(self):
+        """Each sentence slice should equal decoding that sentence alone."""
+        ids, offsets = encode_corpus(self.SENTENCES)
+        batch = decode_layered_batch(ids, offsets)
+        
+        assert isinstance(batch, RaggedLayeredResult)
+        assert len(batch) == len(self.SENTENCES)
+        for phonemes, sliced in zip(self.SENTENCES, batch):
+            single = decode_text(phonemes) if phonemes else None
+            for name in ('core', 'f1', 'f2', 'm1', 'm2'):
+                expected = getattr(single, name).tolist() if single else []
+                assert getattr(sliced, name).tolist() == expected
+    
+    def test_global_parity_matches_concatenation(self):
+        """Global parity should equal decoding the concatenated buffer."""
+        ids, offsets = encode_corpus(self.SENTENCES)
+        batch = decode_layered_batch(ids, offsets, parity='global')
+        whole = decode_layered(ids)
+        assert batch.to_strings() == whole.to_strings()
+    
+    def test_sentence_slices_are_views(self):
+        ids, offsets = encode_corpus(self.SENTENCES)
+        batch = decode_layered_batch(ids, offsets)
+        assert np.shares_memory(batch[1].f1, batch.f1)
+        np.testing.assert_array_equal(batch.lengths, [3, 2, 0, 4])
+    
+    def test_invalid_arguments(self):
+        ids, offsets = encode_corpus(self.SENTENCES)
+        with pytest.raises(ValueError):
+            decode_layered_batch(ids, offsets, parity='odd')
+        with pytest.raises(ValueError):
+            decode_layered_batch(ids, offsets[:-1])
+
+
+class TestDirection:
+    """Test ascend/penetrate readings."""
+    
+    def test_penetrate_uses_reversed_view(self):
+        """Penetrate reading should not copy the ID buffer."""
+        ids = np.array([ID_N, ID_W, ID_S], dtype=np.uint8)
+        view = reading_view(ids, 'penetrate')
+        assert np.shares_memory(view, ids)
+        assert view.tolist() == [ID_S, ID_W, ID_N]
+    
+    def test_penetrate_matches_reversed_decode(self):
+        """Penetrate should equal decoding the reversed sequence."""
+        phonemes = ['n', 'w', 's', 'r']
+        pen = decode_text(phonemes, direction='penetrate')
+        expected = decode_text(list(reversed(phonemes)))
+        assert pen.to_strings() == expected.to_strings()
+    
+    def test_penetrate_parity_from_reading_start(self):
+        """First phoneme read R→L takes the pole."""
+        ids = np.array([ID_N, ID_W], dtype=np.uint8)
+        verbs = decode_layer(ids, Layer.M2, direction='penetrate')
+        assert verbs.tolist() == ['FLOOD', 'INTEGRATE']
+    
+    def test_both_directions_shape(self):
+        phonemes = ['n', 'w', 's', 'r', 'a']
+        both = decode_text(phonemes, direction='both')
+        assert isinstance(both, BidirectionalLayeredResult)
+        assert both.layers.shape == (2, 5, 5)
+        assert both.ascend.to_strings() == decode_text(phonemes).to_strings()
+        assert both.penetrate.to_strings() == decode_text(phonemes, 'penetrate').to_strings()
+    
+    def test_both_layer_and_all_layers(self):
+        ids = encode_phonemes(['n', 'w', 's', 'r'])
+        layer = decode_layer(ids, Layer.F1, direction='both')
+        layers = decode_all_layers(ids, direction='both')
+        assert layer.shape == (2, 4)
+        np.testing.assert_array_equal(layers[Layer.F1], layer)
+    
+    def test_batch_penetrate_per_sentence(self):
+        """Batch penetrate keeps corpus order, each sentence reversed."""
+        sentences = [['n', 'w', 's'], ['r', 'a']]
+        ids, offsets = encode_corpus(sentences)
+        pen = decode_layered_batch(ids, offsets, direction='penetrate')
+        np.testing.assert_array_equal(pen.offsets, offsets)
+        assert pen[0].to_strings() == decode_text(['s', 'w', 'n']).to_strings()
+        assert pen[1].to_strings() == decode_text(['a', 'r']).to_strings()
+    
+    def test_batch_penetrate_matches_slices(self):
+        """Sentence i of the penetrate batch is its own penetrate decode."""
+        sentences = [['n', 'w', 's'], ['r', 'a'], [], ['p', 't', 'r', 'k'], ['m']]
+        ids, offsets = encode_corpus(sentences)
+        both = decode_layered_batch(ids, offsets, direction='both')
+        for i in range(len(sentences)):
+            expected = decode_layered(ids[offsets[i]:offsets[i + 1]], 'penetrate')
+            assert both.penetrate[i].to_strings() == expected.to_strings()
+            np.testing.assert_array_equal(both.penetrate[i].phoneme_ids, expected.phoneme_ids)
+    
+    def test_batch_both_matches_single_directions(self):
+        sentences = [['n', 'w', 's'], ['r', 'a'], ['p', 't', 'r', 'k']]
+        ids, offsets = encode_corpus(sentences)
+        both = decode_layered_batch(ids, offsets, direction='both')
+        asc = decode_layered_batch(ids, offsets)
+        pen = decode_layered_batch(ids, offsets, direction='penetrate')
+        assert both.ascend.to_strings() == asc.to_strings()
+        assert both.penetrate.to_strings() == pen.to_strings()
+        np.testing.assert_array_equal(both.penetrate.offsets, pen.offsets)
+    
+    def test_unknown_direction(self):
+        with pytest.raises(ValueError):
+            decode_layered(np.array([ID_N], dtype=np.uint8), direction='sideways')
+
+
 class TestRelations:
     """Test relation encoding."""
     
@@ -289,6 +432,57 @@ class TestRelations:
         assert len(indices) == 136
 
 
+class TestRelationArrays:
+    """Test table-backed relation indexing and relation streams."""
+    
+    def test_tables_match_scalar(self):
+        """Index table should agree with relation_index in both orders."""
+        for a in range(16):
+            for b in range(16):
+                assert RELATION_INDEX_TABLE[a, b] == relation_index(a, b)
+        assert RELATION_PAIR_TABLE.shape == (136, 2)
+    
+    def test_array_roundtrip(self):
+        a = np.array([0, 5, 15, 3], dtype=np.uint8)
+        b = np.array([15, 5, 0, 12], dtype=np.uint8)
+        idx = relation_index_array(a, b)
+        lo, hi = relation_to_pair_array(idx)
+        np.testing.assert_array_equal(lo, np.minimum(a, b))
+        np.testing.assert_array_equal(hi, np.maximum(a, b))
+    
+    def test_stream_skip_spine(self):
+        """Skip policy drops pairs that touch a spine phoneme."""
+        ids = encode_phonemes(['n', 'w', 'd', 's', 'r'])
+        expected = [relation_index(ID_N, ID_W), relation_index(ID_S, ID_R)]
+        assert relation_stream(ids).tolist() == expected
+    
+    def test_stream_bridge_spine(self):
+        """Bridge policy relates wheel phonemes across spine runs."""
+        ids = encode_phonemes(['n', 'w', 'd', 'k', 's'])
+        expected = [relation_index(ID_N, ID_W), relation_index(ID_W, ID_S)]
+        assert relation_stream(ids, spine='bridge').tolist() == expected
+    
+    def test_batch_does_not_cross_sentences(self):
+        sentences = [['n', 'w'], ['s'], ['r', 'd', 'a', 'p']]
+        ids, offsets = encode_corpus(sentences)
+        for spine in ('skip', 'bridge'):
+            relations, rel_offsets = relation_stream_batch(ids, offsets, spine)
+            for i, phonemes in enumerate(sentences):
+                single = relation_stream(encode_phonemes(phonemes), spine)
+                sliced = relations[rel_offsets[i]:rel_offsets[i + 1]]
+                assert sliced.tolist() == single.tolist()
+    
+    def test_histogram(self):
+        ids = encode_phonemes(['n', 'w', 'n', 'w'])
+        hist = relation_histogram(relation_stream(ids))
+        assert len(hist) == NUM_WHEEL_RELATIONS
+        assert hist[relation_index(ID_N, ID_W)] == 3
+    
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            relation_stream(encode_phonemes(['n', 'w']), spine='jump')
+
+
 class TestGrammar:
     """Test 408-grammar encoding."""
     
@@ -313,6 +507,125 @@ class TestGrammar:
                 assert r == rel
 
 
+class TestNgramCounts:
+    """Test sliding-window motif counting."""
+    
+    SENTENCES = [['n', 'w', 's'], ['n', 'w'], ['w', 's', 'n', 'w']]
+    
+    def test_matches_counter(self):
+        """Counts should match a Counter over in-sentence tuple slices."""
+        from collections import Counter
+        ids, offsets = encode_corpus(self.SENTENCES)
+        for n in range(1, 5):
+            expected = Counter(
+                tuple(s[i:i + n]) for s in self.SENTENCES for i in range(len(s) - n + 1)
+            )
+            counts = ngram_counts(ids, offsets, n)
+            assert dict(zip(counts.tuples(), counts.counts.tolist())) == expected
+    
+    def test_windows_do_not_cross_sentences(self):
+        """('s', 'n') spans sentences 0→1 and must only count once."""
+        ids, offsets = encode_corpus(self.SENTENCES)
+        counts = dict(ngram_counts(ids, offsets, 2).most_common())
+        assert counts[('s', 'n')] == 1
+        assert counts[('n', 'w')] == 3
+    
+    def test_codes_roundtrip(self):
+        ids, offsets = encode_corpus([['dj', 'h', 'n', 'x']])
+        codes, starts = ngram_codes(ids, offsets, 4)
+        assert starts.tolist() == [0]
+        assert decode_ids(ngram_to_ids(codes, 4)[0]) == ['dj', 'h', 'n', 'x']
+    
+    def test_grouped_by_key(self):
+        ids, offsets = encode_corpus(self.SENTENCES)
+        counts = ngram_counts(ids, offsets, 2, keys=np.array(['OK', 'MK', 'OK']))
+        assert counts.groups.tolist() == ['MK', 'OK']
+        assert counts.counts.shape == (2, len(counts.codes))
+        assert counts.most_common(group='MK') == [(('n', 'w'), 1)]
+        assert dict(counts.most_common(group='OK'))[('n', 'w')] == 2
+    
+    def test_invalid_length(self):
+        ids, offsets = encode_corpus(self.SENTENCES)
+        with pytest.raises(ValueError):
+            ngram_counts(ids, offsets, 0)
+
+
+class TestPackedStorage:
+    """Test 5-bit packing and CorpusArray storage modes."""
+    
+    def test_pack_roundtrip(self):
+        """Every length, including partial groups, should roundtrip."""
+        rng = np.random.default_rng(0)
+        for n in [0, 1, 7, 8, 9, 63, 100]:
+            ids = rng.integers(0, NUM_PHONEMES, n).astype(np.uint8)
+            packed = pack5(ids)
+            assert len(packed) == packed_size(n)
+            np.testing.assert_array_equal(unpack5(packed, n), ids)
+    
+    def test_pack_saves_three_bits(self):
+        """Packed size should be 5/8 of the uint8 size."""
+        ids = np.full(800, ID_DJ, dtype=np.uint8)
+        assert pack5(ids).nbytes == 500
+    
+    def test_packed_sentences_match_plain(self):
+        """Packed corpus should return the same sentences across blocks."""
+        rng = np.random.default_rng(1)
+        sentences = [
+            [ID_TO_PHONEME[i] for i in rng.integers(0, NUM_PHONEMES, rng.integers(0, 30))]
+            for _ in range(50)
+        ]
+        plain = CorpusArray.from_phonemes(sentences)
+        packed = CorpusArray.from_phonemes(sentences, storage='packed', block_size=16)
+        
+        assert len(packed) == len(plain) == 50
+        assert packed.nbytes < plain.nbytes
+        for a, b in zip(plain, packed):
+            np.testing.assert_array_equal(a, b)
+        np.testing.assert_array_equal(packed.ids, plain.ids)
+    
+    def test_save_load_keeps_packing(self, tmp_path):
+        corpus = CorpusArray.from_phonemes([['n', 'w'], ['d', 'k', 'x']]).pack()
+        path = tmp_path / 'corpus.npz'
+        corpus.save(path)
+        loaded = CorpusArray.load(path)
+        assert loaded.storage == 'packed'
+        assert decode_ids(loaded[1]) == ['d', 'k', 'x']
+        assert loaded.unpack().storage == 'plain'
+    
+    def test_invalid_storage(self):
+        with pytest.raises(ValueError):
+            CorpusArray.from_phonemes([['n']], storage='zip')
+    
+    @pytest.mark.parametrize("block_size", [0, -8, 12])
+    def test_invalid_block_size(self, block_size):
+        ids = np.arange(8, dtype=np.uint8)
+        with pytest.raises(ValueError):
+            CorpusArray(ids, [0, 8], 'packed', block_size=block_size)
+    
+    def test_load_checks_buffer_size(self, tmp_path):
+        """A packed file whose offsets overrun its bytes is rejected."""
+        corpus = CorpusArray.from_phonemes([['n', 'w'], ['d', 'k', 'x']]).pack()
+        path = tmp_path / 'corpus.npz'
+        corpus.save(path)
+        with np.load(path) as data:
+            fields = dict(data)
+        fields['offsets'] = np.array([0, 2, 20])
+        np.savez(path, **fields)
+        with pytest.raises(ValueError):
+            CorpusArray.load(path)
+    
+    def test_block_cache_shared_across_threads(self):
+        """Concurrent reads of different blocks each get their own IDs."""
+        ids = np.arange(64, dtype=np.uint8) % NUM_PHONEMES
+        corpus = CorpusArray(ids, np.arange(0, 65, 8), 'packed', block_size=8)
+        
+        def read(i):
+            return all(np.array_equal(corpus[i], ids[8 * i:8 * i + 8]) for _ in range(200))
+        
+        with ThreadPoolExecutor(8) as pool:
+            assert all(pool.map(read, [i % 8 for i in range(64)]))
+
+
 class TestConvenience:
     """Test convenience functions."""
     
@@ -0,0 +1,158 @@
+"""
+Tests for corpus utilities.
+
+Tests cover:
+- Period classification (scalar and column)
+- DateIndex exact-pair, window and period lookups
+- search_corpus period filtering via the index
+- Oldest/newest selection within date windows
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from eye_of_horus import corpus as corpus_module
+from eye_of_horus.corpus import (
+    PERIODS,
+    Sentence,
+    DateIndex,
+    get_date_index,
+    period_code,
+    period_codes,
+    search_corpus,
+    sentences_between,
+    sentences_by_date,
+)
+
+
+def make_sentence(translit: str, not_before: int, not_after: int) -> Sentence:
+    return Sentence(
+        hieroglyphs='', transliteration=translit, lemmatization='', upos='',
+        glossing='', translation='', date_not_before=not_before, date_not_after=not_after,
+    )
+
+
+DATES = [
+    (-2375, -2345), (-2700, -2600), (-1500, -1400), (-2375, -2345),
+    (-2181, -2100), (-2180, -2100), (-2055, -2000), (-2400, -2300),
+]
+
+
+@pytest.fixture
+def fake_corpus(monkeypatch):
+    """Small in-memory corpus installed as the loaded TLA corpus."""
+    sentences = [make_sentence('nfr', nb, na) for nb, na in DATES]
+    default_path = Path(corpus_module.__file__).parent / 'data' / 'tla_earlier_egyptian.json'
+    monkeypatch.setattr(corpus_module, '_corpus', sentences)
+    monkeypatch.setattr(corpus_module, '_corpus_path', default_path)
+    monkeypatch.setattr(corpus_module, '_date_index', None)
+    return sentences
+
+
+class TestPeriods:
+    """Tests for period classification."""
+    
+    def test_boundaries(self):
+        """Upper bounds are inclusive."""
+        assert PERIODS[period_code(-2686)] == "Early Dynastic"
+        assert PERIODS[period_code(-2685)] == "Old Kingdom"
+        assert PERIODS[period_code(-2181)] == "Old Kingdom"
+        assert PERIODS[period_code(-2180)] == "First Intermediate"
+        assert PERIODS[period_code(-1650)] == "Middle Kingdom"
+        assert PERIODS[period_code(-1649)] == "Late"
+    
+    def test_column_matches_property(self):
+        dates = np.arange(-3000, -1000, 7)
+        codes = period_codes(dates)
+        for date, code in zip(dates.tolist(), codes.tolist()):
+            assert make_sentence('', date, date).period == PERIODS[code]
+
+
+class TestDateIndex:
+    """Tests for date-sorted lookups."""
+    
+    def test_exact_rows_in_corpus_order(self, fake_corpus):
+        index = DateIndex(fake_corpus)
+        assert index.exact_rows(-2375, -2345).tolist() == [0, 3]
+        assert len(index.exact_rows(0, 0)) == 0
+    
+    def test_window_oldest_first(self, fake_corpus):
+        index = DateIndex(fake_corpus)
+        rows = index.window(-2400, -2300)
+        assert rows.tolist() == [7, 0, 3]
+    
+    def test_window_with_period(self, fake_corpus):
+        """Period restricts the window to its own date range."""
+        index = DateIndex(fake_corpus)
+        rows = index.window(-2200, -2000, period="Old Kingdom")
+        assert rows.tolist() == [4]
+        assert index.period_rows("First Intermediate").tolist() == [5, 6]
+    
+    def test_period_rows_match_property(self, fake_corpus):
+        index = DateIndex(fake_corpus)
+        for period in PERIODS:
+            expected = [i for i, s in enumerate(fake_corpus) if s.period == period]
+            assert sorted(index.period_rows(period).tolist()) == expected
+    
+    def test_select_matches_sort(self, fake_corpus):
+        """select equals a stable full sort, in both directions, for every n."""
+        index = DateIndex(fake_corpus)
+        rows = list(range(len(fake_corpus)))
+        oldest = sorted(rows, key=lambda i: fake_corpus[i].date_not_before)
+        newest = sorted(rows, key=lambda i: fake_corpus[i].date_not_before, reverse=True)
+        for n in range(len(rows) + 2):
+            assert index.select('oldest', n).tolist() == oldest[:n]
+            assert index.select('newest', n).tolist() == newest[:n]
+        assert index.select('newest').tolist() == newest
+    
+    def test_select_window(self, fake_corpus):
+        index = DateIndex(fake_corpus)
+        assert index.select('newest', 2, -2400, -2300).tolist() == [0, 3]
+        assert index.select('newest', 1, period="First Intermediate").tolist() == [6]
+        assert index.select('oldest', 5, -1000, 0).tolist() == []
+    
+    def test_select_bad_order(self, fake_corpus):
+        with pytest.raises(ValueError):
+            DateIndex(fake_corpus).select('middle', 3)
+    
+    def test_select_random_ties(self):
+        """Heavily tied dates keep corpus order in both directions."""
+        rng = np.random.default_rng(45)
+        dates = rng.integers(-2700, -2600, 300).tolist()
+        sentences = [make_sentence('', d, d) for d in dates]
+        index = DateIndex(sentences)
+        rows = list(range(len(dates)))
+        newest = sorted(rows, key=lambda i: dates[i], reverse=True)
+        for n in (0, 1, 7, 50, 299, 300):
+            assert index.select('newest', n).tolist() == newest[:n]
+    
+    def test_cached_per_corpus(self, fake_corpus):
+        index = get_date_index()
+        assert get_date_index() is index
+        assert get_date_index(fake_corpus[:2]) is not index
+
+
+class TestSearch:
+    """Tests for indexed searches over the loaded corpus."""
+    
+    def test_search_period_keeps_corpus_order(self, fake_corpus):
+        results = list(search_corpus(period="Old Kingdom"))
+        expected = [s for s in fake_corpus if s.period == "Old Kingdom"]
+        assert results == expected
+    
+    def test_search_unknown_period(self, fake_corpus):
+        assert list(search_corpus(period="Atlantis")) == []
+    
+    def test_sentences_between(self, fake_corpus):
+        results = sentences_between(-2400, -2300, period="Old Kingdom")
+        assert [s.date_not_before for s in results] == [-2400, -2375, -2375]
+
+    def test_sentences_by_date(self, fake_corpus):
+        oldest = sentences_by_date('oldest', 3)
+        assert [s.date_not_before for s in oldest] == [-2700, -2400, -2375]
+        newest = sentences_by_date('newest', 2, window="Old Kingdom")
+        assert [s.date_not_before for s in newest] == [-2181, -2375]
+        ranged = sentences_by_date('newest', window=(-2400, -2375))
+        assert [id(s) for s in ranged] == [id(fake_corpus[i]) for i in (0, 3, 7)]
@@ -0,0 +1,175 @@
+"""
+Tests for stage instrumentation.
+
+Tests cover:
+- Disabled by default: nothing recorded
+- enable()/disable() reaching references held outside the package
+- Call counts, nanoseconds and items per stage
+- snapshot, reset and export
+- Environment-variable switch
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import eye_of_horus
+from eye_of_horus import instrument
+from eye_of_horus import bitwise, mapping, pyramid
+
+
+@pytest.fixture
+def recording():
+    """Enable instrumentation for one test, then restore the default."""
+    was_enabled = instrument.is_enabled()
+    instrument.reset()
+    instrument.enable()
+    yield
+    if not was_enabled:
+        instrument.disable()
+    instrument.reset()
+
+
+@pytest.fixture
+def quiet():
+    was_enabled = instrument.is_enabled()
+    instrument.disable()
+    instrument.reset()
+    yield
+    if was_enabled:
+        instrument.enable()
+
+
+class TestSwitch:
+    """Wrappers stay bound and follow the switch."""
+    
+    def test_always_wrapped(self, quiet):
+        assert mapping.phonemes_to_verbs.__wrapped__
+        assert pyramid.phonemes_to_verbs is mapping.phonemes_to_verbs
+        assert eye_of_horus.translate is pyramid.translate
+        assert pyramid.decode_layered_ids is bitwise.decode_layered
+    
+    def test_disabled_records_nothing(self, quiet):
+        pyramid.translate("ꜥnḫ wḏꜣ snb")
+        assert instrument.snapshot() == {}
+    
+    def test_reference_held_before_enable(self, quiet):
+        """`from eye_of_horus import translate` records once enabled."""
+        from eye_of_horus import translate
+        instrument.enable()
+        try:
+            translate("ꜥnḫ wḏꜣ snb")
+        finally:
+            instrument.disable()
+        assert instrument.snapshot()['pyramid.translate']['calls'] == 1
+    
+    def test_held_wrapper_checks_switch(self, recording):
+        """A wrapper kept by outside code stops recording when disabled."""
+        held = pyramid.translate
+        instrument.disable()
+        held("ꜥnḫ wḏꜣ snb")
+        assert instrument.snapshot() == {}
+    
+    def test_results_unchanged(self, quiet):
+        plain = pyramid.translate("(w)sꞽr wnꞽs ꞽbꜣ", direction="penetrate")
+        instrument.enable()
+        try:
+            assert pyramid.translate("(w)sꞽr wnꞽs ꞽbꜣ", direction="penetrate") == plain
+        finally:
+            instrument.disable()
+
+
+class TestRecording:
+    """Stages record calls, time and items."""
+    
+    def test_translate_stages(self, recording):
+        pyramid.translate("ꜥnḫ wḏꜣ snb")
+        stages = instrument.snapshot()
+        for name in ('mapping.tokenize', 'mapping.convert', 'mapping.verbs',
+                     'pyramid.build_paragraph', 'pyramid.translate'):
+            assert stages[name]['calls'] == 1
+            assert stages[name]['ns'] > 0
+        phonemes = len(mapping.leiden_to_wheel("ꜥnḫ wḏꜣ snb"))
+        assert stages['mapping.verbs']['items'] == phonemes
+        assert stages['mapping.convert']['items'] == phonemes
+        assert stages['pyramid.translate']['ns'] >= stages['mapping.tokenize']['ns']
+    
+    def test_convert_one_span_per_call(self, recording):
+        """Word-by-word conversion is one stage call, not one per word."""
+        words = mapping.leiden_to_wheel("ꜥnḫ wḏꜣ snb", keep_words=True)
+        stages = instrument.snapshot()
+        assert stages['mapping.convert']['calls'] == 1
+        assert stages['mapping.convert']['items'] == sum(len(p) for _, p in words)
+    
+    def test_bitwise_items(self, recording):
+        ids = bitwise.encode_phonemes(['n', 'w', 's', 'sh'])
+        bitwise.decode_layered(ids)
+        bitwise.decode_layered(ids, direction=bitwise.DIRECTION_BOTH)
+        stages = instrument.snapshot()
+        assert stages['bitwise.encode'] == {
+            'calls': 1, 'ns': stages['bitwise.encode']['ns'], 'items': 4,
+        }
+        assert stages['bitwise.decode_layered']['calls'] == 2
+        assert stages['bitwise.decode_layered']['items'] == 8
+    
+    def test_span(self, recording):
+        with instrument.span("test.block") as s:
+            s.items = 5
+        with instrument.span("test.block", items=2):
+            pass
+        assert instrument.snapshot()['test.block']['calls'] == 2
+        assert instrument.snapshot()['test.block']['items'] == 7
+    
+    def test_span_disabled(self, quiet):
+        with instrument.span("test.block"):
+            pass
+        assert instrument.snapshot() == {}
+    
+    def test_json_loading(self, recording, monkeypatch):
+        monkeypatch.setattr(pyramid, '_pyramid_translations', None)
+        records = pyramid.load_pyramid_translations()
+        stage = instrument.snapshot()['pyramid.load_translations']
+        assert stage['calls'] == 1 and stage['items'] == len(records)
+
+
+class TestRegistry:
+    """snapshot, reset and export."""
+    
+    def test_snapshot_is_a_copy(self, recording):
+        instrument.record("test.stage", 10, 1)
+        snap = instrument.snapshot()
+        instrument.record("test.stage", 5)
+        assert snap == {'test.stage': {'calls': 1, 'ns': 10, 'items': 1}}
+        assert instrument.snapshot()['test.stage'] == {'calls': 2, 'ns': 15, 'items': 1}
+    
+    def test_reset(self, recording):
+        instrument.record("test.stage", 10)
+        instrument.reset()
+        assert instrument.snapshot() == {}
+    
+    def test_export(self, recording):
+        instrument.record("b.stage", 1)
+        instrument.record("a.stage", 2, 3)
+        exported = instrument.export(reset_after=True)
+        assert exported['enabled'] is True
+        assert list(exported['stages']) == ['a.stage', 'b.stage']
+        assert instrument.snapshot() == {}
+
+
+class TestEnvironment:
+    """The environment variable switches recording on at import."""
+    
+    @pytest.mark.parametrize("value, expected", [("1", True), ("yes", True), ("0", False), ("", False)])
+    def test_env_var(self, value, expected):
+        env = dict(os.environ, **{instrument.ENV_VAR: value})
+        code = (
+            "from eye_of_horus import instrument, mapping;"
+            "mapping.leiden_to_wheel('nfr');"
+            "print(instrument.is_enabled(), 'mapping.tokenize' in instrument.snapshot())"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        assert out == [str(expected), str(expected)]
@@ -6,19 +6,101 @@ Tests cover:
 - decode function (unidirectional)
 - decode_bidirectional (both directions)
 - BidirectionalLine structure
+- Layered decode parity with the hourglass engine
+- Compiled prose renderer
+- Translation cache
+- Rebuilding the shipped translations
+- Incremental updates from content hashes
+- Streaming decode generators and sinks
+- Rolling breath windows
 """
 
+import io
+import json
+import queue
+import numpy as np
 import pytest
+from eye_of_horus import pyramid, mapping
+from eye_of_horus.bitwise import (
+    Layer, CorpusArray, encode_phonemes, offsets_from_lengths, layer_addresses,
+)
+from eye_of_horus.corpus import Sentence
+from eye_of_horus.engine import get_hourglass, Mode, Pole
 from eye_of_horus.pyramid import (
     get_pyramid_texts,
+    get_pyramid_ids,
+    load_pyramid_translations,
     decode,
     decode_range,
     decode_bidirectional,
+    decode_layered,
+    decode_layered_sequence,
+    get_layered_verb,
+    translate_to_readable,
+    render_verb_ids,
+    READABLE_VERBS,
+    translate,
+    translate_bidirectional,
+    enable_translation_cache,
+    disable_translation_cache,
+    translation_cache_info,
+    TranslationCache,
+    rebuild_pyramid_translations,
+    translation_record,
+    update_pyramid_translations,
+    TranslationUpdate,
+    translation_hash,
+    affected_records,
+    lexicon_entries,
+    iter_decoded,
+    iter_bidirectional,
+    iter_layered,
+    iter_breath_windows,
+    BreathWindow,
+    drain,
+    CollectSink,
+    JSONLinesSink,
+    QueueSink,
+    DecodedPrinter,
+    BidirectionalPrinter,
+    LayeredBlock,
     DecodedLine,
     BidirectionalLine,
+    LayeredReading,
 )
 
 
+def reference_layered(phonemes):
+    """Per-phoneme hourglass decode, the original string-engine path."""
+    layers = {'core': [], 'f1': [], 'f2': [], 'm1': [], 'm2': []}
+    modes = {
+        'f1': (Mode.FEMININE, Pole.MINIMA), 'f2': (Mode.FEMININE, Pole.MAXIMA),
+        'm1': (Mode.MASCULINE, Pole.MINIMA), 'm2': (Mode.MASCULINE, Pole.MAXIMA),
+    }
+    for i, p in enumerate(phonemes):
+        hg = get_hourglass(p)
+        layers['core'].append(hg.equilibrium_masc if hg else f'?{p}')
+        for name, (mode, pole) in modes.items():
+            layers[name].append(get_layered_verb(p, i, mode, pole))
+    return LayeredReading(phonemes=phonemes, **layers)
+
+
+@pytest.fixture
+def shipped_pyramid_texts(monkeypatch):
+    """Pyramid texts rebuilt from the shipped translations (no TLA file needed)."""
+    texts = [
+        Sentence(
+            hieroglyphs='', transliteration=entry['transliteration'],
+            lemmatization='', upos='', glossing='', translation='',
+            date_not_before=-2375, date_not_after=-2345,
+        )
+        for entry in load_pyramid_translations()[:30]
+    ]
+    monkeypatch.setattr(pyramid, '_pyramid_texts', texts)
+    monkeypatch.setattr(pyramid, '_pyramid_ids', None)
+    return texts
+
+
 class TestPyramidTextsLoading:
     """Tests for corpus loading."""
     
@@ -168,3 +250,390 @@ class TestParagraphBuilding:
         """Forward and reverse paragraphs are different."""
         _, forward, reverse = decode_bidirectional(1, 3, verbose=False)
         assert forward != reverse
+
+
+class TestLayeredDecode:
+    """Tests for the bitwise-backed five-layer decode."""
+    
+    def test_sequence_matches_engine(self):
+        """Every phoneme, in both parities, matches the hourglass lookup."""
+        phonemes = ['n', 'w', 's', 'sh', 'A', 't', 'H', 'r', 'm', 'a', 'y',
+                    'b', 'p', 'i', 'kh', 'dj', 'd', 'k', 'x', 'g', 'f', 'h']
+        for seq in (phonemes, phonemes[1:], list(reversed(phonemes))):
+            assert decode_layered_sequence(seq) == reference_layered(seq)
+    
+    def test_unknown_phoneme_marked(self):
+        """Phonemes outside the 22-phoneme set read as ?p in every layer."""
+        reading = decode_layered_sequence(['n', 'q', 'w'])
+        assert reading == reference_layered(['n', 'q', 'w'])
+        assert reading.m2[1] == '?q'
+    
+    def test_shipped_corpus_matches_engine(self):
+        """Full shipped Pyramid Text stream decodes identically both ways."""
+        phonemes = [p for e in load_pyramid_translations() for p in e['phonemes']]
+        assert decode_layered_sequence(phonemes) == reference_layered(phonemes)
+        reverse = phonemes[::-1]
+        assert decode_layered_sequence(reverse) == reference_layered(reverse)
+    
+    def test_decode_layered_both_directions(self, shipped_pyramid_texts):
+        """decode_layered matches decoding the block forward and reversed."""
+        ascend, penetrate = decode_layered(2, 9, verbose=False)
+        phonemes = [p for s in shipped_pyramid_texts[1:9] for p in s.phonemes]
+        assert ascend == reference_layered(phonemes)
+        assert penetrate == reference_layered(phonemes[::-1])
+    
+    def test_pyramid_ids_cached(self, shipped_pyramid_texts):
+        ids = get_pyramid_ids()
+        assert ids is get_pyramid_ids()
+        assert len(ids) == len(shipped_pyramid_texts)
+
+
+class TestReadableProse:
+    """Tests for the compiled prose renderer."""
+    
+    VERBS = ['SHINE', 'SHINE', 'LEAD', 'EMERGE', 'FLOW', 'shine', 'Foo']
+    
+    def test_ascend_prose(self):
+        """Repeats intensify within a chunk; unknown verbs pass through."""
+        assert translate_to_readable(self.VERBS, 'ascend') == (
+            "From light, light upon light rises into the path—emerging, flowing.\n"
+            "From light, foo."
+        )
+    
+    def test_descend_prose(self):
+        assert translate_to_readable(self.VERBS, 'descend') == (
+            "Light returns through light upon light into the path—emerging, flowing.\n"
+            "Light and foo, at rest."
+        )
+    
+    def test_repeat_compares_original_verb(self):
+        """A triple repeat intensifies the second and third verbs alike."""
+        assert translate_to_readable(['CYCLE'] * 3) == (
+            "The turning, the turning upon the turning, the turning upon the turning."
+        )
+    
+    def test_repeat_resets_at_chunk_start(self):
+        prose = translate_to_readable(['FLOW'] * 6)
+        assert prose.split("\n")[1] == "And flow."
+    
+    def test_case_shares_id(self):
+        assert READABLE_VERBS.id('SHINE') == READABLE_VERBS.id('shine')
+    
+    def test_render_from_ids(self):
+        extra = []
+        ids = READABLE_VERBS.encode(self.VERBS, extra)
+        assert extra == ['foo']
+        assert render_verb_ids(ids, 'penetrate', extra) == translate_to_readable(self.VERBS, 'descend')
+    
+    def test_unknown_verbs_not_registered(self):
+        """Verbs outside the lexicon render without growing the registry."""
+        size = len(READABLE_VERBS.upon)
+        for i in range(50):
+            assert f"novel{i} upon novel{i}" in translate_to_readable([f'NOVEL{i}', f'NOVEL{i}'])
+        assert len(READABLE_VERBS.upon) == size
+        assert READABLE_VERBS.id('NOVEL0') is None
+        with pytest.raises(KeyError):
+            READABLE_VERBS.encode(['NOVEL0'])
+    
+    def test_upon_ids_cached(self):
+        assert READABLE_VERBS.upon_ids is READABLE_VERBS.upon_ids
+        assert READABLE_VERBS.upon_ids.tolist() == READABLE_VERBS.upon
+    
+    def test_empty(self):
+        assert translate_to_readable([]) == ""
+
+
+@pytest.fixture
+def translation_cache():
+    cache = enable_translation_cache(maxsize=2)
+    yield cache
+    disable_translation_cache()
+
+
+class TestTranslationCache:
+    """Tests for the opt-in translation LRU cache."""
+    
+    PHRASE = "ꜥnḫ wḏꜣ snb"
+    
+    def test_disabled_by_default(self):
+        assert translation_cache_info() is None
+    
+    def test_cached_matches_uncached(self, translation_cache):
+        for direction in ("ascend", "penetrate"):
+            expected = translate(self.PHRASE, direction)
+            disable_translation_cache()
+            assert translate(self.PHRASE, direction) == expected
+            enable_translation_cache()
+    
+    def test_hits_and_misses(self, translation_cache):
+        translate(self.PHRASE)
+        translate("ꜥnḫ  wḏꜣ\tsnb ")  # same after whitespace normalization
+        translate(self.PHRASE, "penetrate")
+        info = translation_cache_info()
+        assert (info['hits'], info['misses'], info['size']) == (1, 2, 2)
+    
+    def test_lru_eviction(self, translation_cache):
+        translate("ꜥnḫ")
+        translate("wḏꜣ")
+        translate("ꜥnḫ")        # refresh: wḏꜣ is now least recent
+        translate("snb")        # evicts wḏꜣ
+        translate("ꜥnḫ")
+        info = translation_cache_info()
+        assert info['evictions'] == 1
+        assert info['hits'] == 2
+    
+    def test_bidirectional_returns_copies(self, translation_cache):
+        first = translate_bidirectional(self.PHRASE)
+        first['verbs'].append('MUTATED')
+        second = translate_bidirectional(self.PHRASE)
+        assert 'MUTATED' not in second['verbs']
+        assert translation_cache_info()['hits'] == 1
+    
+    def test_lexicon_change_misses(self, translation_cache, monkeypatch):
+        from eye_of_horus import mapping
+        before = translate("snb")
+        monkeypatch.setitem(mapping.ALL_VERBS, 's', 'ARISE')
+        assert translate("snb") != before
+        assert translation_cache_info()['hits'] == 0
+    
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            TranslationCache(0)
+
+
+class TestRebuildTranslations:
+    """Tests for regenerating pyramid_texts_translated.json."""
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_shipped_file(self, shipped_pyramid_texts, tmp_path, workers):
+        """Rebuilt records are byte-identical to the shipped JSON layout."""
+        out = tmp_path / 'translations.json'
+        count = rebuild_pyramid_translations(
+            workers=workers, out=out, sentences=shipped_pyramid_texts, chunksize=4,
+        )
+        expected = load_pyramid_translations()[:len(shipped_pyramid_texts)]
+        assert count == len(expected)
+        assert out.read_text(encoding='utf-8') == json.dumps(expected, indent=2, ensure_ascii=True)
+    
+    def test_record_schema(self, shipped_pyramid_texts):
+        record = translation_record(7, shipped_pyramid_texts[7])
+        assert list(record) == list(load_pyramid_translations()[7])
+        assert record['id'] == 'PT_0007'
+    
+    def test_empty(self, tmp_path):
+        out = tmp_path / 'empty.json'
+        assert rebuild_pyramid_translations(workers=1, out=out, sentences=[]) == 0
+        assert json.loads(out.read_text()) == []
+
+
+class TestIncrementalTranslations:
+    """Tests for hash-keyed incremental re-translation."""
+    
+    @pytest.fixture
+    def translations(self, shipped_pyramid_texts, tmp_path):
+        out = tmp_path / 'translations.json'
+        rebuild_pyramid_translations(workers=1, out=out, sentences=shipped_pyramid_texts)
+        return out
+    
+    def test_shipped_hashes_current(self):
+        entries = lexicon_entries()
+        for record in load_pyramid_translations():
+            ids = encode_phonemes(record['phonemes'])
+            assert record['hash'] == translation_hash(ids, entries)
+    
+    def test_hash_tracks_touched_entries(self, monkeypatch):
+        ids = encode_phonemes(['n', 'w', 's'])
+        before = translation_hash(ids)
+        monkeypatch.setitem(mapping.ALL_VERBS, 'dj', 'JUDGE')
+        assert translation_hash(ids) == before
+        monkeypatch.setitem(mapping.ALL_VERBS, 'w', 'FLOW')
+        assert translation_hash(ids) != before
+    
+    def test_affected_records(self):
+        ids = encode_phonemes(['n', 'w', 's', 'dj', 'r'])
+        offsets = offsets_from_lengths([2, 0, 2, 1])
+        old = lexicon_entries()
+        new = old.copy()
+        new[encode_phonemes(['dj'])[0]] = 'JUDGE'
+        assert affected_records(ids, offsets, old, new).tolist() == [False, False, True, False]
+    
+    def test_no_change(self, shipped_pyramid_texts, translations):
+        before = translations.read_text(encoding='utf-8')
+        result = update_pyramid_translations(out=translations, sentences=shipped_pyramid_texts)
+        assert result == TranslationUpdate(changed=[], dropped=[])
+        assert translations.read_text(encoding='utf-8') == before
+    
+    def test_lexicon_edit(self, shipped_pyramid_texts, translations, tmp_path, monkeypatch):
+        """Only records reading the edited entry are re-rendered; result matches a full rebuild."""
+        monkeypatch.setitem(mapping.ALL_VERBS, 'dj', 'JUDGE')
+        changed = update_pyramid_translations(out=translations, sentences=shipped_pyramid_texts).changed
+        
+        expected = [i for i, s in enumerate(shipped_pyramid_texts) if 'dj' in s.phonemes]
+        assert changed == expected
+        
+        full = tmp_path / 'full.json'
+        rebuild_pyramid_translations(workers=1, out=full, sentences=shipped_pyramid_texts)
+        assert translations.read_text(encoding='utf-8') == full.read_text(encoding='utf-8')
+    
+    def test_new_sentences(self, shipped_pyramid_texts, translations):
+        sentences = shipped_pyramid_texts + shipped_pyramid_texts[:2]
+        changed = update_pyramid_translations(out=translations, sentences=sentences).changed
+        assert changed == [30, 31]
+        assert len(json.loads(translations.read_text(encoding='utf-8'))) == 32
+    
+    def test_missing_file_rebuilds(self, shipped_pyramid_texts, tmp_path):
+        out = tmp_path / 'new.json'
+        changed = update_pyramid_translations(out=out, sentences=shipped_pyramid_texts).changed
+        assert changed == list(range(30))
+    
+    def test_shrunk_source_reports_dropped(self, shipped_pyramid_texts, translations):
+        result = update_pyramid_translations(out=translations, sentences=shipped_pyramid_texts[:28])
+        assert result == TranslationUpdate(changed=[], dropped=['PT_0028', 'PT_0029'])
+        records = json.loads(translations.read_text(encoding='utf-8'))
+        assert [r['id'] for r in records] == [f"PT_{i:04d}" for i in range(28)]
+    
+    def test_source_change(self, shipped_pyramid_texts, translations, monkeypatch):
+        """A changed transliteration is re-rendered; others tokenize once each."""
+        calls = []
+        monkeypatch.setattr(pyramid, 'leiden_to_wheel', lambda t, *a: calls.append(t) or mapping.leiden_to_wheel(t, *a))
+        sentences = list(shipped_pyramid_texts)
+        sentences[3] = Sentence(
+            hieroglyphs='', transliteration='ꜥnḫ wḏꜣ snb',
+            lemmatization='', upos='', glossing='', translation='',
+            date_not_before=-2375, date_not_after=-2345,
+        )
+        assert update_pyramid_translations(out=translations, sentences=sentences).changed == [3]
+        assert len(calls) == len(set(calls))
+    
+    def test_leiden_map_edit(self, shipped_pyramid_texts, translations, tmp_path, monkeypatch):
+        """Editing the Leiden map re-renders the records it reaches; result matches a full rebuild."""
+        monkeypatch.setitem(mapping.LEIDEN_TO_WHEEL, 'z', 'n')
+        changed = update_pyramid_translations(out=translations, sentences=shipped_pyramid_texts).changed
+        
+        expected = [i for i, s in enumerate(shipped_pyramid_texts) if 'z' in s.transliteration.lower()]
+        assert expected and changed == expected
+        
+        full = tmp_path / 'full.json'
+        rebuild_pyramid_translations(workers=1, out=full, sentences=shipped_pyramid_texts)
+        assert translations.read_text(encoding='utf-8') == full.read_text(encoding='utf-8')
+    
+    def test_failed_write_removes_tmp(self, shipped_pyramid_texts, translations, monkeypatch):
+        before = translations.read_text(encoding='utf-8')
+        monkeypatch.setitem(mapping.ALL_VERBS, 'dj', 'JUDGE')
+        monkeypatch.setattr(pyramid, '_record_json', lambda args: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            update_pyramid_translations(out=translations, sentences=shipped_pyramid_texts)
+        assert translations.read_text(encoding='utf-8') == before
+        assert list(translations.parent.iterdir()) == [translations]
+
+
+class TestStreamingDecode:
+    """Tests for the iter_* generators and sinks."""
+    
+    def test_iter_decoded_lazy(self, shipped_pyramid_texts):
+        lines = iter_decoded(3)
+        first = next(lines)
+        assert isinstance(first, DecodedLine)
+        assert first.index == 3
+        assert len(list(lines)) == len(shipped_pyramid_texts) - 4
+    
+    def test_iter_decoded_matches_decode(self, shipped_pyramid_texts):
+        assert list(iter_decoded(2, 5)) == decode(5, 2, verbose=False)
+    
+    def test_iter_bidirectional_matches(self, shipped_pyramid_texts):
+        lines, _, _ = decode_bidirectional(4, 12, verbose=False)
+        assert list(iter_bidirectional(4, 12)) == lines
+    
+    def test_iter_bidirectional_start_past_end(self, shipped_pyramid_texts):
+        with pytest.raises(ValueError):
+            next(iter_bidirectional(len(shipped_pyramid_texts) + 1))
+    
+    def test_iter_layered_blocks(self, shipped_pyramid_texts):
+        """Blocks tile the range; each equals decode_layered on its lines."""
+        blocks = list(iter_layered(1, 20, block=9))
+        assert [(b.start, b.end) for b in blocks] == [(1, 9), (10, 18), (19, 20)]
+        assert isinstance(blocks[0], LayeredBlock)
+        assert (blocks[1].ascend, blocks[1].penetrate) == decode_layered(10, 18, verbose=False)
+    
+    def test_printer_matches_verbose(self, shipped_pyramid_texts, capsys):
+        decode_bidirectional(1, 9, verbose=True)
+        expected = capsys.readouterr().out
+        drain(iter_bidirectional(1, 9), BidirectionalPrinter(1, 9))
+        assert capsys.readouterr().out == expected
+        
+        decode(4, 2, verbose=True)
+        expected = capsys.readouterr().out
+        drain(iter_decoded(2, 4), DecodedPrinter())
+        assert capsys.readouterr().out == expected
+    
+    def test_jsonlines_sink(self, shipped_pyramid_texts):
+        stream = io.StringIO()
+        assert drain(iter_bidirectional(1, 3), JSONLinesSink(stream)) == 3
+        rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [r['index'] for r in rows] == [0, 1, 2]
+        assert rows[0]['reverse_verbs'] == rows[0]['forward_verbs'][::-1]
+    
+    def test_queue_and_collect_sinks(self, shipped_pyramid_texts):
+        q = queue.Queue()
+        collected = CollectSink()
+        drain(iter_layered(1, 9, block=3), QueueSink(q, sentinel='done'), collected)
+        items = [q.get() for _ in range(4)]
+        assert items[:3] == collected.records
+        assert items[3] == 'done'
+
+
+def window_verb_counts(ids):
+    """Per-layer address counts of a reading, decoded from scratch."""
+    addresses = layer_addresses(ids, np.arange(len(ids)))
+    return np.stack([np.bincount(row, minlength=256) for row in addresses])
+
+
+class TestBreathWindows:
+    """Tests for the rolling N-line breath window."""
+    
+    @pytest.fixture
+    def corpus(self):
+        return CorpusArray.from_phonemes([e['phonemes'] for e in load_pyramid_translations()[:40]])
+    
+    def test_one_record_per_position(self, corpus):
+        windows = list(iter_breath_windows(9, corpus))
+        assert len(windows) == 32
+        assert [(w.start, w.end) for w in windows[:2]] == [(1, 9), (2, 10)]
+        assert isinstance(windows[0], BreathWindow)
+    
+    def test_running_counts_match_scratch(self, corpus):
+        """Incremental counts equal a fresh count of every window."""
+        for size in (1, 4, 9):
+            for w in iter_breath_windows(size, corpus):
+                ids = w.phoneme_ids
+                assert np.array_equal(w.phoneme_counts, np.bincount(ids, minlength=23))
+                assert np.array_equal(w.ascend_verb_counts, window_verb_counts(ids))
+                assert np.array_equal(w.penetrate_verb_counts, window_verb_counts(ids[::-1]))
+    
+    def test_layered_matches_decode_layered(self, shipped_pyramid_texts):
+        window = list(iter_breath_windows(9))[3]
+        ascend, penetrate = decode_layered(window.start, window.end, verbose=False)
+        assert window.ascend.m2.tolist() == ascend.m2
+        assert window.penetrate.f1.tolist() == penetrate.f1
+    
+    def test_layer_verbs(self, corpus):
+        window = next(iter_breath_windows(9, corpus))
+        core = window.layer_verbs(Layer.CORE)
+        assert sum(core.values()) == window.num_phonemes
+        assert core == {v: window.ascend.core.tolist().count(v) for v in core}
+    
+    def test_stats(self, corpus):
+        window = next(iter_breath_windows(9, corpus))
+        stats = window.stats()
+        assert stats['lines'] == 9
+        assert stats['phonemes'] == int(window.line_lengths.sum())
+    
+    def test_short_corpus_single_window(self, corpus):
+        windows = list(iter_breath_windows(100, corpus))
+        assert len(windows) == 1
+        assert windows[0].num_lines == 40
+    
+    def test_jsonlines(self, corpus):
+        stream = io.StringIO()
+        drain(iter_breath_windows(9, corpus), JSONLinesSink(stream))
+        assert len(stream.getvalue().splitlines()) == 32
@@ -8,10 +8,16 @@ Tests cover:
 - Breath phase tracking
 - Script health scoring
 - Fibonacci segmentation
+- Vectorized boundaries over many lengths
+- Phi-boundary masks
+- Columnar corpus rhythm
+- Batch breath-phase labelling
 """
 
 import pytest
 import math
+from collections import Counter
+import numpy as np
 from eye_of_horus.rhythm import (
     PHI,
     PHI_INV,
@@ -28,7 +34,20 @@ from eye_of_horus.rhythm import (
     segment_by_fibonacci,
     analyze_line_rhythm,
     SCRIPT_RATIOS,
+    YUGAS,
+    phi_boundary_table,
+    phi_boundaries_array,
+    phi_mask_table,
+    phi_boundary_mask,
+    yuga_spans,
+    analyze_corpus_rhythm,
+    BREATH_PHASES,
+    BREATH_PHASE_CODES,
+    breath_phase_codes,
+    breath_phase_distribution,
 )
+from eye_of_horus import rhythm
+from eye_of_horus.bitwise import CorpusArray, Layer, decode_layered
 
 
 class TestGoldenRatio:
@@ -346,3 +365,173 @@ class TestLine1YugaMapping:
         kali_start = yugas['kali'][0]
         # Should be near position 21 (0-indexed)
         assert kali_start >= 20
+
+
+class TestVectorizedBoundaries:
+    """Tests for phi_boundaries_array and yuga_spans."""
+    
+    LENGTHS = [23, 0, 1, 2, 3, 5, 23, 144, 7, 5]
+    
+    def test_phi_matches_scalar(self):
+        bounds, offsets = phi_boundaries_array(self.LENGTHS)
+        assert len(offsets) == len(self.LENGTHS) + 1
+        for i, n in enumerate(self.LENGTHS):
+            assert bounds[offsets[i]:offsets[i + 1]].tolist() == detect_phi_boundaries(n)
+    
+    def test_phi_table_memoized(self):
+        assert phi_boundary_table(89) is phi_boundary_table(89)
+        assert not phi_boundary_table(89).flags.writeable
+    
+    def test_yuga_matches_scalar(self):
+        spans = yuga_spans(self.LENGTHS + list(range(200)))
+        assert spans.shape == (len(self.LENGTHS) + 200, 4)
+        for row, n in zip(spans, self.LENGTHS + list(range(200))):
+            yugas = detect_yuga_boundaries(n)
+            assert row.tolist() == [yugas[name][1] for name in YUGAS]
+    
+    def test_empty(self):
+        bounds, offsets = phi_boundaries_array([])
+        assert len(bounds) == 0 and offsets.tolist() == [0]
+        assert yuga_spans(np.array([], dtype=int)).shape == (0, 4)
+
+
+def scan_phi_boundary(position, total, tolerance):
+    """Reference: scan the boundary list."""
+    return any(abs(position - b) <= tolerance for b in detect_phi_boundaries(total))
+
+
+class TestPhiBoundaryMask:
+    """Tests for cached phi-boundary masks."""
+    
+    @pytest.mark.parametrize("tolerance", [-1, 0, 0.5, 1.5, 3])
+    def test_point_query_matches_scan(self, tolerance):
+        for total in range(40):
+            for position in range(-3, total + 3):
+                expected = scan_phi_boundary(position, total, tolerance)
+                assert is_at_phi_boundary(position, total, tolerance) == expected
+    
+    def test_mask_cached(self):
+        assert phi_mask_table(55, 1.5) is phi_mask_table(55, 1.2)
+    
+    @pytest.mark.parametrize("tolerance", [float('nan'), float('inf'), -float('inf'), 1e9])
+    def test_non_finite_tolerance(self, tolerance):
+        for total in (0, 7, 23):
+            expected = [scan_phi_boundary(p, total, tolerance) for p in range(total)]
+            assert phi_mask_table(total, tolerance).tolist() == expected
+            assert is_at_phi_boundary(3, total, tolerance) == scan_phi_boundary(3, total, tolerance)
+    
+    def test_long_lengths_not_cached(self):
+        """Point queries never build a mask; long masks are not kept."""
+        before = rhythm._cached_phi_mask.cache_info().currsize
+        assert is_at_phi_boundary(3, 10**9) == scan_phi_boundary(3, 10**9, 0.5)
+        long = rhythm.PHI_MASK_CACHE_LENGTH + 1
+        assert phi_mask_table(long) is not phi_mask_table(long)
+        assert rhythm._cached_phi_mask.cache_info().currsize == before
+    
+    def test_flat_mask_aligned(self):
+        lengths = [23, 0, 5, 40, 23]
+        mask = phi_boundary_mask(lengths, tolerance=1)
+        expected = [scan_phi_boundary(p, n, 1) for n in lengths for p in range(n)]
+        assert mask.dtype == bool
+        assert mask.tolist() == expected
+    
+    def test_filters_ragged_buffer(self):
+        ids = np.arange(28)
+        mask = phi_boundary_mask([23, 5], tolerance=0)
+        assert ids[mask].tolist() == detect_phi_boundaries(23) + [23 + b for b in detect_phi_boundaries(5)]
+
+
+@pytest.fixture
+def ragged_corpus():
+    rng = np.random.default_rng(7)
+    phonemes = ['n', 'w', 's', 'r', 'm', 'k']
+    return CorpusArray.from_phonemes([
+        [phonemes[j] for j in rng.integers(0, len(phonemes), n)]
+        for n in rng.integers(0, 40, 300)
+    ])
+
+
+class TestCorpusRhythm:
+    """Tests for analyze_corpus_rhythm."""
+    
+    def test_matches_line_analysis(self, ragged_corpus):
+        rhythm = analyze_corpus_rhythm(ragged_corpus)
+        assert len(rhythm) == len(ragged_corpus)
+        for i, ids in enumerate(ragged_corpus):
+            analysis = analyze_line_rhythm(ids.tolist())
+            assert rhythm.boundaries(i).tolist() == analysis['phi_boundaries']
+            assert [s.tolist() for s in rhythm.segments(i)] == analysis['phi_segments']
+            sizes = rhythm.segment_sizes[i]
+            assert sizes[sizes > 0].tolist() == analysis['segment_sizes']
+            yugas = analysis['yuga_boundaries']
+            assert rhythm.yuga_spans[i].tolist() == [yugas[name][1] for name in YUGAS]
+    
+    def test_segments_are_views(self, ragged_corpus):
+        rhythm = analyze_corpus_rhythm(ragged_corpus)
+        i = int(np.argmax(ragged_corpus.lengths))
+        assert np.shares_memory(rhythm.segment(i, 0), ragged_corpus.ids)
+    
+    def test_chunked_matches_serial(self, ragged_corpus):
+        serial = analyze_corpus_rhythm(ragged_corpus)
+        chunked = analyze_corpus_rhythm(ragged_corpus, workers=3, chunk_size=37)
+        for name in ('phi_boundaries', 'boundary_offsets', 'segment_sizes',
+                     'segment_starts', 'yuga_spans'):
+            assert np.array_equal(getattr(serial, name), getattr(chunked, name))
+    
+    def test_max_segments(self, ragged_corpus):
+        rhythm = analyze_corpus_rhythm(ragged_corpus, max_segments=3)
+        assert rhythm.segment_sizes.shape == (len(ragged_corpus), 3)
+        assert np.array_equal(rhythm.segment_sizes.sum(axis=1), ragged_corpus.lengths)
+
+
+class TestBatchBreathPhase:
+    """Tests for breath_phase_codes and breath_phase_distribution."""
+    
+    def test_codes_match_scalar(self):
+        for block_size in (1, 2, 5, 9, 13):
+            for offset in (0, 1, 4, 11, -2):
+                codes = breath_phase_codes(30, block_size, offset)
+                assert codes.dtype == np.uint8
+                for i, code in enumerate(codes):
+                    position = (i - offset) % block_size + 1
+                    assert BREATH_PHASES[code] == detect_breath_phase(position, block_size)
+    
+    def test_nine_line_codes(self):
+        codes = breath_phase_codes(9)
+        phases = [BREATH_PHASES[c].value for c in codes]
+        structure = get_fibonacci_line_structure()
+        for name, lines in structure.items():
+            assert all(phases[line - 1] == name for line in lines)
+    
+    def test_distribution_matches_per_line(self, ragged_corpus):
+        dist = breath_phase_distribution(ragged_corpus, block_size=7, offset=3,
+                                         start=20, stop=120, layer=Layer.F1)
+        verbs = {phase: Counter() for phase in BREATH_PHASES}
+        phonemes = {phase: Counter() for phase in BREATH_PHASES}
+        for k, code in enumerate(dist.phase_codes):
+            ids = ragged_corpus.sentence(20 + k)
+            verbs[BREATH_PHASES[code]].update(decode_layered(ids).f1.tolist())
+            phonemes[BREATH_PHASES[code]].update(ids.tolist())
+        for phase in BREATH_PHASES:
+            assert dist.verbs(phase) == dict(verbs[phase])
+            counts = dist.phoneme_counts[BREATH_PHASE_CODES[phase]]
+            assert {i: int(counts[i]) for i in np.flatnonzero(counts)} == dict(phonemes[phase])
+    
+    def test_counts_cover_slice(self, ragged_corpus):
+        dist = breath_phase_distribution(ragged_corpus)
+        assert dist.phoneme_counts.sum() == ragged_corpus.lengths.sum()
+        assert len(dist.phase_codes) == len(ragged_corpus)
+
+    
+    def test_empty_ranges(self, ragged_corpus):
+        """Ranges past the end or reversed select no lines."""
+        n = len(ragged_corpus)
+        for start, stop in ((n, None), (n + 5, None), (40, 10), (7, 7)):
+            dist = breath_phase_distribution(ragged_corpus, start=start, stop=stop)
+            assert len(dist.phase_codes) == 0
+            assert dist.phoneme_counts.sum() == 0
+            assert dist.verb_counts.sum() == 0
+    
+    def test_negative_range(self, ragged_corpus):
+        with pytest.raises(ValueError):
+            breath_phase_distribution(ragged_corpus, start=-1)
@@ -0,0 +1,134 @@
+"""
+Tests for the synthetic TLA corpus generator.
+
+Tests cover:
+- TLA JSONL schema and loading through load_tla_corpus
+- Reproducibility per seed
+- Phoneme chain follows the semantic network's bigrams
+- Date and length distributions
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from eye_of_horus import synthetic
+from eye_of_horus.bitwise import NUM_WHEEL, PHONEME_TO_ID
+from eye_of_horus.corpus import load_semantic_network, load_tla_corpus
+from eye_of_horus.synthetic import (
+    DATE_WEIGHTS,
+    SyntheticTLA,
+    write_synthetic_tla,
+)
+
+TLA_FIELDS = {
+    'hieroglyphs', 'transliteration', 'lemmatization', 'UPOS', 'glossing',
+    'translation', 'dateNotBefore', 'dateNotAfter',
+}
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Force several chunks on small outputs."""
+    monkeypatch.setattr(synthetic, 'CHUNK_ROWS', 700)
+
+
+@pytest.fixture
+def synthetic_file(tmp_path, small_chunks):
+    return write_synthetic_tla(tmp_path / 'tla.json', 2000, seed=49)
+
+
+class TestSchema:
+    """Rows follow the TLA JSONL layout."""
+    
+    def test_row_count_and_fields(self, synthetic_file):
+        lines = synthetic_file.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 2000
+        for line in lines:
+            row = json.loads(line)
+            assert set(row) == TLA_FIELDS
+    
+    def test_loads_as_corpus(self, synthetic_file):
+        corpus = load_tla_corpus(str(synthetic_file))
+        assert len(corpus) == 2000
+        assert all(sent.phonemes for sent in corpus)
+    
+    def test_words_align(self, synthetic_file):
+        """UPOS and glossing have one tag per transliterated word."""
+        for line in synthetic_file.read_text(encoding='utf-8').splitlines():
+            row = json.loads(line)
+            words = len(row['transliteration'].split())
+            assert len(row['UPOS'].split()) == words
+            assert len(row['glossing'].split()) == words
+    
+    def test_no_temp_file_left(self, synthetic_file):
+        assert [p.name for p in synthetic_file.parent.iterdir()] == ['tla.json']
+
+
+class TestReproducible:
+    """Output depends only on (n, seed)."""
+    
+    def test_same_seed_same_bytes(self, tmp_path, small_chunks):
+        a = write_synthetic_tla(tmp_path / 'a.json', 1500, seed=3)
+        b = write_synthetic_tla(tmp_path / 'b.json', 1500, seed=3)
+        assert a.read_bytes() == b.read_bytes()
+    
+    def test_different_seed(self, tmp_path, small_chunks):
+        a = write_synthetic_tla(tmp_path / 'a.json', 500, seed=3)
+        b = write_synthetic_tla(tmp_path / 'b.json', 500, seed=4)
+        assert a.read_bytes() != b.read_bytes()
+    
+    def test_chunks_differ(self, small_chunks):
+        """Each chunk draws from its own stream."""
+        generator = SyntheticTLA(seed=1)
+        assert generator.chunk(0, 50) != generator.chunk(1, 50)
+
+
+class TestDistributions:
+    """Generated content follows the configured distributions."""
+    
+    def test_wheel_transitions_are_network_edges(self):
+        """Adjacent wheel phonemes only form bigrams seen in the network."""
+        edges = {
+            (PHONEME_TO_ID[e['source']], PHONEME_TO_ID[e['target']])
+            for e in load_semantic_network()['edges']
+        }
+        generator = SyntheticTLA(seed=5)
+        rng = np.random.default_rng(0)
+        lengths = rng.integers(1, 30, 300)
+        ids = generator.phonemes(rng, lengths)
+        assert len(ids) == lengths.sum()
+        
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        for lo, n in zip(starts.tolist(), lengths.tolist()):
+            seq = ids[lo:lo + n].tolist()
+            for a, b in zip(seq, seq[1:]):
+                if a < NUM_WHEEL and b < NUM_WHEEL:
+                    assert (a, b) in edges
+    
+    def test_spine_rate(self):
+        generator = SyntheticTLA(seed=6)
+        rng = np.random.default_rng(1)
+        ids = generator.phonemes(rng, np.full(2000, 20))
+        rate = np.mean(ids >= NUM_WHEEL)
+        assert abs(rate - synthetic.SPINE_RATE) < 0.01
+    
+    def test_dates(self, synthetic_file):
+        low = min(lo for lo, _, _ in DATE_WEIGHTS)
+        high = max(hi for _, hi, _ in DATE_WEIGHTS)
+        missing = 0
+        for line in synthetic_file.read_text(encoding='utf-8').splitlines():
+            row = json.loads(line)
+            if row['dateNotBefore'] is None:
+                missing += 1
+                continue
+            assert low <= row['dateNotBefore'] <= high
+            assert row['dateNotAfter'] > row['dateNotBefore']
+        assert missing < 60
+    
+    def test_lengths(self, synthetic_file):
+        corpus = load_tla_corpus(str(synthetic_file))
+        lengths = np.array([len(s.phonemes) for s in corpus])
+        assert lengths.min() >= 1
+        assert 10 < lengths.mean() < 20
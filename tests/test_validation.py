@@ -0,0 +1,489 @@
+"""
+Tests for direction validation module.
+
+Tests cover:
+- Marker scanning against the per-marker str.find reference
+- Overlapping and prefix markers
+- Batch marker scanning
+- Compiled causal pattern set
+- Batch causal-coherence testing
+- Oldest-sentence selection
+- Full-corpus validation runner
+- Paired forward/reverse direction comparison
+"""
+
+import random
+import re
+import pytest
+import numpy as np
+from eye_of_horus import validation
+from eye_of_horus.bitwise import NUM_PHONEMES, encode_corpus, encode_phonemes
+from eye_of_horus.corpus import PERIODS, Sentence
+from eye_of_horus.validation import (
+    RETROCAUSAL_PATTERNS,
+    FORWARD_PATTERNS,
+    CausalPatternSet,
+    get_causal_patterns,
+    ColumnSink,
+    ValidationShard,
+    print_validation_report,
+    BigramModel,
+    compare_directions,
+    get_bigram_model,
+    TEMPORAL_MARKERS,
+    PROCESS_VERBS,
+    MarkerScanner,
+    find_markers,
+    find_markers_batch,
+    get_marker_scanner,
+)
+
+
+def reference_find(text, table):
+    """Original algorithm: one str.find loop per marker, stable sort."""
+    found = []
+    for marker, meaning in table:
+        start = 0
+        while True:
+            pos = text.find(marker, start)
+            if pos == -1:
+                break
+            found.append((marker, meaning, pos))
+            start = pos + 1
+    found.sort(key=lambda x: x[2])
+    return found
+
+
+MARKER_TABLE = list(TEMPORAL_MARKERS.items()) + list(PROCESS_VERBS.items())
+
+
+def random_translit(rng, alphabet, n):
+    """Random text dense in marker characters."""
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+@pytest.fixture
+def texts():
+    rng = random.Random(43)
+    alphabet = sorted({ch for m, _ in MARKER_TABLE for ch in m}) + [" ", ".", "A", "X"]
+    return [random_translit(rng, alphabet, rng.randint(0, 60)) for _ in range(500)]
+
+
+# =============================================================================
+# MARKER SCANNER
+# =============================================================================
+
+class TestMarkerScanner:
+    """Test the compiled marker scanner."""
+    
+    def test_matches_reference(self, texts):
+        """find_markers equals the per-marker scans on random text."""
+        for text in texts:
+            assert find_markers(text) == reference_find(text.lower(), MARKER_TABLE)
+    
+    def test_known_sentence(self):
+        """Overlapping markers are all reported in position order."""
+        hits = find_markers("jw ḫr.f jsk sḏm")
+        assert [(m, p) for m, _, p in hits] == [
+            ("jw", 0), ("ḫr", 3), ("jsk", 8), ("sḏm", 12),
+        ]
+    
+    def test_lowercases_input(self):
+        """Input is lowercased before scanning."""
+        assert find_markers("JW") == [("jw", TEMPORAL_MARKERS["jw"], 0)]
+    
+    def test_empty(self):
+        """No text, no hits."""
+        assert find_markers("") == []
+    
+    def test_prefix_and_overlap(self):
+        """Markers that prefix or overlap one another are all found."""
+        table = [("abc", "long"), ("ab", "short"), ("b", "inner"), ("bcd", "tail")]
+        scanner = MarkerScanner(table)
+        rng = random.Random(7)
+        for _ in range(300):
+            text = random_translit(rng, "abcd", rng.randint(0, 30))
+            assert scanner.scan(text) == reference_find(text, table)
+    
+    def test_shared_pattern(self):
+        """A marker listed twice is reported twice, in table order."""
+        scanner = MarkerScanner([("x", "first"), ("y", "other"), ("x", "second")])
+        assert scanner.scan("xx") == [
+            ("x", "first", 0), ("x", "second", 0),
+            ("x", "first", 1), ("x", "second", 1),
+        ]
+    
+    def test_scanner_cached(self):
+        """The default scanner is built once."""
+        assert get_marker_scanner() is get_marker_scanner()
+    
+    def test_scanner_rebuilt_on_edit(self, monkeypatch):
+        """Editing a marker table rebuilds the scanner."""
+        before = get_marker_scanner()
+        monkeypatch.setitem(TEMPORAL_MARKERS, "zq", "test marker")
+        assert get_marker_scanner() is not before
+        assert find_markers("azq") == [("zq", "test marker", 1)]
+
+
+class TestMarkerBatch:
+    """Test batch marker scanning."""
+    
+    def test_matches_single(self, texts):
+        """Each sentence of a batch equals its own scan."""
+        hits = find_markers_batch(texts)
+        assert len(hits) == len(texts)
+        for i, text in enumerate(texts):
+            assert hits.sentence(i) == find_markers(text)
+    
+    def test_counts(self, texts):
+        """Per-sentence counts match the hit lists."""
+        hits = find_markers_batch(texts)
+        expected = [len(find_markers(t)) for t in texts]
+        np.testing.assert_array_equal(hits.counts, expected)
+        assert hits.offsets[-1] == len(hits.pattern_ids) == len(hits.positions)
+    
+    def test_no_cross_sentence_hits(self):
+        """A marker split across two sentences is not found."""
+        hits = find_markers_batch(["j", "w", "jw"])
+        assert hits.sentence(0) == []
+        assert hits.sentence(1) == []
+        assert hits.sentence(2) == [("jw", TEMPORAL_MARKERS["jw"], 0)]
+    
+    def test_empty_batch(self):
+        """An empty batch has no sentences and no hits."""
+        hits = find_markers_batch([])
+        assert len(hits) == 0
+        assert len(hits.pattern_ids) == 0
+
+
+# =============================================================================
+# CAUSAL COHERENCE
+# =============================================================================
+
+CAUSAL_WORDS = [
+    "begraben", "alt", "gestorben", "krank", "ankommen", "gehen", "antwort",
+    "frage", "geboren", "schwanger", "nehmen", "legen", "öffnen", "eintreten",
+    "sagen", "tun", "befehlen", "ausführen", "und", "der", "König",
+]
+
+
+def make_sentence(translit, translation):
+    return Sentence(
+        hieroglyphs="", transliteration=translit, lemmatization="", upos="",
+        glossing="", translation=translation,
+        date_not_before=-2400, date_not_after=-2300,
+    )
+
+
+def reference_verdict(translit, translation):
+    """Original per-regex evaluation: (coherent, note)."""
+    lower = translation.lower()
+    for pattern, _ in RETROCAUSAL_PATTERNS:
+        if re.search(pattern, lower):
+            return False, f"Retrocausal pattern: {pattern}"
+    parts = [f"✓ {meaning}" for pattern, meaning in FORWARD_PATTERNS
+             if re.search(pattern, lower)]
+    markers = reference_find(translit.lower(), MARKER_TABLE)
+    if markers:
+        parts.append(f"Markers: {', '.join(m[0] for m in markers)}")
+    return True, "; ".join(parts) if parts else "No explicit markers"
+
+
+@pytest.fixture
+def sentences(texts):
+    rng = random.Random(44)
+    return [
+        make_sentence(t, " ".join(rng.choice(CAUSAL_WORDS) for _ in range(rng.randint(0, 8))))
+        for t in texts
+    ]
+
+
+class TestCausalPatterns:
+    """Test the compiled causal pattern set."""
+    
+    def test_pattern_ids(self):
+        """Retrocausal patterns come first, then forward ones."""
+        patterns = get_causal_patterns()
+        assert patterns.num_retrocausal == len(RETROCAUSAL_PATTERNS)
+        assert patterns.patterns == (
+            [p for p, _ in RETROCAUSAL_PATTERNS] + [p for p, _ in FORWARD_PATTERNS]
+        )
+    
+    def test_mask_matches_each_regex(self, sentences):
+        """The mask has a bit for exactly the patterns that search true."""
+        patterns = get_causal_patterns()
+        for sent in sentences:
+            text = sent.translation.lower()
+            expected = [i for i, p in enumerate(patterns.patterns) if re.search(p, text)]
+            assert patterns.ids(patterns.match_mask(text)) == expected
+    
+    def test_no_patterns(self):
+        """An empty set matches nothing."""
+        assert CausalPatternSet([], []).match_mask("alt begraben") == 0
+    
+    def test_single_matches_reference(self, sentences):
+        """test_causal_coherence keeps its verdicts and notes."""
+        for sent in sentences:
+            result = validation.test_causal_coherence(sent)
+            assert (result.coherent, result.note) == reference_verdict(
+                sent.transliteration, sent.translation
+            )
+
+
+class TestCoherenceBatch:
+    """Test batch causal-coherence testing."""
+    
+    def test_matches_single(self, sentences):
+        """Batch columns agree with per-sentence results."""
+        batch = validation.test_causal_coherence_batch(sentences, chunk_size=64)
+        assert len(batch) == len(sentences)
+        for i, sent in enumerate(sentences):
+            single = validation.test_causal_coherence(sent)
+            assert batch.coherent[i] == single.coherent
+            assert batch.marker_counts[i] == len(single.markers_found)
+            text = sent.translation.lower()
+            assert batch.matched_patterns(i) == [
+                p for p in batch.patterns.patterns if re.search(p, text)
+            ]
+    
+    def test_summary(self, sentences):
+        """Aggregate counts follow from the columns."""
+        batch = validation.test_causal_coherence_batch(sentences)
+        assert batch.num_coherent == sum(
+            validation.test_causal_coherence(s).coherent for s in sentences
+        )
+        assert batch.num_with_markers == sum(
+            bool(find_markers(s.transliteration)) for s in sentences
+        )
+        counts = batch.pattern_counts()
+        assert counts.sum() == sum(len(batch.matched(i)) for i in range(len(batch)))
+    
+    def test_process_pool(self, sentences):
+        """A process pool gives the same columns."""
+        serial = validation.test_causal_coherence_batch(sentences)
+        pooled = validation.test_causal_coherence_batch(sentences, workers=2, chunk_size=100)
+        np.testing.assert_array_equal(pooled.coherent, serial.coherent)
+        np.testing.assert_array_equal(pooled.pattern_masks, serial.pattern_masks)
+        np.testing.assert_array_equal(pooled.marker_counts, serial.marker_counts)
+    
+    def test_empty(self):
+        """No sentences, empty columns."""
+        batch = validation.test_causal_coherence_batch([])
+        assert len(batch) == 0
+        assert batch.num_coherent == 0
+
+
+# =============================================================================
+# OLDEST SENTENCES
+# =============================================================================
+
+class TestOldestSentences:
+    """Test oldest-sentence selection."""
+    
+    @pytest.fixture
+    def fake_corpus(self, monkeypatch):
+        from pathlib import Path
+        from eye_of_horus import corpus as corpus_module
+        rng = random.Random(45)
+        sentences = [make_sentence("jw", "") for _ in range(200)]
+        for sent in sentences:
+            sent.date_not_before = rng.randint(-2700, -2600)
+        default_path = Path(corpus_module.__file__).parent / 'data' / 'tla_earlier_egyptian.json'
+        monkeypatch.setattr(corpus_module, '_corpus', sentences)
+        monkeypatch.setattr(corpus_module, '_corpus_path', default_path)
+        monkeypatch.setattr(corpus_module, '_date_index', None)
+        return sentences
+    
+    def test_matches_full_sort(self, fake_corpus):
+        """Same sentences, same order, as a stable sort of the corpus."""
+        expected = sorted(fake_corpus, key=lambda s: s.date_not_before)
+        for n in (0, 1, 10, 100, 200, 500):
+            assert list(map(id, validation.oldest_sentences(n))) == list(map(id, expected[:n]))
+
+
+# =============================================================================
+# FULL-CORPUS VALIDATION
+# =============================================================================
+
+@pytest.fixture
+def dated_sentences(sentences):
+    rng = random.Random(46)
+    for sent in sentences:
+        sent.date_not_before = rng.choice([-2700, -2400, -2100, -1800, -1500])
+    return sentences
+
+
+class TestValidateCorpus:
+    """Test the sharded validation runner."""
+    
+    def test_columns_match_batch(self, dated_sentences):
+        """Sink columns equal the one-shot batch, in corpus order."""
+        sink = ColumnSink()
+        validation.validate_corpus(dated_sentences, sink=sink, shard_size=37)
+        batch = validation.test_causal_coherence_batch(dated_sentences)
+        np.testing.assert_array_equal(sink.columns['coherent'], batch.coherent)
+        np.testing.assert_array_equal(sink.columns['pattern_masks'], batch.pattern_masks)
+        np.testing.assert_array_equal(sink.columns['marker_counts'], batch.marker_counts)
+        assert sink.columns['period_codes'].tolist() == [
+            PERIODS.index(s.period) for s in dated_sentences
+        ]
+    
+    def test_summary(self, dated_sentences):
+        """Merged totals and per-period summaries match per-sentence tests."""
+        report = validation.validate_corpus(dated_sentences, shard_size=50)
+        tests = [validation.test_causal_coherence(s) for s in dated_sentences]
+        assert report.total == len(dated_sentences)
+        assert report.coherent == sum(t.coherent for t in tests)
+        assert report.incoherent == report.total - report.coherent
+        assert report.with_markers == sum(bool(t.markers_found) for t in tests)
+        assert report.oldest_date == -2700 and report.newest_date == -1500
+        for period, stats in report.periods.items():
+            rows = [t for t in tests if t.sentence.period == period]
+            assert stats['total'] == len(rows)
+            assert stats['coherent'] == sum(t.coherent for t in rows)
+        assert sum(p['total'] for p in report.periods.values()) == report.total
+    
+    def test_process_pool(self, dated_sentences):
+        """Sharding across processes gives the same report and columns."""
+        serial_sink, pooled_sink = ColumnSink(), ColumnSink()
+        serial = validation.validate_corpus(dated_sentences, sink=serial_sink, shard_size=64)
+        pooled = validation.validate_corpus(dated_sentences, workers=2, sink=pooled_sink, shard_size=64)
+        assert pooled.periods == serial.periods
+        np.testing.assert_array_equal(pooled.pattern_counts, serial.pattern_counts)
+        for name, column in serial_sink.columns.items():
+            np.testing.assert_array_equal(pooled_sink.columns[name], column)
+    
+    def test_timings(self, dated_sentences):
+        report = validation.validate_corpus(dated_sentences)
+        assert set(report.timings) == {'prepare', 'markers', 'patterns', 'merge', 'total'}
+        assert report.sentences_per_second > 0
+    
+    def test_shards_streamed(self, dated_sentences):
+        """The sink sees every shard once, then close."""
+        class Recorder:
+            def __init__(self):
+                self.sizes, self.closed = [], False
+            def write(self, shard):
+                assert isinstance(shard, ValidationShard)
+                self.sizes.append(len(shard))
+            def close(self):
+                self.closed = True
+        
+        recorder = Recorder()
+        validation.validate_corpus(dated_sentences, sink=recorder, shard_size=128)
+        assert sum(recorder.sizes) == len(dated_sentences)
+        assert max(recorder.sizes) <= 128 and recorder.closed
+    
+    def test_silent_without_reporter(self, dated_sentences, capsys):
+        validation.validate_corpus(dated_sentences)
+        assert capsys.readouterr().out == ""
+        validation.validate_corpus(dated_sentences, reporter=print_validation_report)
+        assert "DIRECTION VALIDATION SUMMARY" in capsys.readouterr().out
+    
+    def test_empty(self):
+        sink = ColumnSink()
+        report = validation.validate_corpus([], sink=sink)
+        assert report.total == 0 and report.passed
+        assert len(sink.columns['coherent']) == 0
+
+
+# =============================================================================
+# DIRECTION COMPARISON
+# =============================================================================
+
+class TestBigramModel:
+    """Test the phoneme bigram model."""
+    
+    def test_rows_normalised(self):
+        model = get_bigram_model()
+        assert model.log_probs.shape == (NUM_PHONEMES, NUM_PHONEMES)
+        np.testing.assert_allclose(np.exp(model.log_probs).sum(axis=1), 1.0)
+    
+    def test_score_matches_loop(self, sentences):
+        """Vectorized scores equal a per-sentence loop, both directions."""
+        model = get_bigram_model()
+        ids, offsets = encode_corpus([s.phonemes for s in sentences])
+        forward = model.score(ids, offsets)
+        reverse = model.score(ids, offsets, reverse=True)
+        for i, sent in enumerate(sentences):
+            seq = encode_phonemes(sent.phonemes).tolist()
+            back = seq[::-1]
+            assert forward[i] == pytest.approx(
+                sum(model.log_probs[a, b] for a, b in zip(seq, seq[1:])))
+            assert reverse[i] == pytest.approx(
+                sum(model.log_probs[a, b] for a, b in zip(back, back[1:])))
+    
+    def test_from_corpus(self):
+        """A corpus model prefers the transitions it was fitted on."""
+        ids, offsets = encode_corpus([["n", "w", "s"], ["n", "w"]])
+        model = BigramModel.from_corpus(ids, offsets)
+        n, w, s = encode_phonemes(["n", "w", "s"]).tolist()
+        assert model.log_probs[n, w] > model.log_probs[w, n]
+        # No transition across the sentence boundary (s → n)
+        assert model.log_probs[s, n] == model.log_probs[s, w]
+
+
+class TestCompareDirections:
+    """Test paired forward/reverse scoring."""
+    
+    def test_forward_matches_single_direction(self, sentences):
+        """The forward side reproduces the one-direction batch."""
+        comparison = compare_directions(sentences)
+        batch = validation.test_causal_coherence_batch(sentences)
+        np.testing.assert_array_equal(comparison.forward.coherent, batch.coherent)
+        np.testing.assert_array_equal(comparison.forward.pattern_masks, batch.pattern_masks)
+        np.testing.assert_array_equal(comparison.forward.marker_counts, batch.marker_counts)
+    
+    def test_reverse_reads_back_to_front(self, sentences):
+        """The reverse side mirrors marker hits and reverses word order."""
+        comparison = compare_directions(sentences)
+        patterns = get_causal_patterns()
+        for i, sent in enumerate(sentences):
+            translit = sent.transliteration.lower()
+            markers = find_markers(translit)
+            assert comparison.reverse.marker_counts[i] == len(markers)
+            if markers:
+                mirrored = [len(translit) - p - len(m) for m, _, p in markers]
+                expected = np.mean(mirrored) / len(translit)
+                assert comparison.reverse.marker_positions[i] == pytest.approx(expected)
+            else:
+                assert np.isnan(comparison.reverse.marker_positions[i])
+            words = " ".join(sent.translation.lower().split()[::-1])
+            assert comparison.reverse.pattern_masks[i] == patterns.match_mask(words)
+    
+    def test_non_palindromic_marker_both_ways(self):
+        """'jsk' is found in both readings, at mirrored positions."""
+        comparison = compare_directions([make_sentence("jsk nfr", "")])
+        assert comparison.forward.marker_counts[0] == 1
+        assert comparison.reverse.marker_counts[0] == 1
+        assert comparison.forward.marker_positions[0] == pytest.approx(0.0)
+        assert comparison.reverse.marker_positions[0] == pytest.approx(4 / 7)
+        assert comparison.marker_position_delta[0] == pytest.approx(-4 / 7)
+    
+    def test_mirrored_patterns(self):
+        """Reversing word order turns forward patterns retrocausal."""
+        sents = [make_sentence("jw", "alt und begraben"), make_sentence("jw", "krank dann gestorben")]
+        comparison = compare_directions(sents)
+        assert comparison.forward.coherent.all()
+        assert not comparison.reverse.coherent.any()
+        np.testing.assert_array_equal(comparison.forward_hits_delta, [1, 1])
+        np.testing.assert_array_equal(comparison.retrocausal_hits_delta, [-1, -1])
+    
+    def test_palindrome_has_no_delta(self):
+        """A phoneme palindrome scores the same both ways."""
+        comparison = compare_directions([make_sentence("nwn", "")])
+        assert comparison.log_likelihood_delta[0] == pytest.approx(0.0)
+    
+    def test_summary(self, sentences):
+        comparison = compare_directions(sentences)
+        summary = comparison.summary()
+        assert summary['total'] == len(sentences)
+        assert summary['forward']['coherent'] == comparison.forward.coherent.sum()
+        assert summary['prefer_forward'] + summary['prefer_reverse'] <= len(sentences)
+        delta = comparison.log_likelihood_delta
+        assert summary['prefer_forward'] == np.count_nonzero(delta[comparison.transitions > 0] > 0)
+    
+    def test_empty(self):
+        comparison = compare_directions([])
+        assert len(comparison) == 0
+        assert comparison.summary()['total'] == 0